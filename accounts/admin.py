@@ -1,3 +1,13 @@
 from django.contrib import admin
+from django.contrib.auth.admin import UserAdmin
+from django.contrib.auth.models import User
 
-# Register your models here.
+from .forms import AccountUserChangeForm
+
+
+class AccountUserAdmin(UserAdmin):
+    form = AccountUserChangeForm
+
+
+admin.site.unregister(User)
+admin.site.register(User, AccountUserAdmin)
@@ -0,0 +1,37 @@
+from django.contrib.auth.models import User
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from .TokenCache import TokenCache
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    `TokenAuthentication` that keeps resolved tokens in `TokenCache`, so a
+    request with a recently seen token runs no authentication query. On a
+    hit `request.user` is a `User` built from the cached fields, which can't
+    be saved or deleted since it lacks the password hash.
+
+    Deleting or replacing a token and saving or deleting its user drop the
+    cached entry (see `accounts.signals`). Writes that skip model signals,
+    such as queryset updates, are picked up when the entry expires.
+    """
+
+    def authenticate_credentials(self, key):
+        cached = TokenCache.get(key)
+        if cached is None:
+            user, token = super().authenticate_credentials(key)
+            TokenCache.set(token)
+            return user, token
+        if not cached['is_active']:
+            raise exceptions.AuthenticationFailed('User inactive or deleted.')
+        user = User(**cached)
+        user._state.adding = False
+        # Saving would write blanks over the fields that aren't cached.
+        user.save = user.delete = self.read_only
+        return user, Token(key=key, user=user)
+
+    @staticmethod
+    def read_only(*args, **kwargs):
+        raise NotImplementedError("Users from the token cache are read only; load the user to change it.")
@@ -0,0 +1,58 @@
+from django.conf import settings
+from django.core import signing
+
+from ..models import TokenEpoch
+
+
+class InvalidSignedToken(Exception):
+    pass
+
+
+class SignedToken(object):
+    """
+    Stateless tokens: the user id and revocation epoch (see `TokenEpoch`),
+    signed with an HMAC of `SECRET_KEY` and timestamped.
+
+    Access tokens expire after `AUTH_SIGNED_TOKEN_TTL` seconds and refresh
+    tokens after `AUTH_REFRESH_TOKEN_TTL`. The two are signed with different
+    salts, so neither is accepted in place of the other. Neither is accepted
+    unless `AUTH_TOKEN_MODE` is 'signed'.
+    """
+    ACCESS = 'accounts.access'
+    REFRESH = 'accounts.refresh'
+
+    @staticmethod
+    def enabled():
+        return getattr(settings, 'AUTH_TOKEN_MODE', 'db') == 'signed'
+
+    @staticmethod
+    def ttl(salt):
+        if salt == SignedToken.ACCESS:
+            return getattr(settings, 'AUTH_SIGNED_TOKEN_TTL', 15 * 60)
+        return getattr(settings, 'AUTH_REFRESH_TOKEN_TTL', 14 * 24 * 60 * 60)
+
+    @classmethod
+    def issue(cls, user):
+        """Return a new access and refresh token pair for `user`."""
+        payload = {'u': user.pk, 'e': TokenEpoch.current(user.pk)}
+        return {
+            'token': signing.dumps(payload, salt=cls.ACCESS),
+            'refresh': signing.dumps(payload, salt=cls.REFRESH),
+            'expires_in': cls.ttl(cls.ACCESS),
+        }
+
+    @classmethod
+    def verify(cls, token, salt=ACCESS):
+        """Return the user id `token` was issued to, or raise `InvalidSignedToken`."""
+        if not cls.enabled():
+            raise InvalidSignedToken('Signed tokens are not accepted.')
+        try:
+            payload = signing.loads(token, salt=salt, max_age=cls.ttl(salt))
+        except signing.SignatureExpired:
+            raise InvalidSignedToken('Token has expired.')
+        except signing.BadSignature:
+            raise InvalidSignedToken('Invalid token.')
+        epoch = TokenEpoch.current(payload['u'])
+        if epoch == TokenEpoch.REVOKED or payload['e'] != epoch:
+            raise InvalidSignedToken('Token has been revoked.')
+        return payload['u']
@@ -0,0 +1,25 @@
+from django.contrib.auth.models import User
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+from .SignedToken import InvalidSignedToken, SignedToken
+
+
+class SignedTokenAuthentication(TokenAuthentication):
+    """
+    Authenticate `Authorization: Bearer <token>` with a `SignedToken`
+    without touching the database.
+
+    `request.user` is a `User` carrying only its id, which is all the
+    contact apis need. Revocation and deactivation are picked up through
+    the user's `TokenEpoch`. Signed tokens are only accepted with
+    `AUTH_TOKEN_MODE = 'signed'`.
+    """
+    keyword = 'Bearer'
+
+    def authenticate_credentials(self, key):
+        try:
+            user_id = SignedToken.verify(key)
+        except InvalidSignedToken as e:
+            raise exceptions.AuthenticationFailed(str(e))
+        return User(pk=user_id), key
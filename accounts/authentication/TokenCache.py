@@ -0,0 +1,48 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+
+class TokenCache(object):
+    """
+    The users of tokens, in the Django cache named by
+    `settings.AUTH_TOKEN_CACHE`, for `AUTH_TOKEN_CACHE_TIMEOUT` seconds.
+    Entries are keyed by a hash of the token, so keys don't reveal it, and
+    hold the user's `fields`, leaving out its password hash.
+    """
+    fields = ('id', 'username', 'first_name', 'last_name', 'email', 'is_staff', 'is_active', 'is_superuser',
+              'date_joined')
+
+    @staticmethod
+    def cache():
+        return caches[getattr(settings, 'AUTH_TOKEN_CACHE', 'default')]
+
+    @staticmethod
+    def timeout():
+        return getattr(settings, 'AUTH_TOKEN_CACHE_TIMEOUT', 60)
+
+    @staticmethod
+    def cache_key(key):
+        return 'auth-token:%s' % hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def get(cls, key):
+        """Return the user fields cached for the token `key`, or None."""
+        return cls.cache().get(cls.cache_key(key))
+
+    @classmethod
+    def set(cls, token):
+        """Cache `token`, whose user must already be loaded."""
+        fields = dict((field, getattr(token.user, field)) for field in cls.fields)
+        cls.cache().set(cls.cache_key(token.key), fields, cls.timeout())
+
+    @classmethod
+    def invalidate(cls, *keys):
+        cache_keys = [cls.cache_key(key) for key in keys]
+        if not cache_keys:
+            return
+        cls.cache().delete_many(cache_keys)
+        # A request between now and the commit would cache the old rows again.
+        transaction.on_commit(lambda: cls.cache().delete_many(cache_keys))
@@ -0,0 +1,4 @@
+from .CachedTokenAuthentication import CachedTokenAuthentication
+from .SignedToken import InvalidSignedToken, SignedToken
+from .SignedTokenAuthentication import SignedTokenAuthentication
+from .TokenCache import TokenCache
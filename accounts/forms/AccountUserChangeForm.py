@@ -0,0 +1,18 @@
+from django.contrib.auth.forms import UserChangeForm
+from django.core.exceptions import ValidationError
+
+from ..models import AccountEmail
+
+
+class AccountUserChangeForm(UserChangeForm):
+    """
+    Admin change form refusing a new address another account already has.
+    An unchanged address is accepted, so accounts older than `AccountEmail`
+    that share one can still be edited.
+    """
+
+    def clean_email(self):
+        email = self.cleaned_data['email']
+        if 'email' in self.changed_data and email and AccountEmail.exists(email, exclude_user=self.instance):
+            raise ValidationError(AccountEmail.duplicate_error)
+        return email
@@ -0,0 +1 @@
+from .AccountUserChangeForm import AccountUserChangeForm
@@ -0,0 +1,81 @@
+import fcntl
+import os
+import random
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password
+from rest_framework import exceptions
+
+
+class PasswordVerifier(object):
+    """
+    Limit login password checks across all the worker processes of a
+    machine, sync or threaded: at most `AUTH_PASSWORD_WORKERS` checks run at
+    once, so a burst of logins can only take that many cores away from other
+    requests, and once `AUTH_PASSWORD_QUEUE` are running or waiting further
+    logins are turned away with a 429 instead of queueing.
+
+    The limits are slot files in `AUTH_PASSWORD_LOCK_DIR`, each held with an
+    `flock` while in use; the kernel frees them when their holder exits. With
+    no workers configured passwords are checked without a limit. Either way a
+    correct password stored under an outdated hasher or cost is rehashed with
+    the preferred one (see `PASSWORD_HASHERS`).
+    """
+
+    @staticmethod
+    def directory():
+        path = getattr(settings, 'AUTH_PASSWORD_LOCK_DIR', '/var/tmp/contactbook_password_slots')
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    @staticmethod
+    def lock(path, wait):
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if wait else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+        return fd
+
+    @classmethod
+    def take(cls, kind, count, wait_for=None):
+        """
+        Hold a free one of `count` slots of `kind` and return `(fd, number)`;
+        closing fd frees it. When all are taken return None, or with
+        `wait_for` wait for that slot.
+        """
+        paths = [os.path.join(cls.directory(), '%s-%d.lock' % (kind, number)) for number in range(count)]
+        start = random.randrange(count) if count else 0
+        for offset in range(count):
+            number = (start + offset) % count
+            fd = cls.lock(paths[number], False)
+            if fd is not None:
+                return fd, number
+        if wait_for is None:
+            return None
+        return cls.lock(paths[wait_for], True), wait_for
+
+    @classmethod
+    def check(cls, user, password):
+        workers = getattr(settings, 'AUTH_PASSWORD_WORKERS', 0)
+        if not workers:
+            return user.check_password(password)
+
+        queued = cls.take('queue', getattr(settings, 'AUTH_PASSWORD_QUEUE', 32))
+        if queued is None:
+            raise exceptions.Throttled(wait=1, detail='Too many logins in progress, try again shortly.')
+        outdated = []
+        try:
+            # Waiters spread over the worker slots by their queue slot.
+            running = cls.take('worker', workers, wait_for=queued[1] % workers)
+            try:
+                correct = check_password(password, user.password, outdated.append)
+            finally:
+                os.close(running[0])
+        finally:
+            os.close(queued[0])
+        if outdated:
+            user.set_password(password)
+            user.save(update_fields=['password'])
+        return correct
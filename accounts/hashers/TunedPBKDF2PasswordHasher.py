@@ -0,0 +1,17 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    Django's PBKDF2 hasher with its cost taken from
+    `settings.AUTH_PASSWORD_ITERATIONS`.
+
+    It keeps the `pbkdf2_sha256` algorithm name, so existing hashes verify
+    as before, and hashes stored with another iteration count are updated
+    the next time their user logs in.
+    """
+
+    @property
+    def iterations(self):
+        return getattr(settings, 'AUTH_PASSWORD_ITERATIONS', PBKDF2PasswordHasher.iterations)
@@ -0,0 +1,2 @@
+from .PasswordVerifier import PasswordVerifier
+from .TunedPBKDF2PasswordHasher import TunedPBKDF2PasswordHasher
@@ -0,0 +1,27 @@
+# Generated by Django 2.2.4 on 2026-10-18 12:47
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('auth', '0011_update_proxy_permissions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TokenEpoch',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='token_epoch', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('epoch', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'accounts_token_epochs',
+            },
+        ),
+    ]
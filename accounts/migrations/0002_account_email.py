@@ -0,0 +1,54 @@
+# Generated by Django 2.2.4 on 2026-10-18 12:49
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def normalize(email):
+    # A copy of AccountEmail.normalize as it was when this migration was written.
+    return (email or '').strip().lower()
+
+
+def backfill_emails(apps, schema_editor):
+    """
+    Index existing users' addresses. If several accounts share an address
+    only the oldest gets it, since the index is unique; the others can't log
+    in by email until it's changed.
+    """
+    User = apps.get_model('auth', 'User')
+    AccountEmail = apps.get_model('accounts', 'AccountEmail')
+    db = schema_editor.connection.alias
+    rows = User.objects.using(db).exclude(email='').order_by('id').values_list('id', 'email')
+    last = 0
+    while True:
+        batch = list(rows.filter(id__gt=last)[:2000])
+        if not batch:
+            break
+        # Rows go in by id, so an address already taken belongs to an older account.
+        AccountEmail.objects.using(db).bulk_create([
+            AccountEmail(user_id=user_id, email=normalize(email)) for user_id, email in batch
+        ], ignore_conflicts=True)
+        last = batch[-1][0]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0011_update_proxy_permissions'),
+        ('accounts', '0001_token_epoch'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccountEmail',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='account_email', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('email', models.CharField(max_length=254, unique=True)),
+            ],
+            options={
+                'db_table': 'accounts_emails',
+            },
+        ),
+        migrations.RunPython(backfill_emails, migrations.RunPython.noop),
+    ]
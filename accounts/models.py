@@ -1,3 +1,126 @@
-from django.db import models
+import logging
 
-# Create your models here.
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, models, transaction
+
+logger = logging.getLogger('accounts')
+
+
+class AccountEmail(models.Model):
+    """
+    Each user's email address, lowercased, under a unique index.
+
+    `auth_user.email` has no index, so login and registration look addresses
+    up here instead. Rows follow the user's email through `accounts.signals`,
+    and new accounts can't take an address another account has.
+    """
+    duplicate_error = "Email already registered."
+
+    user = models.OneToOneField(User, primary_key=True, related_name='account_email', on_delete=models.CASCADE)
+    email = models.CharField(max_length=254, unique=True)
+
+    class Meta:
+        db_table = 'accounts_emails'
+
+    def __str__(self):
+        return self.email
+
+    @staticmethod
+    def normalize(email):
+        return (email or '').strip().lower()
+
+    @classmethod
+    def exists(cls, email, exclude_user=None):
+        addresses = cls.objects.filter(email=cls.normalize(email))
+        if exclude_user is not None:
+            addresses = addresses.exclude(user=exclude_user)
+        return addresses.exists()
+
+    @classmethod
+    def check_available(cls, email, user=None):
+        """Raise `ValidationError` if an account other than `user` has the address."""
+        if cls.normalize(email) and cls.exists(email, exclude_user=user):
+            raise ValidationError({'email': [cls.duplicate_error]})
+
+    @classmethod
+    def sync(cls, user, created=False):
+        """
+        Store the user's current address, or drop the row if it's empty.
+        If another account has the address, e.g. one that only differs in
+        case from before this table existed, or one that won a signup race,
+        the user is left without a row and a warning is logged. Returns
+        whether the address was stored.
+        """
+        email = cls.normalize(user.email)
+        if not email:
+            if not created:
+                cls.objects.filter(user=user).delete()
+            return True
+        try:
+            with transaction.atomic():
+                if created or not cls.objects.filter(user=user).update(email=email):
+                    cls.objects.create(user=user, email=email)
+        except IntegrityError:
+            logger.warning("Email of user %s is used by another account, not indexing it.", user.pk)
+            if not created:
+                cls.objects.filter(user=user).delete()
+            return False
+        return True
+
+
+class TokenEpoch(models.Model):
+    """
+    Revocation epoch of a user's signed tokens.
+
+    Signed tokens carry the epoch they were issued under and are only
+    accepted while it's current, so bumping it revokes all of them at once.
+    Authentication reads the epoch from the `AUTH_TOKEN_CACHE`, where it's
+    kept for `AUTH_TOKEN_CACHE_TIMEOUT` seconds; active users without a row
+    are at 0. Users that are inactive or gone, whose row may have been
+    deleted with them, are at `REVOKED`, which no token carries.
+    """
+    REVOKED = -1
+
+    user = models.OneToOneField(User, primary_key=True, related_name='token_epoch', on_delete=models.CASCADE)
+    epoch = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = 'accounts_token_epochs'
+
+    def __str__(self):
+        return "%s (%s)" % (self.user_id, self.epoch)
+
+    @staticmethod
+    def cache():
+        return caches[getattr(settings, 'AUTH_TOKEN_CACHE', 'default')]
+
+    @staticmethod
+    def key(user_id):
+        return 'auth-token:epoch:%s' % user_id
+
+    @classmethod
+    def current(cls, user_id):
+        epoch = cls.cache().get(cls.key(user_id))
+        if epoch is None:
+            epochs = User.objects.filter(pk=user_id, is_active=True).values_list('token_epoch__epoch', flat=True)
+            epoch = next(iter(epochs[:1]), cls.REVOKED) or 0
+            cls.cache().set(cls.key(user_id), epoch, getattr(settings, 'AUTH_TOKEN_CACHE_TIMEOUT', 60))
+        return epoch
+
+    @classmethod
+    def bump(cls, user_id):
+        """Revoke every signed token issued to the user so far."""
+        updated = cls.objects.filter(user_id=user_id).update(epoch=models.F('epoch') + 1)
+        if not updated:
+            cls.objects.get_or_create(user_id=user_id, defaults={'epoch': 1})
+        cls.invalidate(user_id)
+
+    @classmethod
+    def invalidate(cls, user_id):
+        """Drop the cached epoch, e.g. after the user was saved or deleted."""
+        cls.cache().delete(cls.key(user_id))
+        # A request between now and the commit would cache the old epoch again.
+        transaction.on_commit(lambda: cls.cache().delete(cls.key(user_id)))
@@ -1,6 +1,9 @@
 from django.contrib.auth.models import User
 from rest_framework import serializers
 
+from ..hashers import PasswordVerifier
+from ..models import AccountEmail
+
 
 class LoginSerializer(serializers.ModelSerializer):
     email = serializers.EmailField(
@@ -12,8 +15,8 @@ class LoginSerializer(serializers.ModelSerializer):
         validation_error = {}
         user = None
         try:
-            user = User.objects.get(email=validated_data.get('email'))
-            pw_check = user.check_password(validated_data.get('password'))
+            user = User.objects.get(account_email__email=AccountEmail.normalize(validated_data.get('email')))
+            pw_check = PasswordVerifier.check(user, validated_data.get('password'))
             if not pw_check:
                 validation_error['email'] = [" Email and password doesn't match. "]
         except User.DoesNotExist as e:
@@ -1,18 +1,33 @@
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import transaction
 from rest_framework import serializers
-from rest_framework.validators import UniqueValidator
+
+from ..models import AccountEmail
 
 
 class RegisterSerializer(serializers.ModelSerializer):
     email = serializers.EmailField(
-        required=True,
-        validators=[UniqueValidator(queryset=User.objects.all(), message="Email already registered.")]
+        required=True
     )
     password = serializers.CharField(min_length=8, write_only=True)
+    duplicate_error = AccountEmail.duplicate_error
+
+    def validate_email(self, value):
+        if AccountEmail.exists(value):
+            raise serializers.ValidationError(self.duplicate_error)
+        return value
 
     def create(self, validated_data):
-        user = User.objects.create_user(validated_data['email'], validated_data['email'],
-                                        validated_data['password'])
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(validated_data['email'], validated_data['email'],
+                                                validated_data['password'])
+                # A signup racing this one for the same address got it first on the AccountEmail unique index.
+                if not AccountEmail.objects.filter(user=user).exists():
+                    raise ValidationError(self.duplicate_error)
+        except ValidationError:
+            raise serializers.ValidationError({'email': [self.duplicate_error]})
         return user
 
     class Meta:
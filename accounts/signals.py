@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .authentication import TokenCache
+from .models import AccountEmail
+from .models import TokenEpoch
+
+
+@receiver([post_save, post_delete], sender=Token)
+def token_changed(sender, instance, **kwargs):
+    TokenCache.invalidate(instance.key)
+
+
+@receiver(pre_save, sender=settings.AUTH_USER_MODEL)
+def user_saving(sender, instance, **kwargs):
+    # Every way of creating a user (the api, the admin, createsuperuser) goes through here.
+    if instance._state.adding:
+        AccountEmail.check_available(instance.email)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def user_saved(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields is None or 'email' in update_fields:
+        AccountEmail.sync(instance, created)
+    # The cached epoch reflects whether the user is active.
+    TokenEpoch.invalidate(instance.pk)
+    # Cached tokens carry a copy of the user, e.g. whether it's still active.
+    if not created:
+        TokenCache.invalidate(*Token.objects.filter(user=instance).values_list('key', flat=True))
+        # Signed tokens aren't looked up at all, so revoke them.
+        if not instance.is_active:
+            TokenEpoch.bump(instance.pk)
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def user_deleted(sender, instance, **kwargs):
+    # The epoch row goes with the user; reading it again finds the user gone and their signed tokens revoked.
+    TokenEpoch.invalidate(instance.pk)
@@ -1 +1,3 @@
+from .authentication import *
+from .models import *
 from .views import *
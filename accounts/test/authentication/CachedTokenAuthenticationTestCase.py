@@ -0,0 +1,71 @@
+from django.contrib.auth.models import User
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+from faker import Faker
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.request import Request
+
+from ...authentication import CachedTokenAuthentication
+from ...authentication import TokenCache
+
+
+class CachedTokenAuthenticationTestCase(TestCase):
+    def setUp(self):
+        TokenCache.cache().clear()
+        fake = Faker()
+        email = fake.email()
+        self.password = 'testpassword'
+        self.user = User.objects.create_user(email, email, self.password)
+        self.token = Token.objects.create(user=self.user)
+        self.key = self.token.key
+        self.list_url = reverse('contact-list')
+
+    def get(self, key=None, queries=None):
+        headers = {'HTTP_AUTHORIZATION': 'Token ' + (key or self.key)}
+        if queries is None:
+            return self.client.get(self.list_url, {'fields': 'id', 'expand': ''}, **headers)
+        with self.assertNumQueries(queries):
+            return self.client.get(self.list_url, {'fields': 'id', 'expand': ''}, **headers)
+
+    def test_token_is_cached(self):
+        self.assertEqual(self.get().status_code, status.HTTP_200_OK)
+        # Not the user's password hash.
+        self.assertEqual(TokenCache.get(self.key)['id'], self.user.pk)
+        self.assertNotIn('password', TokenCache.get(self.key))
+        # The list page is cached as well, so nothing reaches the database.
+        self.assertEqual(self.get(queries=0).status_code, status.HTTP_200_OK)
+
+    def test_cached_user(self):
+        self.user.is_staff = True
+        self.user.save()
+        self.get()
+        request = Request(RequestFactory().get(self.list_url, HTTP_AUTHORIZATION='Token ' + self.key),
+                          authenticators=[CachedTokenAuthentication()])
+        with self.assertNumQueries(0):
+            self.assertEqual((request.user.pk, request.user.email, request.user.username, request.user.is_staff),
+                             (self.user.pk, self.user.email, self.user.username, True))
+        with self.assertRaises(NotImplementedError):
+            request.user.save()
+
+    def test_invalid_token(self):
+        self.assertEqual(self.get('0' * 40).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIsNone(TokenCache.get('0' * 40))
+
+    def test_deleted_token(self):
+        self.get()
+        self.token.delete()
+        self.assertEqual(self.get().status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_rotated_token(self):
+        self.get()
+        self.token.delete()
+        token = Token.objects.create(user=self.user)
+        self.assertEqual(self.get().status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.get(token.key).status_code, status.HTTP_200_OK)
+
+    def test_deactivated_user(self):
+        self.get()
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.get().status_code, status.HTTP_401_UNAUTHORIZED)
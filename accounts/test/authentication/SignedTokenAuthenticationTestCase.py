@@ -0,0 +1,95 @@
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from faker import Faker
+from rest_framework import status
+
+from ...authentication import SignedToken, TokenCache
+
+
+@override_settings(AUTH_TOKEN_MODE='signed')
+class SignedTokenAuthenticationTestCase(TestCase):
+    def setUp(self):
+        TokenCache.cache().clear()
+        fake = Faker()
+        self.email = fake.email()
+        self.password = 'testpassword'
+        self.user = User.objects.create_user(self.email, self.email, self.password)
+        self.autocomplete_url = reverse('contact-autocomplete')
+        self.tokens = self.login()
+
+    def login(self):
+        response = self.client.post(reverse('account-signin'), {'email': self.email, 'password': self.password},
+                                    format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def get(self, token):
+        return self.client.get(self.autocomplete_url, {'q': 'a'}, HTTP_AUTHORIZATION='Bearer ' + token)
+
+    def test_login_and_register_issue_signed_tokens(self):
+        self.assertEqual(set(self.tokens), {'email', 'token', 'refresh', 'expires_in'})
+        response = self.client.post(reverse('account-register'), {'email': 'ada@example.com',
+                                                                   'password': self.password}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.get(response.json()['token']).status_code, status.HTTP_200_OK)
+
+    def test_requests_skip_database(self):
+        self.get(self.tokens['token'])
+        with self.assertNumQueries(0):
+            response = self.get(self.tokens['token'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_invalid_tokens(self):
+        token = self.tokens['token']
+        self.assertEqual(self.get(token[:-1] + ('A' if token[-1] != 'A' else 'B')).status_code,
+                         status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.get(self.tokens['refresh']).status_code, status.HTTP_401_UNAUTHORIZED)
+        with self.settings(AUTH_SIGNED_TOKEN_TTL=-1):
+            self.assertEqual(self.get(token).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refresh(self):
+        url = reverse('account-token-refresh')
+        response = self.client.post(url, {'refresh': self.tokens['refresh']}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get(response.json()['token']).status_code, status.HTTP_200_OK)
+        response = self.client.post(url, {'refresh': self.tokens['token']}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_revoke(self):
+        response = self.client.post(reverse('account-token-revoke'),
+                                    HTTP_AUTHORIZATION='Bearer ' + self.tokens['token'])
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.get(self.tokens['token']).status_code, status.HTTP_401_UNAUTHORIZED)
+        response = self.client.post(reverse('account-token-refresh'), {'refresh': self.tokens['refresh']},
+                                    format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.get(self.login()['token']).status_code, status.HTTP_200_OK)
+
+    def test_deactivated_user(self):
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.get(self.tokens['token']).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deleted_user(self):
+        self.get(self.tokens['token'])
+        self.user.delete()
+        self.assertEqual(self.get(self.tokens['token']).status_code, status.HTTP_401_UNAUTHORIZED)
+        # Without the signal, e.g. once the cached epoch expired.
+        TokenCache.cache().clear()
+        self.assertEqual(self.get(self.tokens['token']).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refused_in_db_mode(self):
+        with self.settings(AUTH_TOKEN_MODE='db'):
+            self.assertEqual(self.get(self.tokens['token']).status_code, status.HTTP_401_UNAUTHORIZED)
+            response = self.client.post(reverse('account-token-refresh'), {'refresh': self.tokens['refresh']},
+                                        format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_db_tokens_stay_default(self):
+        with self.settings(AUTH_TOKEN_MODE='db'):
+            self.assertFalse(SignedToken.enabled())
+            token = self.login()['token']
+        self.assertEqual(len(token), 40)
+        response = self.client.get(self.autocomplete_url, {'q': 'a'}, HTTP_AUTHORIZATION='Token ' + token)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,2 @@
+from .CachedTokenAuthenticationTestCase import CachedTokenAuthenticationTestCase
+from .SignedTokenAuthenticationTestCase import SignedTokenAuthenticationTestCase
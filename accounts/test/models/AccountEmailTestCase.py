@@ -0,0 +1,46 @@
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from ...forms import AccountUserChangeForm
+from ...models import AccountEmail
+from ...models import TokenEpoch
+
+
+class AccountEmailTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('ada@example.com', 'ada@example.com', 'testpassword')
+        # An account from before AccountEmail, whose address only differs in case; the backfill skipped it.
+        self.legacy = User.objects.create_user('legacy@example.com', 'legacy@example.com', 'testpassword')
+        User.objects.filter(pk=self.legacy.pk).update(email='Ada@example.com')
+        AccountEmail.objects.filter(user=self.legacy).delete()
+        self.legacy.refresh_from_db()
+
+    def test_saving_a_user_sharing_an_address(self):
+        self.legacy.is_active = False
+        with self.assertLogs('accounts', 'WARNING'):
+            self.legacy.save()
+        self.assertFalse(AccountEmail.objects.filter(user=self.legacy).exists())
+        self.assertEqual(AccountEmail.objects.get(user=self.user).email, 'ada@example.com')
+        # The deactivation still revoked the signed tokens.
+        self.assertEqual(TokenEpoch.objects.get(user=self.legacy).epoch, 1)
+
+    def test_new_user_with_a_taken_address(self):
+        with self.assertRaises(ValidationError):
+            User.objects.create_user('ada2', 'ADA@example.com', 'testpassword')
+        self.assertFalse(User.objects.filter(username='ada2').exists())
+
+    def test_createsuperuser_with_a_taken_address(self):
+        with self.assertRaisesMessage(CommandError, AccountEmail.duplicate_error):
+            call_command('createsuperuser', interactive=False, username='admin', email='ADA@example.com',
+                         verbosity=0)
+
+    def test_admin_form(self):
+        form = AccountUserChangeForm({'email': 'ADA@example.com'}, instance=User.objects.create_user('grace'))
+        form.is_valid()
+        self.assertEqual(form.errors['email'], [AccountEmail.duplicate_error])
+        # The legacy account keeps its address when it's edited.
+        form = AccountUserChangeForm({'email': self.legacy.email}, instance=self.legacy)
+        form.is_valid()
+        self.assertNotIn('email', form.errors)
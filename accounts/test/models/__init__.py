@@ -0,0 +1 @@
+from .AccountEmailTestCase import AccountEmailTestCase
@@ -1,9 +1,16 @@
+import os
+import shutil
+import tempfile
+
+from django.conf import settings
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from faker import Faker
 from rest_framework import status
 
+from ...hashers import PasswordVerifier
+
 
 class LoginTestCase(TestCase):
     def setUp(self):
@@ -75,3 +82,76 @@ class LoginTestCase(TestCase):
 
         response = self.client.post(self.login_url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_signin_ignores_email_case(self):
+        data = {
+            'email': self.test_email.upper(),
+            'password': self.password
+        }
+
+        response = self.client.post(self.login_url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_signin_after_email_change(self):
+        self.test_user.email = 'changed@example.com'
+        self.test_user.save()
+        data = {
+            'email': 'changed@example.com',
+            'password': self.password
+        }
+
+        response = self.client.post(self.login_url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data['email'] = self.test_email
+        response = self.client.post(self.login_url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_signin_rehashes_outdated_password(self):
+        with self.settings(AUTH_PASSWORD_ITERATIONS=1000):
+            self.test_user.set_password(self.password)
+            self.test_user.save()
+        self.assertIn('$1000$', self.test_user.password)
+        data = {
+            'email': self.test_email,
+            'password': self.password
+        }
+
+        for workers in (0, 2):
+            with self.settings(AUTH_PASSWORD_ITERATIONS=1000 + workers, AUTH_PASSWORD_WORKERS=workers):
+                response = self.client.post(self.login_url, data, format='json')
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.test_user.refresh_from_db()
+                self.assertIn('$%d$' % (1000 + workers), self.test_user.password)
+
+    @override_settings(AUTH_PASSWORD_WORKERS=2)
+    def test_signin_with_password_workers(self):
+        data = {
+            'email': self.test_email,
+            'password': self.password
+        }
+
+        response = self.client.post(self.login_url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data['password'] = 'wrongpassword'
+        response = self.client.post(self.login_url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        with self.settings(AUTH_PASSWORD_QUEUE=0):
+            response = self.client.post(self.login_url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response['Retry-After'], '1')
+
+    @override_settings(AUTH_PASSWORD_WORKERS=1, AUTH_PASSWORD_QUEUE=1)
+    def test_password_slots_are_shared(self):
+        data = {
+            'email': self.test_email,
+            'password': self.password
+        }
+        with self.settings(AUTH_PASSWORD_LOCK_DIR=tempfile.mkdtemp()):
+            self.addCleanup(shutil.rmtree, settings.AUTH_PASSWORD_LOCK_DIR)
+            # Held by another process or thread: the lock is on the file, not on this process.
+            fd, number = PasswordVerifier.take('queue', 1)
+            response = self.client.post(self.login_url, data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+            os.close(fd)
+            response = self.client.post(self.login_url, data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
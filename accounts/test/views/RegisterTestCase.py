@@ -1,8 +1,13 @@
+from unittest import mock
+
 from django.contrib.auth.models import User
 from django.test import TestCase
 from django.urls import reverse
 from faker import Faker
-from rest_framework import status
+from rest_framework import serializers, status
+
+from ...models import AccountEmail
+from ...serializers import RegisterSerializer
 
 
 class RegisterTestCase(TestCase):
@@ -115,3 +120,21 @@ class RegisterTestCase(TestCase):
 
         response = self.client.post(self.create_url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_user_with_preexisting_email_in_other_case(self):
+        data = {
+            'email': self.test_email.upper(),
+            'password': self.password
+        }
+
+        response = self.client.post(self.create_url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['email'], ["Email already registered."])
+
+    def test_create_user_racing_for_email(self):
+        # The other signup's row appeared after this one was checked.
+        AccountEmail.objects.filter(user=self.test_user).update(email='race@example.com')
+        data = {'email': 'Race@example.com', 'password': self.password}
+        with mock.patch.object(AccountEmail, 'check_available'), self.assertRaises(serializers.ValidationError):
+            RegisterSerializer().create(data)
+        self.assertFalse(User.objects.filter(email='Race@example.com').exists())
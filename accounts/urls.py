@@ -2,8 +2,12 @@ from django.conf.urls import url
 
 from .views import LoginView
 from .views import RegisterView
+from .views import TokenRefreshView
+from .views import TokenRevokeView
 
 urlpatterns = [
     url(r'register/$', RegisterView.as_view(), name='account-register'),
     url(r'login/$', LoginView.as_view(), name='account-signin'),
+    url(r'token/refresh/$', TokenRefreshView.as_view(), name='account-token-refresh'),
+    url(r'token/revoke/$', TokenRevokeView.as_view(), name='account-token-revoke'),
 ]
@@ -3,6 +3,7 @@ from rest_framework.authtoken.models import Token
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from ..authentication import SignedToken
 from ..serializers import LoginSerializer
 
 
@@ -16,9 +17,12 @@ class LoginView(APIView):
         if serializer.is_valid():
             user = serializer.save()
             if user:
-                token, created = Token.objects.get_or_create(user=user)
                 json = serializer.data
-                json['token'] = token.key
+                if SignedToken.enabled():
+                    json.update(SignedToken.issue(user))
+                else:
+                    token, created = Token.objects.get_or_create(user=user)
+                    json['token'] = token.key
                 return Response(json, status=status.HTTP_200_OK)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
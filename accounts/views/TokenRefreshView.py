@@ -0,0 +1,23 @@
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ..authentication import InvalidSignedToken, SignedToken
+
+
+class TokenRefreshView(APIView):
+    """
+    Exchange a signed refresh token for a new access and refresh token pair.
+    """
+
+    def post(self, request, format='json'):
+        try:
+            user_id = SignedToken.verify(str(request.data.get('refresh', '')), SignedToken.REFRESH)
+        except InvalidSignedToken as e:
+            return Response({'refresh': [str(e)]}, status=status.HTTP_400_BAD_REQUEST)
+        # Refreshes are rare enough to check the account itself.
+        user = User.objects.filter(pk=user_id, is_active=True).first()
+        if user is None:
+            return Response({'refresh': ['Invalid token.']}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(SignedToken.issue(user), status=status.HTTP_200_OK)
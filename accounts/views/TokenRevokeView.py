@@ -0,0 +1,20 @@
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ..models import TokenEpoch
+
+
+class TokenRevokeView(APIView):
+    """
+    Sign the user out everywhere: revoke all their signed tokens and delete
+    their api token.
+    """
+    permission_classes = (IsAuthenticated,)
+
+    def post(self, request, format='json'):
+        TokenEpoch.bump(request.user.pk)
+        Token.objects.filter(user_id=request.user.pk).delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -1,2 +1,4 @@
 from .LoginView import LoginView
 from .RegisterView import RegisterView
+from .TokenRefreshView import TokenRefreshView
+from .TokenRevokeView import TokenRevokeView
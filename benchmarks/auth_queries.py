@@ -0,0 +1,59 @@
+"""
+Count the queries and time per request on the contact endpoints with DRF's
+`TokenAuthentication` against `CachedTokenAuthentication`, which should
+save the token lookup on every request after the first. The list page
+cache is off and retrieve asks for a sparse fieldset, so the views still
+run their own queries.
+
+    python -m benchmarks.auth_queries --contacts 10000
+"""
+import argparse
+
+from .utils import api_client, create_user, measure, report, seed_contacts, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--contacts', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from rest_framework.authentication import TokenAuthentication
+    from rest_framework.views import APIView
+
+    from accounts.authentication import CachedTokenAuthentication
+    from contact.models import Contact
+    from contact.views import ContactListView
+
+    user = create_user()
+    seed_contacts(user, args.contacts)
+    client = api_client(user)
+    pk = Contact.objects.filter(user=user).order_by('id').values_list('id', flat=True)[args.contacts // 2]
+    # Single digit ids only match the retrieve url, see contact/urls.py.
+    retrieve = '/contact/%d' % min(pk, 9)
+    ContactListView.page_cache.max_bytes = 0
+    endpoints = [
+        ('list', lambda: client.get('/contact', {'page': 1})),
+        ('list, sparse', lambda: client.get('/contact', {'page': 1, 'fields': 'id,first_name', 'expand': ''})),
+        ('search', lambda: client.get('/contact', {'q': 'First%d' % pk})),
+        ('retrieve', lambda: client.get(retrieve, {'fields': 'id,first_name', 'expand': 'phone_numbers'})),
+        ('autocomplete', lambda: client.get('/contact/autocomplete', {'q': 'fir'})),
+    ]
+
+    print('%d contacts' % args.contacts)
+    for authentication in (TokenAuthentication, CachedTokenAuthentication):
+        APIView.authentication_classes = [authentication]
+        print(authentication.__name__)
+        for label, request in endpoints:
+            request()
+            with CaptureQueriesContext(connection) as queries:
+                response = request()
+            assert response.status_code == 200, response.status_code
+            report('%-14s %2d queries' % (label, len(queries)), measure(request, args.repeat))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Compare autocomplete lookups through the in-memory prefix index with a
+`LIKE 'abc%'` query per keystroke, and time building a user's index.
+
+    python -m benchmarks.autocomplete --contacts 100000
+"""
+import argparse
+import time
+
+from .utils import create_user, measure, report, seed_contacts, setup_django
+
+PREFIXES = ('f', 'first1', 'first1234', 'nick9')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--contacts', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db.models import Q
+
+    from contact.models import Contact
+    from contact.search import ContactAutocomplete
+
+    user = create_user()
+    seed_contacts(user, args.contacts, with_children=False)
+
+    started = time.perf_counter()
+    ContactAutocomplete.suggest(user, 'x')
+    print('%d contacts, index built in %.1f ms' % (args.contacts, (time.perf_counter() - started) * 1000))
+
+    def like(prefix):
+        condition = Q(first_name__istartswith=prefix) | Q(last_name__istartswith=prefix) | Q(
+            nickname__istartswith=prefix)
+        list(Contact.objects.filter(user=user).filter(condition).values_list(
+            'id', 'first_name', 'last_name', 'nickname')[:10])
+
+    for prefix in PREFIXES:
+        report('LIKE   %r' % prefix, measure(lambda: like(prefix), args.repeat))
+        report('index  %r' % prefix, measure(lambda: ContactAutocomplete.suggest(user, prefix), args.repeat))
+
+
+if __name__ == '__main__':
+    main()
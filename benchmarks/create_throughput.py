@@ -0,0 +1,49 @@
+"""
+Measure contact creates per second through `POST /contact/create` as the
+book grows.
+
+    python -m benchmarks.create_throughput --sizes 1000,10000,100000 --creates 300
+"""
+import argparse
+import time
+
+from .utils import api_client, create_user, seed_contacts, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', default='1000,10000,100000')
+    parser.add_argument('--creates', type=int, default=300)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db import connection
+
+    # Like the deployment: commits don't wait for readers.
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA journal_mode=WAL')
+    user = create_user()
+    client = api_client(user)
+    seeded = 0
+    for size in sorted(int(size) for size in args.sizes.split(',')):
+        seed_contacts(user, size - seeded)
+        seeded = size
+        started = time.perf_counter()
+        for number in range(args.creates):
+            response = client.post('/contact/create', {
+                'first_name': 'Bench', 'last_name': 'Create', 'phone_number': '+1 555 %07d' % number,
+                'phone_number_type': 'mobile', 'email_type': 'work',
+                'email_address': 'create%d-%d@example.com' % (size, number),
+            }, format='json')
+            assert response.status_code == 201, response.content
+        elapsed = time.perf_counter() - started
+        seeded += args.creates
+        print('%-40s %8.1f creates/s' % ('%d contacts' % size, args.creates / elapsed))
+        # A duplicate is refused, by the database when there's no check in front of it.
+        response = client.post('/contact/create', {'first_name': 'Bench', 'last_name': 'Create', 'email_type': 'work',
+                                                   'email_address': 'create%d-0@example.com' % size}, format='json')
+        assert response.status_code == 400, response.status_code
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Stream a large address book through the export endpoint and report
+throughput and peak RSS.
+
+    python -m benchmarks.export_memory --contacts 1000000 --output ndjson
+
+Peak RSS is reset after seeding (Linux `clear_refs`), so the reported peak
+covers only the export.
+"""
+import argparse
+import gc
+import time
+
+from .utils import api_client, create_user, seed_contacts, setup_django
+
+
+def read_status(field):
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def reset_peak_rss():
+    try:
+        with open('/proc/self/clear_refs', 'w') as clear_refs:
+            clear_refs.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--contacts', type=int, default=1000000)
+    parser.add_argument('--output', choices=('ndjson', 'csv'), default='ndjson')
+    parser.add_argument('--db', help="Reuse a seeded database file instead of creating one.")
+    args = parser.parse_args()
+
+    setup_django(args.db)
+    from django.contrib.auth.models import User
+    user = User.objects.filter(email='bench@example.com').first()
+    if user is None:
+        user = create_user()
+        started = time.perf_counter()
+        seed_contacts(user, args.contacts)
+        print('seeded %d contacts in %.1f s' % (args.contacts, time.perf_counter() - started))
+    client = api_client(user)
+
+    gc.collect()
+    baseline = read_status('VmRSS')
+    if not reset_peak_rss():
+        print('could not reset the peak RSS; the peak below includes seeding')
+
+    started = time.perf_counter()
+    response = client.get('/contact/export', {'output': args.output})
+    size = 0
+    for chunk in response.streaming_content:
+        size += len(chunk)
+    elapsed = time.perf_counter() - started
+
+    print('exported %.1f MB of %s in %.1f s (%.0f contacts/s)' % (
+        size / 1048576.0, args.output, elapsed, args.contacts / elapsed))
+    print('RSS before export %.1f MB, peak during export %.1f MB' % (baseline, read_status('VmHWM')))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Measure bulk import throughput through the import endpoint.
+
+    python -m benchmarks.import_throughput --contacts 50000 --input csv
+"""
+import argparse
+import io
+import time
+
+from .utils import api_client, create_user, setup_django
+
+
+def csv_content(count):
+    lines = ["first_name,last_name,company,phone_number,phone_number_type,email_address,email_type"]
+    for index in range(count):
+        lines.append("First%d,Last%d,Company %d,+1 555 %07d,mobile,contact%d@example.com,work" % (
+            index, index, index % 100, index, index))
+    return "\r\n".join(lines) + "\r\n"
+
+
+def vcard_content(count):
+    cards = []
+    for index in range(count):
+        cards.append(
+            "BEGIN:VCARD\r\nVERSION:3.0\r\nN:Last%d;First%d;;;\r\nORG:Company %d\r\n"
+            "TEL;TYPE=CELL:+1 555 %07d\r\nEMAIL;TYPE=WORK:contact%d@example.com\r\nEND:VCARD\r\n" % (
+                index, index, index % 100, index, index))
+    return "".join(cards)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--contacts', type=int, default=50000)
+    parser.add_argument('--input', choices=('csv', 'vcard'), default='csv')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.core.files.uploadedfile import SimpleUploadedFile
+
+    from contact.importers import ContactImporter, CsvParser, VCardParser
+
+    user = create_user()
+    client = api_client(user)
+    content = (csv_content if args.input == 'csv' else vcard_content)(args.contacts).encode('utf-8')
+    upload = SimpleUploadedFile('contacts.%s' % ('csv' if args.input == 'csv' else 'vcf'), content)
+
+    started = time.perf_counter()
+    response = client.post('/contact/import', {'file': upload})
+    elapsed = time.perf_counter() - started
+    report = response.json()
+    print('endpoint: imported %d %s contacts (%d errors) in %.2f s: %.0f contacts/s' % (
+        report['imported'], args.input, len(report['errors']), elapsed, report['imported'] / elapsed))
+
+    # The same import without the multipart upload, into a fresh book.
+    other_user = create_user('bench2@example.com')
+    stream = io.StringIO(content.decode('utf-8'), newline='')
+    started = time.perf_counter()
+    report = ContactImporter(other_user).run((CsvParser if args.input == 'csv' else VCardParser)(stream))
+    elapsed = time.perf_counter() - started
+    print('importer: imported %d %s contacts (%d errors) in %.2f s: %.0f contacts/s' % (
+        report['imported'], args.input, len(report['errors']), elapsed, report['imported'] / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Compare page-number (OFFSET) and cursor (keyset) pagination latency on
+`ContactListView` for a shallow and a deep page, with the page cache off,
+and a repeated page served from the page cache.
+
+    python -m benchmarks.list_pagination --contacts 50000 --page 5000
+"""
+import argparse
+
+from .utils import api_client, create_user, measure, report, seed_contacts, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--contacts', type=int, default=50000)
+    parser.add_argument('--page', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    from contact.models import Contact
+    from contact.pagination import CursorPaginator
+    from contact.views import ContactListView
+
+    user = create_user()
+    seed_contacts(user, args.contacts)
+    client = api_client(user)
+    deep_page = min(args.page, -(-args.contacts // ContactListView.page_size))
+
+    # The cursor for page N encodes the last id of page N - 1.
+    ids = list(Contact.objects.filter(user=user).order_by('id').values_list('id', flat=True))
+    deep_cursor = CursorPaginator.encode_cursor(ids[(deep_page - 1) * ContactListView.page_size - 1])
+
+    print('%d contacts, page size %d' % (args.contacts, ContactListView.page_size))
+    max_bytes = ContactListView.page_cache.max_bytes
+    ContactListView.page_cache.max_bytes = 0
+    report('page mode, page 1', measure(lambda: client.get('/contact', {'page': 1}), args.repeat))
+    report('page mode, page %d' % deep_page, measure(lambda: client.get('/contact', {'page': deep_page}), args.repeat))
+    report('cursor mode, page 1', measure(lambda: client.get('/contact', {'cursor': ''}), args.repeat))
+    report('cursor mode, page %d' % deep_page,
+           measure(lambda: client.get('/contact', {'cursor': deep_cursor}), args.repeat))
+    ContactListView.page_cache.max_bytes = max_bytes
+    report('page mode, page 1, cached', measure(lambda: client.get('/contact', {'page': 1}), args.repeat))
+    print('page cache: %(hits)d hits, %(misses)d misses, %(bytes)d bytes' % ContactListView.page_cache.stats())
+
+
+if __name__ == '__main__':
+    main()
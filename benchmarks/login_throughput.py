@@ -0,0 +1,81 @@
+"""
+Measure login throughput at a few PBKDF2 costs, then run a login storm and
+time contact list reads during it, with passwords checked in the request
+threads without and with the `PasswordVerifier` limits.
+
+    python -m benchmarks.login_throughput --iterations 150000,60000 --threads 16
+"""
+import argparse
+import threading
+import time
+
+from .utils import api_client, create_user, measure, report, seed_contacts, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--iterations', default='150000,60000')
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--queue', type=int, default=2)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import override_settings
+
+    from contact.views import ContactListView
+
+    user = create_user()
+    seed_contacts(user, 1000)
+    client = api_client(user)
+    ContactListView.page_cache.max_bytes = 0
+    credentials = {'email': user.email, 'password': 'benchpassword'}
+
+    def login(login_client):
+        return login_client.post('/user/login/', credentials, content_type='application/json').status_code
+
+    for iterations in [int(count) for count in args.iterations.split(',')]:
+        with override_settings(AUTH_PASSWORD_ITERATIONS=iterations):
+            # The first login rehashes the password to the new cost.
+            login(Client())
+            timings = measure(lambda: login(Client()), args.repeat)
+        report('login, %d iterations' % iterations, timings)
+        print('%-40s %8.1f logins/s' % ('', 1000 / (sum(timings) / len(timings))))
+
+    report('list, idle', measure(lambda: client.get('/contact', {'page': 1}), args.repeat))
+    for workers in (0, args.workers):
+        statuses = []
+        stop = threading.Event()
+
+        def storm():
+            login_client = Client()
+            while not stop.is_set():
+                statuses.append(login(login_client))
+                if statuses[-1] == 429:
+                    # Back off briefly, like a client honouring Retry-After would.
+                    stop.wait(0.05)
+            connection.close()
+
+        with override_settings(AUTH_PASSWORD_WORKERS=workers, AUTH_PASSWORD_QUEUE=args.queue):
+            threads = [threading.Thread(target=storm) for _ in range(args.threads)]
+            started = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            timings = measure(lambda: client.get('/contact', {'page': 1}), args.repeat, warmup=0)
+            stop.set()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - started
+        label = 'inline' if not workers else '%d workers, queue %d' % (workers, args.queue)
+        report('list during storm, %s' % label, timings)
+        print('%-40s %8.1f logins/s, %d turned away' % (
+            '', statuses.count(200) / elapsed, statuses.count(429)))
+    print('PBKDF2 cost in settings: %d iterations' % settings.AUTH_PASSWORD_ITERATIONS)
+
+
+if __name__ == '__main__':
+    main()
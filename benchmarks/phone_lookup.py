@@ -0,0 +1,37 @@
+"""
+Time `?phone=` lookups as the book grows, against matching the raw
+`phone_number` column with LIKE. The indexed lookup should stay flat.
+
+    python -m benchmarks.phone_lookup --sizes 10000,100000,1000000
+"""
+import argparse
+
+from .utils import api_client, create_user, measure, report, seed_contacts, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', default='10000,100000,1000000')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    from contact.models import Contact
+
+    user = create_user()
+    client = api_client(user)
+    seeded = 0
+    for size in sorted(int(size) for size in args.sizes.split(',')):
+        seed_contacts(user, size - seeded)
+        seeded = size
+        # The number of a contact in the middle of the book, in full and by its last seven digits.
+        number = '+1 555 %07d' % (size // 2)
+        print('%d contacts' % size)
+        report('LIKE on phone_number', measure(lambda: list(Contact.objects.filter(
+            user=user, contact_phone_number__phone_number__endswith=number[-8:]).order_by('id')[:10]), args.repeat))
+        report('?phone= full number', measure(lambda: client.get('/contact', {'phone': number}), args.repeat))
+        report('?phone= last 7 digits', measure(lambda: client.get('/contact', {'phone': number[-8:]}), args.repeat))
+
+
+if __name__ == '__main__':
+    main()
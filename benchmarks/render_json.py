@@ -0,0 +1,50 @@
+"""
+Measure the cost of encoding a list response per 1000 contacts: the
+rest_framework `JSONRenderer` with contact dicts, `FastJSONRenderer` with the
+same dicts, decoding snapshots before encoding them, and `FastJSONRenderer`
+writing the snapshots as they are.
+
+    python -m benchmarks.render_json --contacts 1000
+"""
+import argparse
+import json
+
+from .utils import measure, report, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--contacts', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django()
+    from rest_framework.renderers import JSONRenderer
+    from contact.renderers import FastJSONRenderer, JSONFragment
+    from contact.renderers.FastJSONRenderer import orjson
+
+    contacts = [{
+        'id': pk, 'first_name': 'First%d' % pk, 'last_name': 'Last%d' % pk, 'middle_name': None,
+        'nickname': 'nick%d' % pk, 'designation': 'Engineer', 'company': 'Company %d' % (pk % 100),
+        'phone_numbers': [{'id': pk, 'type': 'mobile', 'phone_number': '+1 555 %07d' % pk}],
+        'email_addresses': [{'id': pk, 'type': 'work', 'email_address': 'contact%d@example.com' % pk}],
+    } for pk in range(1, args.contacts + 1)]
+    snapshots = [json.dumps(contact, separators=(',', ':')) for contact in contacts]
+
+    def page(items):
+        return {'current_page': 1, 'next_page': 2, 'previous_page': None, 'total_page': 10,
+                'total_contacts': len(items), 'contacts': items}
+
+    print('%d contacts per response, orjson %s' % (args.contacts, 'installed' if orjson else 'missing'))
+    report('JSONRenderer, dicts', measure(lambda: JSONRenderer().render(page(contacts)), args.repeat))
+    report('FastJSONRenderer, dicts', measure(lambda: FastJSONRenderer().render(page(contacts)), args.repeat))
+    report('JSONRenderer, decoded snapshots',
+           measure(lambda: JSONRenderer().render(page([json.loads(s) for s in snapshots])), args.repeat))
+    report('FastJSONRenderer, fragments',
+           measure(lambda: FastJSONRenderer().render(page([JSONFragment.of(s) for s in snapshots])), args.repeat))
+    assert json.loads(FastJSONRenderer().render(page([JSONFragment.of(s) for s in snapshots]))) == \
+        json.loads(JSONRenderer().render(page(contacts)))
+
+
+if __name__ == '__main__':
+    main()
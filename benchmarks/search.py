@@ -0,0 +1,54 @@
+"""
+Compare `?q=` search through the FTS5 index with the `icontains` (LIKE)
+baseline: the first page of results plus the total, as `ContactListView`
+runs them.
+
+    python -m benchmarks.search --contacts 1000000
+"""
+import argparse
+
+from .utils import create_user, measure, report, seed_contacts, setup_django
+
+QUERIES = (
+    # one match, a prefix with about ten matches, about 1% of the book
+    'First123456',
+    'nick12345',
+    'Company 42',
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--contacts', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    setup_django()
+    from contact.models import Contact
+    from contact.search import ContactSearchIndex
+    from contact.views import ContactListView
+
+    user = create_user()
+    seed_contacts(user, args.contacts, with_children=False)
+    contacts = Contact.objects.filter(user=user).order_by('id')
+
+    def like(text):
+        queryset = contacts
+        for term in ContactSearchIndex.terms(text):
+            queryset = queryset.filter(ContactSearchIndex.icontains(term))
+        return queryset
+
+    def run(queryset):
+        list(queryset[:ContactListView.page_size])
+        queryset.count()
+
+    print('%d contacts' % args.contacts)
+    for text in QUERIES:
+        matches = ContactSearchIndex.search(contacts, text).count()
+        report('LIKE  %r (%d)' % (text, matches), measure(lambda: run(like(text)), args.repeat, warmup=1))
+        report('FTS5  %r (%d)' % (text, matches),
+               measure(lambda: run(ContactSearchIndex.search(contacts, text)), args.repeat, warmup=1))
+
+
+if __name__ == '__main__':
+    main()
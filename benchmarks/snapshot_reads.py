@@ -0,0 +1,61 @@
+"""
+Compare rendering contacts from their snapshot with loading their children,
+for the list api and the retrieve api, with the page and contact caches off,
+and the cost of the snapshot triggers on creates.
+
+    python -m benchmarks.snapshot_reads --contacts 50000
+"""
+import argparse
+import time
+
+from .utils import api_client, create_user, measure, report, seed_contacts, setup_django
+
+
+def create(client, count, label):
+    started = time.perf_counter()
+    for number in range(count):
+        response = client.post('/contact/create', {
+            'first_name': 'Bench', 'last_name': 'Create', 'phone_number': '+1 555 %07d' % number,
+            'phone_number_type': 'mobile', 'email_type': 'work',
+            'email_address': '%s%d@example.com' % (label, number),
+        }, format='json')
+        assert response.status_code == 201, response.content
+    return count / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--contacts', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--creates', type=int, default=300)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.db import connection
+    from contact.snapshots import ContactSnapshot
+    from contact.views import ContactListView
+
+    settings.CACHES['none'] = {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}
+    settings.CONTACT_CACHE = 'none'
+    ContactListView.page_cache.max_bytes = 0
+    user = create_user()
+    seed_contacts(user, args.contacts)
+    client = api_client(user)
+
+    print('%d contacts, page size %d' % (args.contacts, ContactListView.page_size))
+    for enabled in (False, True):
+        settings.CONTACT_SNAPSHOTS = enabled
+        mode = 'snapshot' if enabled else 'children'
+        report('list page 1, %s' % mode, measure(lambda: client.get('/contact', {'page': 1}), args.repeat))
+        report('list page 2000, %s' % mode, measure(lambda: client.get('/contact', {'page': 2000}), args.repeat))
+        report('retrieve, %s' % mode, measure(lambda: client.get('/contact/5'), args.repeat))
+
+    ContactSnapshot.uninstall(connection)
+    print('%-40s %8.1f creates/s' % ('creates without triggers', create(client, args.creates, 'off')))
+    ContactSnapshot.install(connection)
+    print('%-40s %8.1f creates/s' % ('creates with triggers', create(client, args.creates, 'on')))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Each benchmark runs against a throwaway SQLite database so it never touches
+`db.sqlite3`. Run them from the project root, e.g.
+
+    python -m benchmarks.list_pagination --contacts 50000
+"""
+import atexit
+import os
+import statistics
+import tempfile
+import time
+
+
+def setup_django(db_path=None):
+    """
+    Point the project settings at a database file and migrate it. Without
+    `db_path` a temporary file is used and removed on exit.
+    """
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'contactbook.settings')
+    from django.conf import settings
+    if db_path is None:
+        handle, db_path = tempfile.mkstemp(prefix='contactbook-bench-', suffix='.sqlite3')
+        os.close(handle)
+        atexit.register(os.remove, db_path)
+    settings.DATABASES['default']['NAME'] = db_path
+    settings.ALLOWED_HOSTS = ['*']
+
+    import django
+    django.setup()
+
+    from django.core.management import call_command
+    call_command('migrate', verbosity=0)
+    return db_path
+
+
+def create_user(email='bench@example.com', password='benchpassword'):
+    from django.contrib.auth.models import User
+    return User.objects.create_user(email, email, password)
+
+
+def seed_contacts(user, count, batch_size=5000, with_children=True):
+    """Insert `count` contacts (one phone and one email each) with bulk inserts."""
+    from django.db import transaction
+
+    from contact.models import Contact, EmailAddress, PhoneNumber
+
+    last = Contact.objects.order_by('-id').values_list('id', flat=True).first() or 0
+    with transaction.atomic():
+        for start in range(0, count, batch_size):
+            ids = range(last + start + 1, last + min(start + batch_size, count) + 1)
+            Contact.objects.bulk_create([
+                Contact(id=pk, user=user, first_name='First%d' % pk, last_name='Last%d' % pk,
+                        nickname='nick%d' % pk, company='Company %d' % (pk % 100), designation='Engineer')
+                for pk in ids
+            ])
+            if with_children:
+                phone_numbers = [(pk, '+1 555 %07d' % pk) for pk in ids]
+                PhoneNumber.objects.bulk_create([
+                    PhoneNumber(contact_object_id=pk, type='mobile', phone_number=phone_number,
+                                digits=PhoneNumber.normalize(phone_number)[0],
+                                reversed_digits=PhoneNumber.normalize(phone_number)[1])
+                    for pk, phone_number in phone_numbers
+                ])
+                EmailAddress.objects.bulk_create([
+                    EmailAddress(contact_object_id=pk, user=user, type='work',
+                                 email_address='contact%d@example.com' % pk)
+                    for pk in ids
+                ])
+
+
+def api_client(user):
+    from rest_framework.authtoken.models import Token
+    from rest_framework.test import APIClient
+
+    token, created = Token.objects.get_or_create(user=user)
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+    return client
+
+
+def measure(func, repeat=20, warmup=2):
+    """Call `func` repeatedly and return per-call timings in milliseconds."""
+    for _ in range(warmup):
+        func()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def report(label, timings):
+    print('%-40s median %8.3f ms   p95 %8.3f ms' % (
+        label, statistics.median(timings), sorted(timings)[int(len(timings) * 0.95) - 1]))
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class ContactConfig(AppConfig):
     name = 'contact'
+
+    def ready(self):
+        from . import checks  # noqa
+        from . import signals  # noqa
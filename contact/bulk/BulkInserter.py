@@ -0,0 +1,40 @@
+from django.db import connections, router
+from django.utils import timezone
+
+
+class BulkInserter(object):
+    """
+    Insert rows with one prepared single-row INSERT run through `executemany`.
+
+    `bulk_create` builds a model instance per row, compiles a multi-row
+    statement for every ~100 rows (SQLite allows 999 parameters per
+    statement) and prepares every value through the SQL compiler, which caps
+    it at a few thousand rows per second. Here rows are plain tuples of values
+    that are already in their database form (strings, integers, ids, None),
+    and `auto_now`/`auto_now_add` timestamps are filled in with one shared
+    value. No signals are sent and the new primary keys aren't returned.
+    """
+
+    @classmethod
+    def insert(cls, model, fields, rows):
+        """Insert `rows`, tuples of values for `fields` (field names, FKs by name)."""
+        if not rows:
+            return
+        connection = connections[router.db_for_write(model)]
+        fields = [model._meta.get_field(name) for name in fields]
+        timestamps = [
+            field for field in model._meta.concrete_fields
+            if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+        ]
+        columns = [field.column for field in fields] + [field.column for field in timestamps]
+        now = timezone.now()
+        stamp = tuple(field.get_db_prep_save(now, connection) for field in timestamps)
+
+        quote_name = connection.ops.quote_name
+        sql = 'INSERT INTO %s (%s) VALUES (%s)' % (
+            quote_name(model._meta.db_table),
+            ', '.join(quote_name(column) for column in columns),
+            ', '.join(['%s'] * len(columns)),
+        )
+        with connection.cursor() as cursor:
+            cursor.executemany(sql, [tuple(row) + stamp for row in rows])
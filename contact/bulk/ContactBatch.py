@@ -0,0 +1,203 @@
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status
+
+from ..caches import BookVersion
+from ..caches import ContactCache
+from ..caches import ContactChanges
+from ..loaders import ContactLoader
+from ..models import Contact
+from ..models import ContactCounter
+from ..serializers import ContactInfoSerializer
+from ..serializers import ContactSerializer
+from .ContactBulkWriter import ContactBulkWriter
+
+
+class ContactBatch(object):
+    """
+    Run a list of contact operations for one user in one transaction.
+
+    Each operation is `{'op': 'create', 'data': {...}}`, `{'op': 'update' |
+    'basic_update', 'id': ..., 'data': {...}}` or `{'op': 'delete', 'id': ...}`,
+    with `data` as the matching single-contact endpoint takes it. Operations
+    are validated by the same serializers, duplicate emails are checked for
+    the whole batch with one set-based query, and the writes are grouped:
+    one bulk insert per table for creates and appended children, one
+    `bulk_update` for updates and one delete. Every operation gets a
+    `{'status': ..., 'data': ...}` result holding what its endpoint returns.
+
+    Operations are independent of each other, except that an email freed by
+    an earlier delete can be reused and an email added by an earlier
+    operation can't. A contact can be the target of one operation per batch.
+    """
+    OPERATIONS = ('create', 'update', 'basic_update', 'delete')
+    BASIC_FIELDS = ('first_name', 'middle_name', 'last_name', 'nickname', 'company', 'designation')
+
+    def __init__(self, user):
+        self.user = user
+        self.writer = ContactBulkWriter(user)
+
+    def run(self, operations):
+        results = [None] * len(operations)
+        with transaction.atomic(), ContactChanges.collect():
+            self.writer.lock()
+            targets = self.fetch_targets(operations)
+            plans = self.validate(operations, targets, results)
+            plans = self.check_emails(plans, results)
+            self.write(plans, results)
+        BookVersion.bump(self.user.pk)
+        return results
+
+    @staticmethod
+    def result(status_code, data):
+        return {'status': status_code, 'data': data}
+
+    def fetch_targets(self, operations):
+        ids = set()
+        for operation in operations:
+            if isinstance(operation, dict) and operation.get('op') in self.OPERATIONS[1:]:
+                try:
+                    ids.add(int(operation.get('id')))
+                except (TypeError, ValueError):
+                    pass
+        return Contact.objects.filter(user=self.user).in_bulk(ids) if ids else {}
+
+    def validate(self, operations, targets, results):
+        """Return `(index, op, contact, validated data)` for the operations that validate."""
+        plans = []
+        seen = set()
+        for index, operation in enumerate(operations):
+            if not isinstance(operation, dict):
+                results[index] = self.result(status.HTTP_400_BAD_REQUEST, {'op': ["Expected an object."]})
+                continue
+            op = operation.get('op')
+            if op not in self.OPERATIONS:
+                results[index] = self.result(status.HTTP_400_BAD_REQUEST,
+                                             {'op': ['"%s" is not a valid choice.' % op]})
+                continue
+
+            contact = None
+            if op != 'create':
+                try:
+                    contact = targets.get(int(operation.get('id')))
+                except (TypeError, ValueError):
+                    pass
+                if contact is None:
+                    results[index] = self.result(status.HTTP_404_NOT_FOUND, {'error': 'Not Found'})
+                    continue
+                if contact.pk in seen:
+                    results[index] = self.result(status.HTTP_400_BAD_REQUEST, {
+                        'id': ["Contact is already changed by an earlier operation in this batch."]})
+                    continue
+                seen.add(contact.pk)
+
+            if op == 'delete':
+                plans.append((index, op, contact, None))
+                continue
+            if op == 'basic_update':
+                serializer = ContactInfoSerializer(instance=contact, data=operation.get('data'), user=self.user)
+            else:
+                serializer = ContactSerializer(instance=contact, data=operation.get('data'), user=self.user)
+            if not serializer.is_valid():
+                results[index] = self.result(status.HTTP_400_BAD_REQUEST, serializer.errors)
+                continue
+            lists = [name for name in ('phone_numbers', 'email_addresses') if name in serializer.validated_data]
+            if lists:
+                # Replacing children is per contact work; it has no set-based form here yet.
+                results[index] = self.result(status.HTTP_400_BAD_REQUEST, dict(
+                    (name, ["Lists aren't supported in batches, use the contact update api."]) for name in lists))
+                continue
+            plans.append((index, op, contact, serializer.validated_data))
+        return plans
+
+    def check_emails(self, plans, results):
+        """Apply the per-user email uniqueness check of the single endpoints to the whole batch."""
+        emails = set(data['email_address'] for index, op, contact, data in plans
+                     if data and data.get('email_address'))
+        taken = self.writer.existing_emails(emails)
+
+        accepted = []
+        for plan in plans:
+            index, op, contact, data = plan
+            if op == 'delete':
+                for email in [email for email, owner in taken.items() if owner == contact.pk]:
+                    del taken[email]
+            elif data.get('email_address') or op == 'update':
+                # Like ContactView.put, a full update is refused when the email is in the book at all.
+                email = data.get('email_address')
+                if email in taken:
+                    results[index] = self.result(status.HTTP_400_BAD_REQUEST, {'email': [" Contact already exists. "]})
+                    continue
+                if email:
+                    taken[email] = contact.pk if contact else None
+            accepted.append(plan)
+        return accepted
+
+    def write(self, plans, results):
+        deleted = [contact.pk for index, op, contact, data in plans if op == 'delete']
+        if deleted:
+            Contact.objects.filter(pk__in=deleted).delete()
+
+        creates = [(index, data) for index, op, contact, data in plans if op == 'create']
+        created_ids = self.writer.create([self.create_row(data) for index, data in creates])
+        created = Contact.objects.in_bulk(created_ids) if created_ids else {}
+
+        now = timezone.now()
+        updated = []
+        fields = set()
+        children = []
+        for index, op, contact, data in plans:
+            if op == 'update':
+                changed = ContactSerializer.assign(contact, data)
+                phone_numbers, email_addresses = self.child_rows(data)
+                children.append((contact.pk, phone_numbers, email_addresses))
+                if not changed and not (phone_numbers or email_addresses):
+                    continue
+            elif op == 'basic_update':
+                changed = ContactInfoSerializer.assign(contact, data)
+                if not changed:
+                    continue
+            else:
+                continue
+            # Only the columns some update changed are written, and contacts left as they were aren't touched.
+            fields.update(changed)
+            contact.date_modified = now
+            updated.append(contact)
+        if updated:
+            Contact.objects.bulk_update(updated, sorted(fields) + ['date_modified'])
+            ContactCache.invalidate(*(contact.pk for contact in updated))
+        self.writer.add_children(children)
+        if len(created_ids) != len(deleted):
+            ContactCounter.adjust(self.user, len(created_ids) - len(deleted))
+
+        contacts = {}
+        for (index, data), pk in zip(creates, created_ids):
+            contacts[index] = created[pk]
+        for index, op, contact, data in plans:
+            if op in ('update', 'basic_update'):
+                contacts[index] = ContactLoader.reset(contact)
+        ContactLoader.load(list(contacts.values()))
+
+        for index, op, contact, data in plans:
+            if op == 'delete':
+                results[index] = self.result(status.HTTP_200_OK, {'success': True})
+            elif op == 'create':
+                results[index] = self.result(status.HTTP_201_CREATED, contacts[index].to_representation())
+            else:
+                results[index] = self.result(status.HTTP_200_OK, contacts[index].to_representation())
+
+    @classmethod
+    def create_row(cls, data):
+        row = dict((field, data[field]) for field in cls.BASIC_FIELDS if field in data)
+        row['phone_numbers'], row['email_addresses'] = cls.child_rows(data)
+        return row
+
+    @staticmethod
+    def child_rows(data):
+        phone_numbers = []
+        email_addresses = []
+        if data.get('phone_number'):
+            phone_numbers.append({'type': data.get('phone_number_type', 'other'), 'phone_number': data['phone_number']})
+        if data.get('email_address'):
+            email_addresses.append({'type': data.get('email_type', 'other'), 'email_address': data['email_address']})
+        return phone_numbers, email_addresses
@@ -0,0 +1,86 @@
+from django.contrib.auth.models import User
+
+from ..caches import ContactCache
+from ..models import Contact
+from ..models import EmailAddress
+from ..models import PhoneNumber
+from .BulkInserter import BulkInserter
+
+
+class ContactBulkWriter(object):
+    """
+    Set-based reads and writes against one user's book, shared by the bulk
+    import and the batch api. Call it inside a transaction, after `lock()`.
+
+    Rows are dicts shaped like `Contact.to_representation` without ids:
+    basic fields plus `phone_numbers` and `email_addresses` lists of
+    `{'type': ..., 'phone_number'/'email_address': ...}`.
+    """
+    # Stay below SQLite's default limit of 999 parameters per statement.
+    MAX_QUERY_PARAMS = 500
+    CONTACT_FIELDS = ('user', 'first_name', 'middle_name', 'last_name', 'nickname', 'company', 'designation')
+    PHONE_FIELDS = ('contact_object', 'type', 'phone_number', 'digits', 'reversed_digits')
+    EMAIL_FIELDS = ('contact_object', 'user', 'type', 'email_address')
+
+    def __init__(self, user):
+        self.user = user
+
+    def lock(self):
+        """Serialize bulk writes into this book; see `inserted_ids`."""
+        list(User.objects.select_for_update().filter(pk=self.user.pk).values_list('pk'))
+
+    def existing_emails(self, emails):
+        """
+        Return `{email: contact id}` for those of `emails` already in the
+        user's book, looked up on the (user, email_address) unique index.
+        """
+        emails = list(emails)
+        existing = {}
+        for start in range(0, len(emails), self.MAX_QUERY_PARAMS):
+            existing.update(EmailAddress.objects.filter(
+                user=self.user, email_address__in=emails[start:start + self.MAX_QUERY_PARAMS]
+            ).values_list('email_address', 'contact_object_id'))
+        return existing
+
+    def create(self, rows):
+        """Insert contacts with their children and return their ids in row order."""
+        if not rows:
+            return []
+        BulkInserter.insert(Contact, self.CONTACT_FIELDS, [
+            (
+                self.user.pk,
+                row['first_name'],
+                row.get('middle_name'),
+                row['last_name'],
+                row.get('nickname', ''),
+                row.get('company', ''),
+                row.get('designation', ''),
+            ) for row in rows
+        ])
+        ids = self.inserted_ids(len(rows))
+        self.add_children([(pk, row.get('phone_numbers', []), row.get('email_addresses', []))
+                           for pk, row in zip(ids, rows)])
+        return ids
+
+    def add_children(self, children):
+        """Insert child rows from `(contact id, phone numbers, email addresses)` triples."""
+        ContactCache.invalidate(*(pk for pk, phone_numbers, email_addresses in children))
+        BulkInserter.insert(PhoneNumber, self.PHONE_FIELDS, [
+            (pk, phone['type'], phone['phone_number']) + PhoneNumber.normalize(phone['phone_number'])
+            for pk, phone_numbers, email_addresses in children for phone in phone_numbers
+        ])
+        BulkInserter.insert(EmailAddress, self.EMAIL_FIELDS, [
+            (pk, self.user.pk, email['type'], email['email_address'])
+            for pk, phone_numbers, email_addresses in children for email in email_addresses
+        ])
+
+    def inserted_ids(self, count):
+        """
+        Bulk inserts don't return ids. Bulk writes into the same book are
+        serialized by `lock()` (SQLite holds a database-wide write lock
+        anyway) and ids only grow, so the user's newest `count` ids are
+        exactly the contacts just inserted, in order.
+        """
+        ids = list(Contact.objects.filter(user=self.user).order_by('-id').values_list('id', flat=True)[:count])
+        ids.reverse()
+        return ids
@@ -0,0 +1,3 @@
+from .BulkInserter import BulkInserter
+from .ContactBatch import ContactBatch
+from .ContactBulkWriter import ContactBulkWriter
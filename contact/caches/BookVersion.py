@@ -0,0 +1,44 @@
+from uuid import uuid4
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+from .ContactCache import ContactCache
+
+
+class BookVersion(object):
+    """
+    Version of a user's whole address book, kept in the contact cache.
+    Anything cached per book is keyed by it, and any write to the book bumps
+    it, so one cache write invalidates all of it. Only a cache shared by the
+    workers (see `CACHES` in settings) lets a write in one worker reach the
+    others; `shared()` tells whether that's the case.
+    """
+
+    @staticmethod
+    def shared():
+        """False when the contact cache is per process, so other workers don't see the bumps."""
+        return not isinstance(ContactCache.cache(), LocMemCache)
+
+    @staticmethod
+    def key(user_id):
+        return 'contact-book:version:%s' % user_id
+
+    @classmethod
+    def get(cls, user_id):
+        cache = ContactCache.cache()
+        version = cache.get(cls.key(user_id))
+        if version is None:
+            version = uuid4().hex
+            if not cache.add(cls.key(user_id), version, None):
+                version = cache.get(cls.key(user_id), version)
+        return version
+
+    @classmethod
+    def bump(cls, user_id):
+        if user_id is None:
+            return
+        cache = ContactCache.cache()
+        cache.set(cls.key(user_id), uuid4().hex, None)
+        # A read between now and the commit would cache the old rows under the new version.
+        transaction.on_commit(lambda: cache.set(cls.key(user_id), uuid4().hex, None))
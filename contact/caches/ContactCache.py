@@ -0,0 +1,71 @@
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+
+class ContactCache(object):
+    """
+    Read-through cache of rendered contacts in the Django cache named by
+    `settings.CONTACT_CACHE`.
+
+    Every contact has a version key, and its render is stored under the
+    user, id and current version. Writes to a contact or its children drop
+    the version (see `contact.signals`), both right away and again once the
+    transaction commits, so the next read misses and stores a fresh render
+    under a new version. A read racing with a write can only store its render
+    under a version that is never read again.
+
+    Versions are only dropped in the cache of the worker that wrote, so the
+    cache has to be shared by the workers; `contact.W001` warns when it's
+    per process.
+    """
+
+    @staticmethod
+    def cache():
+        return caches[getattr(settings, 'CONTACT_CACHE', 'default')]
+
+    @staticmethod
+    def timeout():
+        return getattr(settings, 'CONTACT_CACHE_TIMEOUT', 300)
+
+    @staticmethod
+    def version_key(pk):
+        return 'contact:version:%s' % pk
+
+    @staticmethod
+    def key(user, pk, version):
+        return 'contact:%s:%s:%s' % (user.pk, pk, version)
+
+    @classmethod
+    def get(cls, user, pk, load):
+        """
+        Return the cached render of the user's contact `pk`, or call `load`
+        and cache what it returns. `load` returns None for a missing contact,
+        which isn't cached.
+        """
+        cache = cls.cache()
+        version_key = cls.version_key(pk)
+        version = cache.get(version_key)
+        if version is None:
+            version = uuid4().hex
+            if not cache.add(version_key, version, cls.timeout()):
+                version = cache.get(version_key, version)
+        key = cls.key(user, pk, version)
+        representation = cache.get(key)
+        if representation is None:
+            representation = load()
+            if representation is not None:
+                cache.set(key, representation, cls.timeout())
+        return representation
+
+    @classmethod
+    def invalidate(cls, *pks):
+        """Drop the cached renders of the contacts `pks`."""
+        keys = [cls.version_key(pk) for pk in pks]
+        if not keys:
+            return
+        cls.cache().delete_many(keys)
+        # A read between now and the commit would cache the old rows again.
+        transaction.on_commit(lambda: cls.cache().delete_many(keys))
@@ -0,0 +1,76 @@
+from contextlib import contextmanager
+from threading import local
+
+from ..models import Contact
+from .BookVersion import BookVersion
+from .ContactCache import ContactCache
+
+
+class ContactChanges(object):
+    """
+    What follows a write to contacts or their children: their cached
+    renders are dropped and their owners' `BookVersion`s bumped, and a
+    contact whose children changed has its `date_modified` bumped too.
+
+    Writes are reported by the model signals (see `contact.signals`) and by
+    the bulk writers. Outside `collect()` each one is handled right away;
+    inside, they're gathered and handled once when the block succeeds, with
+    no touch for contacts that were saved or deleted themselves and no owner
+    lookup for contacts whose owner is already known.
+    """
+    local = local()
+
+    def __init__(self):
+        # Contact id -> owner id (None until known).
+        self.contacts = {}
+        self.children = {}
+
+    @classmethod
+    @contextmanager
+    def collect(cls):
+        """Gather the writes of the block; nested blocks are gathered by the outermost one."""
+        if getattr(cls.local, 'changes', None) is not None:
+            yield cls.local.changes
+            return
+        changes = cls.local.changes = cls()
+        try:
+            yield changes
+        finally:
+            cls.local.changes = None
+        changes.apply()
+
+    @classmethod
+    def contact_written(cls, pk, user_id):
+        cls.record('contacts', pk, user_id)
+
+    @classmethod
+    def children_written(cls, pk, user_id=None):
+        cls.record('children', pk, user_id)
+
+    @classmethod
+    def record(cls, kind, pk, user_id):
+        changes = getattr(cls.local, 'changes', None)
+        if changes is None:
+            changes = cls()
+            changes.add(kind, pk, user_id)
+            changes.apply()
+        else:
+            changes.add(kind, pk, user_id)
+
+    def add(self, kind, pk, user_id):
+        written = getattr(self, kind)
+        if written.get(pk) is None:
+            written[pk] = user_id
+
+    def apply(self):
+        touched = [pk for pk in self.children if pk not in self.contacts]
+        if touched:
+            Contact.touch(*touched)
+        owners = dict((pk, user_id) for pk, user_id in self.children.items() if user_id is not None)
+        owners.update((pk, user_id) for pk, user_id in self.contacts.items() if user_id is not None)
+        missing = [pk for pk in touched if pk not in owners]
+        if missing:
+            owners.update(Contact.objects.filter(pk__in=missing).values_list('id', 'user_id'))
+        ContactCache.invalidate(*(set(self.contacts) | set(self.children)))
+        for user_id in set(owners.values()):
+            BookVersion.bump(user_id)
@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+from monitoring.metrics import CacheMetrics
+
+
+class PageCache(object):
+    """
+    In-process LRU cache bounded by the total size of its values, as given by
+    the caller, with hit, miss and eviction counters. Entries older than
+    `timeout` seconds are dropped when read; None keeps them until evicted.
+    With a `name`, lookups and evictions are also counted in `CacheMetrics`
+    for /metrics.
+    """
+
+    def __init__(self, max_bytes, timeout=None, name=None):
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.name = name
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] <= monotonic():
+                del self.entries[key]
+                self.bytes -= entry[1]
+                entry = None
+            if entry is None:
+                self.misses += 1
+            else:
+                self.entries.move_to_end(key)
+                self.hits += 1
+        if self.name:
+            CacheMetrics.lookup(self.name, entry is not None)
+        return entry[0] if entry is not None else None
+
+    def set(self, key, value, size):
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            if size > self.max_bytes:
+                return
+            self.entries[key] = (value, size, None if self.timeout is None else monotonic() + self.timeout)
+            self.bytes += size
+            evicted = 0
+            while self.bytes > self.max_bytes:
+                self.bytes -= self.entries.popitem(last=False)[1][1]
+                evicted += 1
+            self.evictions += evicted
+        if self.name and evicted:
+            CacheMetrics.evicted(self.name, evicted)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self.entries),
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+            }
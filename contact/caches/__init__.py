@@ -0,0 +1,4 @@
+from .BookVersion import BookVersion
+from .ContactCache import ContactCache
+from .ContactChanges import ContactChanges
+from .PageCache import PageCache
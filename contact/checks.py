@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Tags, Warning, register
+
+
+@register(Tags.caches)
+def contact_cache_check(app_configs, **kwargs):
+    # Writes invalidate cached renders, book versions and tokens in the cache of the worker that made them only.
+    alias = getattr(settings, 'CONTACT_CACHE', 'default')
+    if isinstance(caches[alias], LocMemCache):
+        return [Warning(
+            "CONTACT_CACHE '%s' is cached per process, so workers serve contacts, ETags and tokens another worker "
+            "changed until they expire." % alias,
+            hint="Use a cache shared by the workers, such as the file, memcached or redis backends.",
+            id='contact.W001',
+        )]
+    return []
@@ -0,0 +1,76 @@
+from ..caches import ContactChanges
+from ..models import EmailAddress
+from ..models import PhoneNumber
+
+
+class ContactChildren(object):
+    """
+    Replace a contact's phone numbers and email addresses with given lists.
+
+    Stored rows are matched to the list by value and kept, with their type
+    updated if it changed; values that aren't stored yet are inserted with
+    one `bulk_create`, changed types written with one `bulk_update` and rows
+    left over removed with one `QuerySet.delete()`. Call it inside a
+    transaction, and inside `ContactChanges.collect()` so the per-row delete
+    signals are handled once.
+    """
+    children = (
+        ('phone_numbers', PhoneNumber, 'phone_number'),
+        ('email_addresses', EmailAddress, 'email_address'),
+    )
+
+    @staticmethod
+    def taken_emails(contact, emails):
+        """
+        Return those of `emails` that other contacts in the book have, from
+        the (user, email_address) unique index.
+        """
+        return set(EmailAddress.objects.filter(user_id=contact.user_id, email_address__in=list(emails)).exclude(
+            contact_object=contact).values_list('email_address', flat=True))
+
+    @classmethod
+    def replace(cls, contact, **lists):
+        """
+        Make the contact's `phone_numbers` and/or `email_addresses` exactly the
+        given lists of `{'type': ..., 'phone_number'/'email_address': ...}`.
+        Lists that aren't passed are left alone. Returns the names of the lists
+        that changed.
+        """
+        changed = [name for name, model, field in cls.children
+                   if lists.get(name) is not None and cls.sync(contact, model, field, lists[name])]
+        if changed:
+            # The bulk writes send no signals, so report them the way the child receivers would.
+            ContactChanges.children_written(contact.pk, contact.user_id)
+        return changed
+
+    @staticmethod
+    def sync(contact, model, field, items):
+        stored = {}
+        for row in model.objects.filter(contact_object=contact).only('id', 'type', field).order_by('id'):
+            stored.setdefault(getattr(row, field), []).append(row)
+
+        updated = []
+        added = []
+        for item in items:
+            rows = stored.get(item[field])
+            if rows:
+                row = rows.pop(0)
+                if row.type != item['type']:
+                    row.type = item['type']
+                    updated.append(row)
+            else:
+                row = model(contact_object=contact, type=item['type'], **{field: item[field]})
+                if model is PhoneNumber:
+                    row.digits, row.reversed_digits = PhoneNumber.normalize(row.phone_number)
+                else:
+                    row.user_id = contact.user_id
+                added.append(row)
+        removed = [row.pk for rows in stored.values() for row in rows]
+
+        if removed:
+            model.objects.filter(pk__in=removed).delete()
+        if updated:
+            model.objects.bulk_update(updated, ['type'])
+        if added:
+            model.objects.bulk_create(added)
+        return bool(removed or updated or added)
@@ -0,0 +1 @@
+from .ContactChildren import ContactChildren
@@ -0,0 +1,54 @@
+import hashlib
+from calendar import timegm
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+class ContactETag(object):
+    """
+    Validators for conditional GETs of contacts.
+
+    Writes to a contact's phone numbers and email addresses bump its
+    `date_modified` (see `contact.signals`), so it covers everything the
+    contact renders. A list is validated by the newest `date_modified` in the
+    user's book and its total, which change with every write to the book.
+    ETags also hash the query string, as `fields`, `expand`, pages and filters
+    change the body for the same rows. Last-Modified only has second precision,
+    so clients should prefer If-None-Match.
+    """
+
+    @staticmethod
+    def make(request, *parts):
+        digest = hashlib.sha1()
+        for part in parts + (sorted(request.GET.lists()),):
+            digest.update(repr(part).encode('utf-8'))
+            digest.update(b'\0')
+        return '"%s"' % digest.hexdigest()
+
+    @classmethod
+    def for_contact(cls, request, pk, modified):
+        return cls.make(request, 'contact', request.user.pk, int(pk), modified.isoformat())
+
+    @classmethod
+    def for_list(cls, request, modified, total):
+        return cls.make(request, 'list', request.user.pk, modified.isoformat() if modified else None, total)
+
+    @staticmethod
+    def timestamp(modified):
+        return timegm(modified.utctimetuple()) if modified else None
+
+    @classmethod
+    def not_modified(cls, request, etag, modified):
+        """Return a 304 (or 412) response if the request's conditions say so, else None."""
+        response = get_conditional_response(request, etag=etag, last_modified=cls.timestamp(modified))
+        if response is not None and response.status_code == 304:
+            cls.tag(response, etag, modified)
+        return response
+
+    @classmethod
+    def tag(cls, response, etag, modified):
+        response['ETag'] = etag
+        if modified:
+            response['Last-Modified'] = http_date(cls.timestamp(modified))
+        return response
@@ -0,0 +1 @@
+from .ContactETag import ContactETag
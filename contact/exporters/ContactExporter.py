@@ -0,0 +1,73 @@
+import csv
+import json
+
+from ..loaders import ContactLoader
+from ..models import Contact
+
+
+class Echo(object):
+    """File-like object whose `write` hands back the line instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+class ContactExporter(object):
+    """
+    Stream a user's whole address book as NDJSON or CSV.
+
+    Contacts are read in keyset chunks of `chunk_size` (`id > last ORDER BY id`)
+    with their children batch-loaded per chunk, and every chunk is encoded and
+    released before the next one is fetched, so memory stays constant however
+    large the book is.
+    """
+    CSV_HEADER = ('id', 'first_name', 'middle_name', 'last_name', 'nickname', 'company', 'designation',
+                  'phone_numbers', 'email_addresses')
+    content_types = {
+        'ndjson': 'application/x-ndjson',
+        'csv': 'text/csv',
+    }
+
+    def __init__(self, user, chunk_size=500):
+        self.user = user
+        self.chunk_size = chunk_size
+
+    def chunks(self):
+        last_id = 0
+        while True:
+            contacts = Contact.objects.filter(user=self.user, id__gt=last_id).order_by('id')
+            contacts = contacts.only(*Contact.REPRESENTATION_FIELDS)
+            chunk = ContactLoader.load(list(contacts[:self.chunk_size]))
+            if not chunk:
+                return
+            yield chunk
+            if len(chunk) < self.chunk_size:
+                return
+            last_id = chunk[-1].id
+
+    def ndjson(self):
+        for chunk in self.chunks():
+            yield ''.join(json.dumps(contact.to_representation()) + '\n' for contact in chunk)
+
+    def csv(self):
+        writer = csv.writer(Echo())
+        yield writer.writerow(self.CSV_HEADER)
+        for chunk in self.chunks():
+            yield ''.join(writer.writerow(self.csv_row(contact)) for contact in chunk)
+
+    @staticmethod
+    def csv_row(contact):
+        return (
+            contact.id,
+            contact.first_name,
+            contact.middle_name or '',
+            contact.last_name,
+            contact.nickname,
+            contact.company,
+            contact.designation,
+            '; '.join('%s:%s' % (phone.type, phone.phone_number) for phone in contact.contact_phone_number.all()),
+            '; '.join('%s:%s' % (email.type, email.email_address) for email in contact.contact_email_address.all()),
+        )
+
+    def stream(self, output):
+        return getattr(self, output)()
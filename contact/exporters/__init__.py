@@ -0,0 +1 @@
+from .ContactExporter import ContactExporter
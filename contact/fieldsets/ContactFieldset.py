@@ -0,0 +1,74 @@
+from ..loaders import ContactLoader
+from ..models import Contact
+from ..renderers import JSONFragment
+from ..snapshots import ContactSnapshot
+
+
+class InvalidFieldset(Exception):
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = errors
+
+
+class ContactFieldset(object):
+    """
+    Sparse fieldset requested with `?fields=` and `?expand=`.
+
+    `fields` is a comma separated list of basic contact fields and `expand` of
+    child lists (`phone_numbers`, `email_addresses`). A missing parameter means
+    everything, as before; an empty `expand=` renders no child lists. Only the
+    requested columns are selected and child tables that aren't expanded are
+    never queried.
+
+    The default fieldset renders contacts from their snapshot (see
+    `ContactSnapshot`) when they have one, so their children aren't loaded,
+    and hands it on still encoded (see `FastJSONRenderer`).
+    """
+
+    def __init__(self, fields=None, expand=None):
+        self.fields = fields
+        self.expand = expand
+
+    @classmethod
+    def from_request(cls, request):
+        errors = {}
+        fields = cls.parse(request, 'fields', Contact.REPRESENTATION_FIELDS, errors)
+        expand = cls.parse(request, 'expand', Contact.REPRESENTATION_EXPANSIONS, errors)
+        if errors:
+            raise InvalidFieldset(errors)
+        return cls(fields, expand)
+
+    @staticmethod
+    def parse(request, param, allowed, errors):
+        if param not in request.GET:
+            return None
+        names = [name.strip() for name in request.GET.get(param).split(',') if name.strip()]
+        unknown = [name for name in names if name not in allowed]
+        if unknown:
+            errors[param] = ["Unknown field(s): %s." % ", ".join(unknown)]
+        return tuple(names)
+
+    @property
+    def is_default(self):
+        return self.fields is None and self.expand is None
+
+    @property
+    def uses_snapshot(self):
+        return self.is_default and ContactSnapshot.enabled()
+
+    def apply(self, queryset, *columns):
+        """Restrict a contact queryset to the requested columns, plus `columns`."""
+        if self.fields is not None:
+            queryset = queryset.only(*((self.fields or ('id',)) + columns))
+        return queryset
+
+    def load(self, contacts):
+        """Batch-load the requested child lists of fetched contacts."""
+        if self.uses_snapshot and all(contact.snapshot is not None for contact in contacts):
+            return contacts
+        return ContactLoader.load(contacts, self.expand)
+
+    def render(self, contact):
+        if self.uses_snapshot and contact.snapshot is not None:
+            return JSONFragment.of(contact.snapshot)
+        return contact.to_representation(self.fields, self.expand)
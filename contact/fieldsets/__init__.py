@@ -0,0 +1 @@
+from .ContactFieldset import ContactFieldset, InvalidFieldset
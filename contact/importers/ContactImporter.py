@@ -0,0 +1,112 @@
+from itertools import islice
+
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+
+from ..bulk import ContactBulkWriter
+from ..caches import BookVersion
+from ..models import ContactCounter
+from ..models import EmailAddress
+from ..models import PhoneNumber
+
+
+class ContactImporter(object):
+    """
+    Import parsed contact rows into a user's book.
+
+    Rows (as produced by `CsvParser` and `VCardParser`) are validated in
+    batches with the same rules as the create api. Duplicate emails are
+    checked against the book with one set-based query per batch, and accepted
+    rows are bulk inserted, all inside one transaction. Invalid rows are
+    skipped and reported by their 1-based position.
+    """
+    FIELDS = (
+        # name, max length, required
+        ('first_name', 200, True),
+        ('middle_name', 200, False),
+        ('last_name', 200, True),
+        ('nickname', 100, False),
+        ('company', 255, False),
+        ('designation', 200, False),
+    )
+    PHONE_TYPES = set(choice for choice, label in PhoneNumber.PHONE_NUMBER_TYPE_CHOICES)
+    EMAIL_TYPES = set(choice for choice, label in EmailAddress.EMAIL_TYPE_CHOICES)
+
+    def __init__(self, user, batch_size=1000):
+        self.user = user
+        self.batch_size = batch_size
+        self.writer = ContactBulkWriter(user)
+
+    def run(self, rows):
+        """Import `rows` and return `{'imported': count, 'errors': [{'row': n, 'errors': {...}}]}`."""
+        imported = 0
+        errors = []
+        seen_emails = set()
+        rows = enumerate(rows, 1)
+        with transaction.atomic():
+            self.writer.lock()
+            while True:
+                batch = list(islice(rows, self.batch_size))
+                if not batch:
+                    break
+                accepted = self.accept(batch, seen_emails, errors)
+                self.writer.create(accepted)
+                imported += len(accepted)
+            if imported:
+                ContactCounter.adjust(self.user, imported)
+        if imported:
+            BookVersion.bump(self.user.pk)
+        return {'imported': imported, 'errors': errors}
+
+    def accept(self, batch, seen_emails, errors):
+        valid = []
+        for number, row in batch:
+            row_errors = self.validate(row)
+            if row_errors:
+                errors.append({'row': number, 'errors': row_errors})
+            else:
+                valid.append((number, row))
+
+        existing = self.writer.existing_emails(
+            set(email['email_address'] for number, row in valid for email in row['email_addresses']))
+        accepted = []
+        for number, row in valid:
+            emails = [email['email_address'] for email in row['email_addresses']]
+            if any(email in existing or email in seen_emails for email in emails):
+                errors.append({'row': number, 'errors': {'email': [" Contact already exists. "]}})
+                continue
+            seen_emails.update(emails)
+            accepted.append(row)
+        return accepted
+
+    def validate(self, row):
+        errors = {}
+        for name, max_length, required in self.FIELDS:
+            value = row.get(name)
+            if required and not value:
+                errors[name] = ["This field is required."]
+            elif value and len(value) > max_length:
+                errors[name] = ["Ensure this field has no more than %d characters." % max_length]
+
+        for phone in row.get('phone_numbers', []):
+            if phone['type'] not in self.PHONE_TYPES:
+                errors.setdefault('phone_number_type', []).append('"%s" is not a valid choice.' % phone['type'])
+            if len(phone['phone_number']) > 50:
+                errors.setdefault('phone_number', []).append("Ensure this field has no more than 50 characters.")
+
+        emails = row.get('email_addresses', [])
+        if not emails:
+            errors['email_address'] = ["This field is required."]
+        for email in emails:
+            if email['type'] not in self.EMAIL_TYPES:
+                errors.setdefault('email_type', []).append('"%s" is not a valid choice.' % email['type'])
+            try:
+                if len(email['email_address']) > 255:
+                    raise ValidationError("Too long.")
+                validate_email(email['email_address'])
+            except ValidationError:
+                errors.setdefault('email_address', []).append("Enter a valid email address.")
+        if len(set(email['email_address'] for email in emails)) < len(emails):
+            errors.setdefault('email_address', []).append("Duplicate email address.")
+        return errors
@@ -0,0 +1,62 @@
+import csv
+
+from ..models import EmailAddress
+from ..models import PhoneNumber
+
+
+class CsvParser(object):
+    """
+    Parse contacts from CSV with a header row.
+
+    Basic fields use their API names (`first_name`, `last_name`, ...). Children
+    are read either from `phone_numbers`/`email_addresses` columns in the
+    export format (`type:value; type:value`) or from the single
+    `phone_number`/`phone_number_type` and `email_address`/`email_type`
+    columns the create api takes. Unknown columns are ignored.
+    """
+    BASIC_FIELDS = ('first_name', 'middle_name', 'last_name', 'nickname', 'company', 'designation')
+    SEPARATOR = ';'
+    PHONE_TYPES = frozenset(choice for choice, label in PhoneNumber.PHONE_NUMBER_TYPE_CHOICES)
+    EMAIL_TYPES = frozenset(choice for choice, label in EmailAddress.EMAIL_TYPE_CHOICES)
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def __iter__(self):
+        for record in csv.DictReader(self.stream):
+            yield self.parse_record(record)
+
+    def parse_record(self, record):
+        row = {}
+        for field in self.BASIC_FIELDS:
+            if record.get(field) is not None:
+                row[field] = record[field].strip()
+        row['phone_numbers'] = self.parse_children(record.get('phone_numbers'), self.PHONE_TYPES, 'phone_number')
+        row['email_addresses'] = self.parse_children(record.get('email_addresses'), self.EMAIL_TYPES,
+                                                     'email_address')
+        if (record.get('phone_number') or '').strip():
+            row['phone_numbers'].append({
+                'type': (record.get('phone_number_type') or '').strip() or 'other',
+                'phone_number': record['phone_number'].strip()
+            })
+        if (record.get('email_address') or '').strip():
+            row['email_addresses'].append({
+                'type': (record.get('email_type') or '').strip() or 'other',
+                'email_address': record['email_address'].strip()
+            })
+        return row
+
+    def parse_children(self, value, types, value_key):
+        children = []
+        if not value:
+            return children
+        for item in value.split(self.SEPARATOR):
+            item = item.strip()
+            if not item:
+                continue
+            child_type, separator, child_value = item.partition(':')
+            if separator and child_type.strip() in types:
+                children.append({'type': child_type.strip(), value_key: child_value.strip()})
+            else:
+                children.append({'type': 'other', value_key: item})
+        return children
@@ -0,0 +1,129 @@
+class VCardParser(object):
+    """
+    Parse contacts from vCard 2.1/3.0/4.0 text.
+
+    Reads N (or FN), NICKNAME, ORG, TITLE, TEL and EMAIL; other properties are
+    ignored. TEL and EMAIL types are mapped onto the contact book's choices
+    and fall back to `other`.
+    """
+    PHONE_TYPES = {
+        'cell': 'mobile',
+        'mobile': 'mobile',
+        'home': 'home',
+        'work': 'work',
+        'fax': 'fax',
+    }
+    EMAIL_TYPES = {
+        'home': 'home',
+        'work': 'work',
+    }
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def __iter__(self):
+        card = None
+        for name, params, value in self.properties():
+            if name == 'BEGIN' and value.upper() == 'VCARD':
+                card = {'phone_numbers': [], 'email_addresses': []}
+            elif name == 'END' and value.upper() == 'VCARD':
+                if card is not None:
+                    yield self.finish(card)
+                card = None
+            elif card is not None:
+                self.parse_property(card, name, params, value)
+
+    def lines(self):
+        """Unfold continuation lines (starting with a space or tab)."""
+        current = None
+        for line in self.stream:
+            line = line.rstrip('\r\n')
+            if line[:1] in (' ', '\t') and current is not None:
+                current += line[1:]
+                continue
+            if current is not None:
+                yield current
+            current = line
+        if current is not None:
+            yield current
+
+    def properties(self):
+        for line in self.lines():
+            head, separator, value = line.partition(':')
+            if not separator:
+                continue
+            parts = head.split(';')
+            name = parts[0].rsplit('.', 1)[-1].upper()
+            types = []
+            for param in parts[1:]:
+                key, has_value, param_value = param.partition('=')
+                if not has_value:
+                    # vCard 2.1 style bare types, e.g. TEL;CELL:
+                    types.append(key.lower())
+                elif key.upper() == 'TYPE':
+                    types.extend(item.strip('"').lower() for item in param_value.split(','))
+            yield name, types, value
+
+    @staticmethod
+    def unescape(value):
+        return value.replace('\\n', '\n').replace('\\N', '\n').replace('\\,', ',').replace('\\;', ';') \
+            .replace('\\\\', '\\').strip()
+
+    @classmethod
+    def components(cls, value):
+        parts = []
+        current = ''
+        escaped = False
+        for char in value:
+            if escaped:
+                current += '\\' + char
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == ';':
+                parts.append(cls.unescape(current))
+                current = ''
+            else:
+                current += char
+        parts.append(cls.unescape(current))
+        return parts
+
+    def parse_property(self, card, name, types, value):
+        if name == 'N':
+            parts = self.components(value) + [''] * 3
+            card['last_name'], card['first_name'], card['middle_name'] = parts[0], parts[1], parts[2]
+        elif name == 'FN':
+            card['fn'] = self.unescape(value)
+        elif name == 'NICKNAME':
+            card['nickname'] = self.unescape(value.split(',')[0])
+        elif name == 'ORG':
+            card['company'] = self.components(value)[0]
+        elif name == 'TITLE':
+            card['designation'] = self.unescape(value)
+        elif name == 'TEL':
+            card['phone_numbers'].append({
+                'type': self.map_type(types, self.PHONE_TYPES),
+                'phone_number': self.unescape(value)
+            })
+        elif name == 'EMAIL':
+            card['email_addresses'].append({
+                'type': self.map_type(types, self.EMAIL_TYPES),
+                'email_address': self.unescape(value)
+            })
+
+    @staticmethod
+    def map_type(types, mapping):
+        for card_type in types:
+            if card_type in mapping:
+                return mapping[card_type]
+        return 'other'
+
+    @staticmethod
+    def finish(card):
+        full_name = card.pop('fn', '')
+        if not card.get('first_name') and not card.get('last_name') and full_name:
+            names = full_name.split()
+            card['first_name'] = names[0]
+            card['last_name'] = names[-1] if len(names) > 1 else ''
+            card['middle_name'] = ' '.join(names[1:-1])
+        return card
@@ -0,0 +1,3 @@
+from .ContactImporter import ContactImporter
+from .CsvParser import CsvParser
+from .VCardParser import VCardParser
@@ -0,0 +1 @@
+from .ContactLoader import ContactLoader
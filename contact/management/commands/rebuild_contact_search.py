@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from contact.models import Contact
+from contact.search import ContactSearchIndex
+
+
+class Command(BaseCommand):
+    help = "Recreate the contact search index and its triggers if missing, and reindex every contact."
+
+    def handle(self, *args, **options):
+        connection = connections[Contact.objects.db]
+        if not ContactSearchIndex.is_supported(connection):
+            self.stdout.write("The %s backend searches without an index; nothing to rebuild." % connection.vendor)
+            return
+        ContactSearchIndex.install(connection)
+        self.stdout.write("Rebuilt the contact search index (%d contacts)." % Contact.objects.count())
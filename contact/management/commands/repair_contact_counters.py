@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from contact.models import ContactCounter
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-user contact counters from the contacts table."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, action='append', dest='users',
+                            help="Only repair this user id (can be repeated).")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            changed = ContactCounter.repair(users=options['users'])
+        self.stdout.write("Repaired %d contact counter(s)." % changed)
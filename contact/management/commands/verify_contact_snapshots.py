@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from django.db import connections, transaction
+
+from contact.models import Contact
+from contact.snapshots import ContactSnapshot
+
+
+class Command(BaseCommand):
+    help = "Compare contact snapshots with the contacts they were rendered from, and optionally rebuild them."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, action='append', dest='users',
+                            help="Only check the contacts of this user id (can be repeated).")
+        parser.add_argument('--rebuild', action='store_true',
+                            help="Rewrite the stale snapshots; without --user, also recreate missing triggers.")
+
+    def handle(self, *args, **options):
+        connection = connections[Contact.objects.db]
+        if not ContactSnapshot.is_supported(connection):
+            self.stdout.write("The %s backend renders contacts without snapshots; nothing to verify."
+                              % connection.vendor)
+            return
+        contacts = Contact.objects.all()
+        if options['users']:
+            contacts = contacts.filter(user__in=options['users'])
+        stale = list(ContactSnapshot.stale(contacts))
+        self.stdout.write("Found %d stale contact snapshot(s)." % len(stale))
+        if not options['rebuild']:
+            return
+        with transaction.atomic():
+            if options['users']:
+                ContactSnapshot.rebuild(connection, stale)
+            else:
+                ContactSnapshot.install(connection)
+        self.stdout.write("Rebuilt %d contact snapshot(s)." % len(stale))
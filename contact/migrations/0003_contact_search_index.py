@@ -0,0 +1,52 @@
+from django.db import migrations
+
+# A copy of what `ContactSearchIndex` installed when this migration was written; migrations mustn't follow the app's
+# code as it changes.
+TABLE = 'contacts_people_fts'
+COLUMNS = ('first_name', 'middle_name', 'last_name', 'nickname', 'company', 'designation')
+WEIGHTS = (10.0, 3.0, 10.0, 5.0, 2.0, 1.0)
+
+
+def triggers():
+    columns = ', '.join(COLUMNS)
+    delete = "INSERT INTO {table}({table}, rowid, {columns}) VALUES ('delete', old.id, {values});".format(
+        table=TABLE, columns=columns, values=', '.join('old.%s' % column for column in COLUMNS))
+    insert = "INSERT INTO {table}(rowid, {columns}) VALUES (new.id, {values});".format(
+        table=TABLE, columns=columns, values=', '.join('new.%s' % column for column in COLUMNS))
+    return [
+        "CREATE TRIGGER IF NOT EXISTS %s_insert AFTER INSERT ON contacts_people BEGIN %s END" % (TABLE, insert),
+        "CREATE TRIGGER IF NOT EXISTS %s_delete AFTER DELETE ON contacts_people BEGIN %s END" % (TABLE, delete),
+        "CREATE TRIGGER IF NOT EXISTS %s_update AFTER UPDATE OF %s ON contacts_people BEGIN %s %s END" % (
+            TABLE, columns, delete, insert),
+    ]
+
+
+def install(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute("CREATE VIRTUAL TABLE IF NOT EXISTS %s USING fts5(%s, content='contacts_people', "
+                          "content_rowid='id')" % (TABLE, ', '.join(COLUMNS)))
+    for statement in triggers():
+        schema_editor.execute(statement)
+    schema_editor.execute("INSERT INTO {0}({0}, rank) VALUES ('rank', 'bm25({1})')".format(
+        TABLE, ', '.join(map(str, WEIGHTS))))
+    schema_editor.execute("INSERT INTO {0}({0}) VALUES ('rebuild')".format(TABLE))
+
+
+def uninstall(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for suffix in ('insert', 'delete', 'update'):
+        schema_editor.execute("DROP TRIGGER IF EXISTS %s_%s" % (TABLE, suffix))
+    schema_editor.execute("DROP TABLE IF EXISTS %s" % TABLE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0002_contact_counter'),
+    ]
+
+    operations = [
+        migrations.RunPython(install, uninstall),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 2.2.4 on 2026-10-18 12:20
+
+import re
+
+from django.db import migrations, models
+
+
+def normalize(phone_number):
+    # A copy of PhoneNumber.normalize as it was when this migration was written.
+    digits = ''.join(re.findall(r'\d', phone_number or ''))
+    return digits, digits[::-1]
+
+
+def backfill_digits(apps, schema_editor):
+    PhoneNumber = apps.get_model('contact', 'PhoneNumber')
+    rows = PhoneNumber.objects.using(schema_editor.connection.alias).only('id', 'phone_number').order_by('id')
+    last = 0
+    while True:
+        batch = list(rows.filter(id__gt=last)[:2000])
+        if not batch:
+            break
+        for phone in batch:
+            phone.digits, phone.reversed_digits = normalize(phone.phone_number)
+        PhoneNumber.objects.using(schema_editor.connection.alias).bulk_update(batch, ['digits', 'reversed_digits'])
+        last = batch[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0003_contact_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='phonenumber',
+            name='digits',
+            field=models.CharField(blank=True, default='', max_length=50),
+        ),
+        migrations.AddField(
+            model_name='phonenumber',
+            name='reversed_digits',
+            field=models.CharField(blank=True, default='', max_length=50),
+        ),
+        migrations.RunPython(backfill_digits, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='phonenumber',
+            index=models.Index(fields=['reversed_digits', 'contact_object'], name='contacts_phone_reversed_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 2.2.4 on 2026-10-18 12:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0004_phone_number_digits'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['user', 'date_modified'], name='contacts_people_user_mod_idx'),
+        ),
+    ]
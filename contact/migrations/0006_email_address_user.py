@@ -0,0 +1,44 @@
+# Generated by Django 2.2.4 on 2026-10-18 13:01
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_users(apps, schema_editor):
+    """
+    Copy each address's owner from its contact. Where a book already holds
+    an address more than once, only the oldest row gets the owner, so the
+    unique constraint can be added; the others stay unconstrained.
+    """
+    Contact = apps.get_model('contact', 'Contact')
+    EmailAddress = apps.get_model('contact', 'EmailAddress')
+    emails = EmailAddress.objects.using(schema_editor.connection.alias)
+    emails.update(user_id=models.Subquery(
+        Contact.objects.filter(pk=models.OuterRef('contact_object_id')).values('user_id')[:1]))
+    duplicates = emails.filter(user__isnull=False).values('user_id', 'email_address').annotate(
+        first=models.Min('id'), rows=models.Count('id')).filter(rows__gt=1).order_by()
+    for duplicate in duplicates:
+        emails.filter(user_id=duplicate['user_id'], email_address=duplicate['email_address']).exclude(
+            id=duplicate['first']).update(user_id=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('contact', '0005_contact_user_modified_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emailaddress',
+            name='user',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='user_email_addresses', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(backfill_users, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='emailaddress',
+            constraint=models.UniqueConstraint(fields=('user', 'email_address'), name='contacts_email_user_unique'),
+        ),
+    ]
@@ -0,0 +1,100 @@
+# Generated by Django 2.2.4 on 2026-10-18 13:09
+
+from django.db import migrations, models
+
+# Copies of what `ContactSearchIndex` and `ContactSnapshot` installed when this migration was written; migrations
+# mustn't follow the app's code as it changes.
+SEARCH_TABLE = 'contacts_people_fts'
+SEARCH_COLUMNS = ('first_name', 'middle_name', 'last_name', 'nickname', 'company', 'designation')
+SNAPSHOT_TRIGGER = 'contacts_people_snapshot'
+SNAPSHOT_COLUMNS = ('first_name', 'last_name', 'middle_name', 'nickname', 'designation', 'company')
+SNAPSHOT_CHILDREN = (
+    ('phone_numbers', 'contacts_phone_numbers', 'phone_number'),
+    ('email_addresses', 'contacts_email_addresses', 'email_address'),
+)
+
+
+def search_triggers():
+    columns = ', '.join(SEARCH_COLUMNS)
+    delete = "INSERT INTO {table}({table}, rowid, {columns}) VALUES ('delete', old.id, {values});".format(
+        table=SEARCH_TABLE, columns=columns, values=', '.join('old.%s' % column for column in SEARCH_COLUMNS))
+    insert = "INSERT INTO {table}(rowid, {columns}) VALUES (new.id, {values});".format(
+        table=SEARCH_TABLE, columns=columns, values=', '.join('new.%s' % column for column in SEARCH_COLUMNS))
+    return [
+        "CREATE TRIGGER IF NOT EXISTS %s_insert AFTER INSERT ON contacts_people BEGIN %s END" % (SEARCH_TABLE, insert),
+        "CREATE TRIGGER IF NOT EXISTS %s_delete AFTER DELETE ON contacts_people BEGIN %s END" % (SEARCH_TABLE, delete),
+        "CREATE TRIGGER IF NOT EXISTS %s_update AFTER UPDATE OF %s ON contacts_people BEGIN %s %s END" % (
+            SEARCH_TABLE, columns, delete, insert),
+    ]
+
+
+def snapshot_refresh(condition):
+    values = ["'id', contacts_people.id"]
+    values += ["'{0}', contacts_people.{0}".format(column) for column in SNAPSHOT_COLUMNS]
+    for name, table, column in SNAPSHOT_CHILDREN:
+        values.append(
+            "'{name}', json((SELECT json_group_array(json_object('id', id, 'type', type, '{column}', {column})) "
+            "FROM (SELECT id, type, {column} FROM {table} "
+            "WHERE contact_object_id = contacts_people.id ORDER BY id)))".format(name=name, table=table, column=column))
+    return "UPDATE contacts_people SET snapshot = json_object(%s) WHERE %s;" % (', '.join(values), condition)
+
+
+def snapshot_triggers():
+    columns = ', '.join(SNAPSHOT_COLUMNS)
+    triggers = {
+        'insert': "AFTER INSERT ON contacts_people BEGIN %s END" % snapshot_refresh('id = new.id'),
+        'update': "AFTER UPDATE OF %s ON contacts_people BEGIN %s END" % (columns, snapshot_refresh('id = new.id')),
+    }
+    for name, table, column in SNAPSHOT_CHILDREN:
+        triggers['%s_insert' % name] = "AFTER INSERT ON %s BEGIN %s END" % (
+            table, snapshot_refresh('id = new.contact_object_id'))
+        triggers['%s_delete' % name] = "AFTER DELETE ON %s BEGIN %s END" % (
+            table, snapshot_refresh('id = old.contact_object_id'))
+        triggers['%s_update' % name] = "AFTER UPDATE OF type, %s, contact_object_id ON %s BEGIN %s END" % (
+            column, table, snapshot_refresh('id IN (old.contact_object_id, new.contact_object_id)'))
+    return triggers
+
+
+def install(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    # Adding the column rebuilt contacts_people without the search index triggers.
+    for statement in search_triggers():
+        schema_editor.execute(statement)
+    schema_editor.execute("INSERT INTO {0}({0}) VALUES ('rebuild')".format(SEARCH_TABLE))
+    for suffix, body in snapshot_triggers().items():
+        schema_editor.execute("CREATE TRIGGER IF NOT EXISTS %s_%s %s" % (SNAPSHOT_TRIGGER, suffix, body))
+    schema_editor.execute(snapshot_refresh('1'))
+
+
+def uninstall(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for suffix in snapshot_triggers():
+        schema_editor.execute("DROP TRIGGER IF EXISTS %s_%s" % (SNAPSHOT_TRIGGER, suffix))
+    schema_editor.execute("UPDATE contacts_people SET snapshot = NULL")
+
+
+def reinstall_search(apps, schema_editor):
+    # Removing the column rebuilt contacts_people again.
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for statement in search_triggers():
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0006_email_address_user'),
+    ]
+
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, reinstall_search),
+        migrations.AddField(
+            model_name='contact',
+            name='snapshot',
+            field=models.TextField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(install, uninstall),
+    ]
@@ -1,9 +1,13 @@
 from django.contrib.auth.models import User
 from django.db import models
+from django.utils import timezone
 
 
 class Contact(models.Model):
     """Contact model."""
+    REPRESENTATION_FIELDS = ('id', 'first_name', 'last_name', 'middle_name', 'nickname', 'designation', 'company')
+    REPRESENTATION_EXPANSIONS = ('phone_numbers', 'email_addresses')
+
     first_name = models.CharField(max_length=200)
     middle_name = models.CharField(max_length=200, blank=True, null=True)
     last_name = models.CharField(max_length=200)
@@ -13,27 +17,68 @@ class Contact(models.Model):
     user = models.ForeignKey(User, blank=True, null=True, related_name='user_contacts', on_delete=models.CASCADE)
     date_added = models.DateTimeField(auto_now_add=True)
     date_modified = models.DateTimeField(auto_now=True)
+    # Default representation as JSON, written by database triggers (see `ContactSnapshot`).
+    snapshot = models.TextField(blank=True, null=True, editable=False)
 
     class Meta:
         db_table = 'contacts_people'
         app_label = 'contact'
+        indexes = [
+            # Serves the list validator: MAX(date_modified) WHERE user_id = %s.
+            models.Index(fields=['user', 'date_modified'], name='contacts_people_user_mod_idx'),
+        ]
 
     def __str__(self):
         return self.fullname
 
+    def save(self, force_insert=False, force_update=False, using=None, update_fields=None):
+        # The snapshot belongs to the triggers; a full save would write back the copy loaded with the row.
+        if update_fields is None and not force_insert and not self._state.adding:
+            update_fields = [field.name for field in self._meta.concrete_fields
+                             if not field.primary_key and field.name != 'snapshot']
+        super().save(force_insert, force_update, using, update_fields)
+
+    @classmethod
+    def touch(cls, *pks):
+        """Bump `date_modified` of contacts whose phone numbers or email addresses changed."""
+        cls.objects.filter(pk__in=pks).update(date_modified=timezone.now())
+
+    def assign(self, values):
+        """Set the fields in `values` and return the names of those whose value changed."""
+        changed = []
+        for field, value in values.items():
+            if getattr(self, field) != value:
+                setattr(self, field, value)
+                changed.append(field)
+        return changed
+
+    def save_changes(self, changed):
+        """
+        Write only the `changed` columns (and `date_modified`); with nothing
+        changed the contact isn't written at all. Returns whether it was.
+        """
+        if not changed:
+            return False
+        self.save(update_fields=list(changed) + ['date_modified'])
+        return True
+
     @property
     def fullname(self):
         return "%s %s %s" % (self.first_name, self.middle_name, self.last_name)
 
-    def to_representation(self):
-        return {
-            'id': self.id,
-            'first_name': self.first_name,
-            'last_name': self.last_name,
-            'middle_name': self.middle_name,
-            'nickname': self.nickname,
-            'designation': self.designation,
-            'company': self.company,
-            'phone_numbers': [phone.to_representation() for phone in self.contact_phone_number.all()],
-            'email_addresses': [email.to_representation() for email in self.contact_email_address.all()]
-        }
+    def to_representation(self, fields=None, expand=None):
+        """
+        `fields` limits the basic fields and `expand` the child lists that are
+        rendered; None renders all of them.
+        """
+        representation = {}
+        for field in self.REPRESENTATION_FIELDS:
+            if fields is None or field in fields:
+                representation[field] = getattr(self, field)
+        if expand is None or 'phone_numbers' in expand:
+            representation['phone_numbers'] = [phone.to_representation() for phone in self.contact_phone_number.all()]
+        if expand is None or 'email_addresses' in expand:
+            representation['email_addresses'] = [
+                email.to_representation() for email in self.contact_email_address.all()
+            ]
+        return representation
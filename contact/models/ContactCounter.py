@@ -0,0 +1,64 @@
+from django.contrib.auth.models import User
+from django.db import models
+
+from .Contact import Contact
+
+
+class ContactCounter(models.Model):
+    """
+    Denormalized number of contacts per user.
+
+    Kept exact by the contact create and delete paths, which adjust it in the
+    same transaction as the write. Rows are created lazily from a COUNT(*) the
+    first time they're needed, and `repair_contact_counters` recomputes them
+    if contacts were written some other way.
+    """
+    user = models.OneToOneField(User, primary_key=True, related_name='contact_counter', on_delete=models.CASCADE)
+    total = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'contacts_counters'
+        app_label = 'contact'
+
+    def __str__(self):
+        return "%s (%s)" % (self.user_id, self.total)
+
+    @classmethod
+    def adjust(cls, user, delta):
+        """
+        Add `delta` to the user's counter. Call it inside the transaction
+        that created or deleted the contacts, after the write.
+        """
+        updated = cls.objects.filter(user=user).update(total=models.F('total') + delta)
+        if not updated:
+            # The COUNT(*) already sees the write, so there is nothing to add.
+            cls.objects.get_or_create(user=user, defaults={'total': Contact.objects.filter(user=user).count()})
+
+    @classmethod
+    def total_for(cls, user):
+        try:
+            return cls.objects.values_list('total', flat=True).get(user=user)
+        except cls.DoesNotExist:
+            counter, created = cls.objects.get_or_create(
+                user=user, defaults={'total': Contact.objects.filter(user=user).count()})
+            return counter.total
+
+    @classmethod
+    def repair(cls, users=None):
+        """Recompute counters from the contacts table. Returns the number of counters changed."""
+        contacts = Contact.objects.filter(user__isnull=False)
+        counters = cls.objects.all()
+        if users is not None:
+            contacts = contacts.filter(user__in=users)
+            counters = counters.filter(user__in=users)
+        actual = dict(contacts.order_by().values_list('user').annotate(total=models.Count('id')))
+        stored = dict(counters.values_list('user', 'total'))
+
+        changed = 0
+        for user_id in set(actual) | set(stored):
+            total = actual.get(user_id, 0)
+            if stored.get(user_id) == total:
+                continue
+            cls.objects.update_or_create(user_id=user_id, defaults={'total': total})
+            changed += 1
+        return changed
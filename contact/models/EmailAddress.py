@@ -1,9 +1,14 @@
+from django.contrib.auth.models import User
 from django.db import models
 
 from .Contact import Contact
 
 
 class EmailAddress(models.Model):
+    """
+    Email address of a contact. `user` repeats the contact's owner so the
+    database can hold each address to one contact per book.
+    """
     EMAIL_TYPE_CHOICES = (
         ('home', 'Home'),
         ('work', 'Work'),
@@ -12,6 +17,8 @@ class EmailAddress(models.Model):
     type = models.CharField(max_length=10, choices=EMAIL_TYPE_CHOICES)
     contact_object = models.ForeignKey(Contact, related_name='contact_email_address', on_delete=models.CASCADE)
     email_address = models.EmailField(max_length=255, db_index=True)
+    user = models.ForeignKey(User, blank=True, null=True, related_name='user_email_addresses',
+                             on_delete=models.CASCADE)
     date_added = models.DateTimeField(auto_now_add=True)
     date_modified = models.DateTimeField(auto_now=True)
 
@@ -22,6 +29,29 @@ class EmailAddress(models.Model):
         db_table = 'contacts_email_addresses'
         app_label = 'contact'
         unique_together = (('contact_object', 'email_address'),)
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'email_address'], name='contacts_email_user_unique'),
+        ]
+
+    @staticmethod
+    def is_duplicate(error):
+        """
+        Whether the `IntegrityError` `error` was raised for an address already
+        in the book: by `contacts_email_user_unique` or, as the contact is in
+        the book too, by the per-contact unique index.
+        """
+        message = str(error)
+        # PostgreSQL and MySQL name the constraint, SQLite lists its columns.
+        return any(marker in message for marker in (
+            'contacts_email_user_unique',
+            'contacts_email_addresses.user_id, contacts_email_addresses.email_address',
+            'contacts_email_addresses.contact_object_id, contacts_email_addresses.email_address',
+        ))
+
+    def save(self, *args, **kwargs):
+        if self.user_id is None:
+            self.user_id = self.contact_object.user_id
+        super().save(*args, **kwargs)
 
     def to_representation(self):
         return {
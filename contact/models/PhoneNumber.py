@@ -1,3 +1,5 @@
+import re
+
 from django.db import models
 
 from .Contact import Contact
@@ -12,9 +14,18 @@ class PhoneNumber(models.Model):
         ('work', 'Work'),
         ('other', 'Other')
     )
+    # Shortest number matched as the tail of a longer one, see `matching`.
+    MIN_MATCH_DIGITS = 7
+    # Shortest `?phone=` lookup, which matches numbers ending with it.
+    MIN_LOOKUP_DIGITS = 4
+
     type = models.CharField(max_length=10, choices=PHONE_NUMBER_TYPE_CHOICES)
     contact_object = models.ForeignKey(Contact, related_name='contact_phone_number', on_delete=models.CASCADE)
     phone_number = models.CharField(max_length=50)
+    # Digits of `phone_number` only, e.g. '15550100100' for '+1 (555) 010-0100'.
+    digits = models.CharField(max_length=50, blank=True, default='')
+    # `digits` reversed, so numbers ending with some digits are a range of the index.
+    reversed_digits = models.CharField(max_length=50, blank=True, default='')
     date_added = models.DateTimeField(auto_now_add=True)
     date_modified = models.DateTimeField(auto_now=True)
 
@@ -24,6 +35,35 @@ class PhoneNumber(models.Model):
     class Meta:
         db_table = 'contacts_phone_numbers'
         app_label = 'contact'
+        indexes = [
+            models.Index(fields=['reversed_digits', 'contact_object'], name='contacts_phone_reversed_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.digits, self.reversed_digits = self.normalize(self.phone_number)
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def normalize(phone_number):
+        """Return the digits of `phone_number` and the same reversed."""
+        digits = ''.join(re.findall(r'\d', phone_number or ''))
+        return digits, digits[::-1]
+
+    @classmethod
+    def matching(cls, phone_number):
+        """
+        Phone numbers that end with the digits of `phone_number`, or whose own
+        digits (at least `MIN_MATCH_DIGITS` of them) it ends with, so '555 0100',
+        '+1 555 0100' and '0100' find each other. Both are seeks on the
+        reversed digits index, whatever the size of the table.
+        """
+        digits, reversed_digits = cls.normalize(phone_number)
+        # Digits sort before ':', so this range is every value starting with reversed_digits.
+        condition = models.Q(reversed_digits__gte=reversed_digits, reversed_digits__lt=reversed_digits + ':')
+        tails = [reversed_digits[:length] for length in range(cls.MIN_MATCH_DIGITS, len(reversed_digits))]
+        if tails:
+            condition |= models.Q(reversed_digits__in=tails)
+        return cls.objects.filter(condition)
 
     def to_representation(self):
         return {
@@ -1,3 +1,4 @@
 from .Contact import Contact
+from .ContactCounter import ContactCounter
 from .EmailAddress import EmailAddress
 from .PhoneNumber import PhoneNumber
@@ -0,0 +1,14 @@
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+
+class CountedPaginator(Paginator):
+    """Paginator that is handed the total up front instead of running COUNT(*)."""
+
+    def __init__(self, object_list, per_page, count, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self._count = count
+
+    @cached_property
+    def count(self):
+        return self._count
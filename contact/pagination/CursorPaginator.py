@@ -0,0 +1,55 @@
+import base64
+import binascii
+import json
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class CursorPaginator(object):
+    """
+    Keyset paginator over a queryset ordered by a single unique, ascending key.
+
+    Instead of OFFSET and COUNT(*), each page seeks past the last seen key
+    (`WHERE key > last ORDER BY key LIMIT n`), so every page costs the same
+    indexed range scan no matter how deep it is.
+    """
+
+    def __init__(self, queryset, per_page, ordering='id'):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = ordering
+
+    @staticmethod
+    def encode_cursor(position):
+        raw = json.dumps({'k': position}, separators=(',', ':')).encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def decode_cursor(cursor):
+        padded = cursor + '=' * (-len(cursor) % 4)
+        try:
+            position = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))['k']
+        except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError):
+            raise InvalidCursor(cursor)
+        if not isinstance(position, int) or isinstance(position, bool):
+            raise InvalidCursor(cursor)
+        return position
+
+    def page(self, cursor=None):
+        """
+        Return `(objects, next_cursor)` for the page after `cursor`.
+        `next_cursor` is None on the last page.
+        """
+        queryset = self.queryset
+        if cursor:
+            position = self.decode_cursor(cursor)
+            queryset = queryset.filter(**{'%s__gt' % self.ordering: position})
+        # Fetch one extra row to learn whether another page exists.
+        objects = list(queryset.order_by(self.ordering)[:self.per_page + 1])
+        next_cursor = None
+        if len(objects) > self.per_page:
+            objects = objects[:self.per_page]
+            next_cursor = self.encode_cursor(getattr(objects[-1], self.ordering))
+        return objects, next_cursor
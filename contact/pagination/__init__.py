@@ -0,0 +1,2 @@
+from .CountedPaginator import CountedPaginator
+from .CursorPaginator import CursorPaginator, InvalidCursor
@@ -0,0 +1,83 @@
+import json
+import re
+from uuid import uuid4
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+from .JSONFragment import JSONFragment
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FragmentEncoder(encoders.JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, JSONFragment):
+            return obj.load()
+        return super().default(obj)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    `JSONRenderer` that encodes with orjson when it's installed and writes
+    `JSONFragment` values into the output without decoding them.
+
+    Compact output is encoded in one pass with each fragment replaced by a
+    placeholder string, which is then swapped for the fragment's bytes; the
+    placeholders carry a random token per render, so no string value can
+    pass for one. Top-level lists made only of fragments are joined into one
+    first. Types neither encoder knows, including datetimes, go
+    through the rest_framework encoder, so values render as before. Indented
+    output (e.g. for the browsable api) decodes the fragments and falls back
+    to `JSONRenderer`.
+    """
+    encoder_class = FragmentEncoder
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if isinstance(data, JSONFragment):
+            return self.escape(data)
+
+        if isinstance(data, dict):
+            data = {key: self.join(value) for key, value in data.items()}
+        token = uuid4().hex
+        fragments = []
+        fallback = self.encoder_class().default
+
+        def default(obj):
+            if isinstance(obj, JSONFragment):
+                fragments.append(obj)
+                return '%s:%d' % (token, len(fragments) - 1)
+            return fallback(obj)
+
+        ret = self.dumps(data, default)
+        if fragments:
+            placeholder = re.compile(('"%s:(\\d+)"' % token).encode())
+            ret = placeholder.sub(lambda match: fragments[int(match.group(1))], ret)
+        return self.escape(ret)
+
+    @staticmethod
+    def join(value):
+        """Turn a list of fragments, e.g. a page of contacts, into one fragment."""
+        if isinstance(value, (list, tuple)) and value and all(isinstance(item, JSONFragment) for item in value):
+            return JSONFragment(b'[' + b','.join(value) + b']')
+        return value
+
+    def dumps(self, data, default):
+        if orjson is not None and not self.ensure_ascii:
+            return orjson.dumps(data, default=default,
+                                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS)
+        return json.dumps(data, default=default, ensure_ascii=self.ensure_ascii, allow_nan=not self.strict,
+                          separators=(',', ':')).encode()
+
+    @staticmethod
+    def escape(ret):
+        # Like `JSONRenderer`, keep the output a strict javascript subset.
+        return bytes(ret).replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
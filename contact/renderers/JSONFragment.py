@@ -0,0 +1,15 @@
+import json
+
+
+class JSONFragment(bytes):
+    """
+    Already encoded JSON (UTF-8), e.g. a contact snapshot or a rendered page,
+    that `FastJSONRenderer` writes into responses as it is.
+    """
+
+    @classmethod
+    def of(cls, text):
+        return cls(text.encode())
+
+    def load(self):
+        return json.loads(self)
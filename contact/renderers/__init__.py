@@ -0,0 +1,2 @@
+from .JSONFragment import JSONFragment
+from .FastJSONRenderer import FastJSONRenderer
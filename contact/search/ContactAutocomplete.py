@@ -0,0 +1,50 @@
+from collections import OrderedDict
+from threading import Lock
+
+from ..caches import BookVersion
+from ..models import Contact
+from .ContactPrefixIndex import ContactPrefixIndex
+
+
+class ContactAutocomplete(object):
+    """
+    Name suggestions from in-process `ContactPrefixIndex`es.
+
+    A user's index is built from the database on their first lookup and the
+    `max_users` most recently used indexes are kept. Each index remembers the
+    `BookVersion` it was built at and is rebuilt in full once the version
+    changed, so a write to the book in any worker reaches the indexes of all
+    of them. The version doesn't say which contacts changed, and rebuilding
+    is one query over the user's names, so indexes aren't patched in place.
+    """
+    max_users = 256
+    indexes = OrderedDict()
+    lock = Lock()
+
+    @classmethod
+    def suggest(cls, user, text, limit=10):
+        # Read before the rows, so an index missing a concurrent write is stored under the old version.
+        version = BookVersion.get(user.pk)
+        with cls.lock:
+            loaded = cls.indexes.get(user.pk)
+            if loaded is not None and loaded[0] == version:
+                cls.indexes.move_to_end(user.pk)
+                return loaded[1].suggest(text, limit)
+        rows = Contact.objects.filter(user=user).values_list('id', *ContactPrefixIndex.columns)
+        index = ContactPrefixIndex(rows.iterator())
+        with cls.lock:
+            loaded = cls.indexes.get(user.pk)
+            if loaded is not None and loaded[0] == version:
+                # Another request built it meanwhile; keep theirs.
+                index = loaded[1]
+            else:
+                cls.indexes[user.pk] = (version, index)
+            cls.indexes.move_to_end(user.pk)
+            while len(cls.indexes) > cls.max_users:
+                cls.indexes.popitem(last=False)
+        return index.suggest(text, limit)
+
+    @classmethod
+    def clear(cls):
+        with cls.lock:
+            cls.indexes.clear()
@@ -0,0 +1,69 @@
+import re
+import unicodedata
+from bisect import bisect_left
+
+
+class ContactPrefixIndex(object):
+    """
+    Prefix index over the first name, last name and nickname of one user's
+    contacts, kept as two parallel sorted arrays of normalized words and
+    contact ids, so a lookup is a binary search plus a walk over the matches.
+    """
+    columns = ('first_name', 'last_name', 'nickname')
+    word_pattern = re.compile(r'[^\W_]+')
+
+    def __init__(self, rows=()):
+        """`rows` are `(id, first_name, last_name, nickname)` tuples."""
+        self.contacts = {}
+        entries = []
+        for row in rows:
+            self.contacts[row[0]] = row[1:]
+            entries.extend((word, row[0]) for word in self.words(row[1:]))
+        entries.sort()
+        self.keys = [key for key, pk in entries]
+        self.ids = [pk for key, pk in entries]
+
+    def __len__(self):
+        return len(self.contacts)
+
+    @classmethod
+    def normalize(cls, text):
+        """Lower case words with diacritics removed, so 'Zoë' is found by 'zoe'."""
+        text = text or ''
+        if not text.isascii():
+            text = unicodedata.normalize('NFKD', text)
+            text = ''.join(char for char in text if not unicodedata.combining(char))
+        return cls.word_pattern.findall(text.casefold())
+
+    @classmethod
+    def words(cls, values):
+        return set(cls.normalize(' '.join(value for value in values if value)))
+
+    def suggest(self, text, limit):
+        """
+        Return up to `limit` `(id, first_name, last_name, nickname)` for the
+        contacts with a word starting with each word of `text`, ordered by
+        the word matching the first one.
+        """
+        terms = self.normalize(text)
+        if not terms:
+            return []
+        first, rest = terms[0], terms[1:]
+        seen = set()
+        suggestions = []
+        position = bisect_left(self.keys, first)
+        while position < len(self.keys) and self.keys[position].startswith(first):
+            pk = self.ids[position]
+            position += 1
+            if pk in seen:
+                continue
+            seen.add(pk)
+            values = self.contacts[pk]
+            if rest:
+                words = self.words(values)
+                if not all(any(word.startswith(term) for word in words) for term in rest):
+                    continue
+            suggestions.append((pk,) + values)
+            if len(suggestions) >= limit:
+                break
+        return suggestions
@@ -0,0 +1,126 @@
+import re
+
+from django.db import connections
+from django.db.models import Q
+
+from ..models import Contact
+
+
+class ContactSearchIndex(object):
+    """
+    Full-text search over the text columns of `Contact`.
+
+    On SQLite the columns are indexed by an FTS5 table using `contacts_people`
+    as its external content, so only the index is stored. Triggers on
+    `contacts_people` keep it in sync with every write, including bulk inserts,
+    `bulk_update` and queryset deletes that bypass model signals. Results are
+    ranked by bm25 with names weighted above company and designation, and
+    every search term matches as a prefix. Other databases fall back to
+    `icontains` filters.
+
+    Migrations that rebuild `contacts_people` (SQLite does that for most
+    schema changes) drop its triggers; `ensure` puts them back after every
+    `migrate` (see `contact.signals`).
+    """
+    table = 'contacts_people_fts'
+    columns = ('first_name', 'middle_name', 'last_name', 'nickname', 'company', 'designation')
+    # bm25 weights, in the order of `columns`.
+    weights = (10.0, 3.0, 10.0, 5.0, 2.0, 1.0)
+
+    @classmethod
+    def is_supported(cls, connection):
+        return connection.vendor == 'sqlite'
+
+    @classmethod
+    def names(cls):
+        """The index table and its triggers."""
+        return [cls.table] + ['%s_%s' % (cls.table, suffix) for suffix in ('insert', 'delete', 'update')]
+
+    @classmethod
+    def ensure(cls, connection):
+        """Install the index if it or any of its triggers is missing."""
+        if not cls.is_supported(connection):
+            return
+        names = cls.names()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE name IN (%s)" % ', '.join(['%s'] * len(names)), names)
+            if len(cursor.fetchall()) < len(names):
+                cls.install(connection)
+
+    @classmethod
+    def install(cls, connection):
+        """Create the index and its triggers if they are missing and index the existing contacts."""
+        if not cls.is_supported(connection):
+            return
+        columns = ', '.join(cls.columns)
+        new_values = ', '.join('new.%s' % column for column in cls.columns)
+        old_values = ', '.join('old.%s' % column for column in cls.columns)
+        delete = "INSERT INTO {table}({table}, rowid, {columns}) VALUES ('delete', old.id, {old_values});"
+        insert = "INSERT INTO {table}(rowid, {columns}) VALUES (new.id, {new_values});"
+        statements = [
+            "CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5("
+            "{columns}, content='contacts_people', content_rowid='id')",
+            "CREATE TRIGGER IF NOT EXISTS {table}_insert AFTER INSERT ON contacts_people BEGIN %s END" % insert,
+            "CREATE TRIGGER IF NOT EXISTS {table}_delete AFTER DELETE ON contacts_people BEGIN %s END" % delete,
+            "CREATE TRIGGER IF NOT EXISTS {table}_update AFTER UPDATE OF {columns} ON contacts_people "
+            "BEGIN %s %s END" % (delete, insert),
+            "INSERT INTO {table}({table}, rank) VALUES ('rank', 'bm25(%s)')" % ', '.join(map(str, cls.weights)),
+        ]
+        with connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement.format(table=cls.table, columns=columns,
+                                                new_values=new_values, old_values=old_values))
+        cls.rebuild(connection)
+
+    @classmethod
+    def uninstall(cls, connection):
+        if not cls.is_supported(connection):
+            return
+        with connection.cursor() as cursor:
+            for name in cls.names()[1:]:
+                cursor.execute("DROP TRIGGER IF EXISTS %s" % name)
+            cursor.execute("DROP TABLE IF EXISTS %s" % cls.table)
+
+    @classmethod
+    def rebuild(cls, connection=None):
+        """Reindex every contact, e.g. after rows were written with the triggers missing."""
+        connection = connection or connections[Contact.objects.db]
+        if not cls.is_supported(connection):
+            return
+        with connection.cursor() as cursor:
+            cursor.execute("INSERT INTO {table}({table}) VALUES ('rebuild')".format(table=cls.table))
+
+    @staticmethod
+    def terms(text):
+        return re.findall(r'[^\W_]+', text or '')
+
+    @classmethod
+    def match_expression(cls, terms):
+        """AND the terms together, each as a quoted prefix query, so user input can't inject FTS syntax."""
+        return ' '.join('"%s"*' % term for term in terms)
+
+    @classmethod
+    def search(cls, queryset, text):
+        """Filter `queryset` to contacts matching every term of `text`, best matches first."""
+        terms = cls.terms(text)
+        if not terms:
+            return queryset.none()
+        if not cls.is_supported(connections[queryset.db]):
+            for term in terms:
+                queryset = queryset.filter(cls.icontains(term))
+            return queryset.order_by('id')
+        # The unary + keeps the planner from probing the index once per contact
+        # of the user with a rowid constraint; the MATCH has to drive the join.
+        return queryset.extra(
+            tables=[cls.table],
+            where=['+%s.rowid = contacts_people.id' % cls.table, '%s MATCH %%s' % cls.table],
+            params=[cls.match_expression(terms)],
+            select={'search_rank': '%s.rank' % cls.table},
+        ).order_by('search_rank', 'id')
+
+    @classmethod
+    def icontains(cls, term):
+        condition = Q()
+        for column in cls.columns:
+            condition |= Q(**{'%s__icontains' % column: term})
+        return condition
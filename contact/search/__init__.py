@@ -0,0 +1,3 @@
+from .ContactAutocomplete import ContactAutocomplete
+from .ContactPrefixIndex import ContactPrefixIndex
+from .ContactSearchIndex import ContactSearchIndex
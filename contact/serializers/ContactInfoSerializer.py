@@ -14,23 +14,29 @@ class ContactInfoSerializer(serializers.ModelSerializer):
     def __init__(self, instance, data=None, user=None, many=False):
         super().__init__(instance=instance, data=data, many=many)
         self.user = user
+        # Fields the last update changed; empty when it didn't write anything.
+        self.changed = []
 
     def update(self, instance, validated_data):
-        contact = instance
+        self.changed = self.assign(instance, validated_data)
+        instance.save_changes(self.changed)
+        return instance
+
+    @staticmethod
+    def assign(contact, validated_data):
+        """
+        Copy the fields of a basic update onto `contact` without saving it.
+        Returns the names of the fields that changed.
+        """
+        values = {}
         if validated_data.get('first_name'):
-            contact.first_name = validated_data['first_name']
+            values['first_name'] = validated_data['first_name']
         if validated_data.get('last_name'):
-            contact.last_name = validated_data['last_name']
-        if 'middle_name' in validated_data:
-            contact.middle_name = validated_data['middle_name'] if validated_data['middle_name'] else ""
-        if 'nickname' in validated_data:
-            contact.nickname = validated_data['nickname'] if validated_data['nickname'] else ""
-        if 'company' in validated_data:
-            contact.company = validated_data['company'] if validated_data['company'] else ""
-        if 'designation' in validated_data:
-            contact.designation = validated_data['designation'] if validated_data['designation'] else ""
-        contact.save()
-        return contact
+            values['last_name'] = validated_data['last_name']
+        for field in ('middle_name', 'nickname', 'company', 'designation'):
+            if field in validated_data:
+                values[field] = validated_data[field] if validated_data[field] else ""
+        return contact.assign(values)
 
     def to_representation(self, instance):
         return {
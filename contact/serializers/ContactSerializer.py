@@ -1,11 +1,24 @@
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 
+from ..caches import ContactChanges
+from ..children import ContactChildren
+from ..loaders import ContactLoader
 from ..models import Contact
+from ..models import ContactCounter
 from ..models import EmailAddress
 from ..models import PhoneNumber
+from .EmailAddressSerializer import EmailAddressSerializer
+from .PhoneNumberSerializer import PhoneNumberSerializer
 
 
 class ContactSerializer(serializers.ModelSerializer):
+    """
+    Creates contacts with one phone number and email address, and updates
+    them either by appending one of each or, given `phone_numbers` and/or
+    `email_addresses` lists, by replacing the stored ones with the lists
+    (see `ContactChildren`).
+    """
     first_name = serializers.CharField(required=True, max_length=200)
     middle_name = serializers.CharField(required=False, allow_blank=True, max_length=200)
     last_name = serializers.CharField(required=True, max_length=200)
@@ -14,12 +27,38 @@ class ContactSerializer(serializers.ModelSerializer):
     designation = serializers.CharField(required=False, allow_blank=True, max_length=200)
     phone_number_type = serializers.ChoiceField(required=False, choices=PhoneNumber.PHONE_NUMBER_TYPE_CHOICES)
     phone_number = serializers.CharField(required=False, max_length=50)
-    email_type = serializers.ChoiceField(required=True, choices=EmailAddress.EMAIL_TYPE_CHOICES)
-    email_address = serializers.EmailField(required=True, max_length=255)
+    email_type = serializers.ChoiceField(required=False, choices=EmailAddress.EMAIL_TYPE_CHOICES)
+    email_address = serializers.EmailField(required=False, max_length=255)
+    phone_numbers = PhoneNumberSerializer(required=False, many=True)
+    email_addresses = EmailAddressSerializer(required=False, many=True)
 
     def __init__(self, instance=None, data=None, user=None, many=False):
         super().__init__(instance=instance, data=data, many=many)
         self.user = user
+        # Fields the last update changed; empty when it didn't write anything.
+        self.changed = []
+
+    def validate(self, attrs):
+        errors = {}
+        for single, plural in (('phone_number', 'phone_numbers'), ('email_address', 'email_addresses')):
+            if plural not in attrs:
+                continue
+            if self.instance is None:
+                errors[plural] = ["Lists are only accepted when updating a contact."]
+            elif single in attrs:
+                errors[plural] = ["Send either %s or %s." % (single, plural)]
+        if 'email_addresses' in attrs:
+            emails = [item['email_address'] for item in attrs['email_addresses']]
+            if len(set(emails)) != len(emails):
+                errors['email_addresses'] = ["A contact can't have the same email address twice."]
+        elif self.instance is None or 'phone_numbers' not in attrs:
+            # Without a list, the single email is required as before.
+            for field in ('email_type', 'email_address'):
+                if field not in attrs:
+                    errors[field] = [serializers.Field.default_error_messages['required']]
+        if errors:
+            raise serializers.ValidationError(errors)
+        return attrs
 
     def create(self, validated_data):
         user = self.user
@@ -44,23 +83,33 @@ class ContactSerializer(serializers.ModelSerializer):
         except KeyError:
             email_type = 'other'
 
-        validation_error = {}
-        if user.user_contacts.filter(contact_email_address__email_address=email_address).exists():
-            validation_error['email'] = [" Contact already exists. "]
-
-        if validation_error:
-            raise serializers.ValidationError(validation_error)
-
         validated_data['user'] = user
-        contact = Contact.objects.create(**validated_data)
-        if email_address:
-            EmailAddress.objects.create(contact_object=contact, email_address=email_address, type=email_type)
-        if phone_number:
-            PhoneNumber.objects.create(contact_object=contact, phone_number=phone_number, type=phone_number_type)
+        email_addresses = []
+        phone_numbers = []
+        try:
+            # The (user, email_address) constraint turns away an address already in the book, even from a
+            # concurrent create, and the whole contact is rolled back with it.
+            with transaction.atomic(), ContactChanges.collect():
+                contact = Contact.objects.create(**validated_data)
+                if email_address:
+                    email_addresses.append(EmailAddress.objects.create(
+                        contact_object=contact, user=user, email_address=email_address, type=email_type))
+                if phone_number:
+                    phone_numbers.append(PhoneNumber.objects.create(contact_object=contact, phone_number=phone_number,
+                                                                    type=phone_number_type))
+                ContactCounter.adjust(user, 1)
+        except IntegrityError as e:
+            if not EmailAddress.is_duplicate(e):
+                raise
+            raise serializers.ValidationError({'email': [" Contact already exists. "]})
+        # A new contact has exactly these children; rendering it needs no extra queries.
+        ContactLoader.prime(contact, phone_numbers, email_addresses)
         return contact
 
     def update(self, instance, validated_data):
         user = self.user
+        phone_numbers = validated_data.pop('phone_numbers', None)
+        email_addresses = validated_data.pop('email_addresses', None)
         try:
             phone_number = validated_data.pop('phone_number')
         except KeyError:
@@ -84,40 +133,52 @@ class ContactSerializer(serializers.ModelSerializer):
         contact = instance
         validation_error = {}
 
-        if user.user_contacts.filter(contact_email_address__email_address=email_address).exists():
+        if email_addresses is not None:
+            # A contact may keep its own addresses, but not take one from another contact.
+            if ContactChildren.taken_emails(contact, [item['email_address'] for item in email_addresses]):
+                validation_error['email'] = [" Contact already exists. "]
+        elif email_address and EmailAddress.objects.filter(user=user, email_address=email_address).exists():
             validation_error['email'] = [" Contact already exists. "]
 
         if validation_error:
             raise serializers.ValidationError(validation_error)
 
-        contact.first_name = validated_data['first_name']
-        contact.last_name = validated_data['last_name']
-        contact.middle_name = validated_data['middle_name']
-        contact.nickname = validated_data['nickname']
-        contact.company = validated_data['company']
-        contact.designation = validated_data['designation']
-        contact.save()
-
-        if email_address:
-            EmailAddress.objects.create(contact_object=contact, email_address=email_address, type=email_type)
-        if phone_number:
-            PhoneNumber.objects.create(contact_object=contact, phone_number=phone_number, type=phone_number_type)
+        try:
+            with transaction.atomic(), ContactChanges.collect():
+                self.changed = self.assign(contact, validated_data)
+                contact.save_changes(self.changed)
+                self.changed += ContactChildren.replace(contact, phone_numbers=phone_numbers,
+                                                        email_addresses=email_addresses)
+
+                if email_address:
+                    EmailAddress.objects.create(contact_object=contact, user=user, email_address=email_address,
+                                                type=email_type)
+                    self.changed.append('email_addresses')
+                if phone_number:
+                    PhoneNumber.objects.create(contact_object=contact, phone_number=phone_number,
+                                               type=phone_number_type)
+                    self.changed.append('phone_numbers')
+        except IntegrityError as e:
+            if not EmailAddress.is_duplicate(e):
+                raise
+            # The checks above lost a race with another write to the book.
+            raise serializers.ValidationError({'email': [" Contact already exists. "]})
         return contact
 
+    @staticmethod
+    def assign(contact, validated_data):
+        """
+        Copy the basic fields of a full update onto `contact` without saving
+        it. Returns the names of the fields that changed.
+        """
+        fields = ('first_name', 'last_name', 'middle_name', 'nickname', 'company', 'designation')
+        return contact.assign(dict((field, validated_data[field]) for field in fields if field in validated_data))
+
     def to_representation(self, instance):
-        return {
-            'id': instance.id,
-            'first_name': instance.first_name,
-            'last_name': instance.last_name,
-            'middle_name': instance.middle_name,
-            'nickname': instance.nickname,
-            'designation': instance.designation,
-            'company': instance.company,
-            'phone_numbers': [phone.to_representation() for phone in instance.contact_phone_number.all()],
-            'email_addresses': [email.to_representation() for email in instance.contact_email_address.all()]
-        }
+        ContactLoader.load([instance])
+        return instance.to_representation()
 
     class Meta:
         model = Contact
         fields = ('first_name', 'middle_name', 'last_name', 'nickname', 'company', 'designation', 'phone_number_type',
-                  'phone_number', 'email_type', 'email_address')
+                  'phone_number', 'email_type', 'email_address', 'phone_numbers', 'email_addresses')
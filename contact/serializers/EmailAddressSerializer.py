@@ -0,0 +1,8 @@
+from rest_framework import serializers
+
+from ..models import EmailAddress
+
+
+class EmailAddressSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(required=False, default='other', choices=EmailAddress.EMAIL_TYPE_CHOICES)
+    email_address = serializers.EmailField(required=True, max_length=255)
@@ -0,0 +1,8 @@
+from rest_framework import serializers
+
+from ..models import PhoneNumber
+
+
+class PhoneNumberSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(required=False, default='other', choices=PhoneNumber.PHONE_NUMBER_TYPE_CHOICES)
+    phone_number = serializers.CharField(required=True, max_length=50)
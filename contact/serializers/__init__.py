@@ -1,2 +1,4 @@
 from .ContactInfoSerializer import ContactInfoSerializer
 from .ContactSerializer import ContactSerializer
+from .EmailAddressSerializer import EmailAddressSerializer
+from .PhoneNumberSerializer import PhoneNumberSerializer
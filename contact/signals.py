@@ -0,0 +1,49 @@
+from django.conf import settings
+from django.db import connections
+from django.db.migrations.recorder import MigrationRecorder
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+
+from .caches import BookVersion
+from .caches import ContactChanges
+from .models import Contact
+from .models import EmailAddress
+from .models import PhoneNumber
+from .search import ContactSearchIndex
+from .snapshots import ContactSnapshot
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def user_saved(sender, instance, created, **kwargs):
+    if created:
+        # Don't let a reused user id find the book versions of a deleted user.
+        BookVersion.bump(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Contact)
+def contact_changed(sender, instance, **kwargs):
+    ContactChanges.contact_written(instance.pk, instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=PhoneNumber)
+@receiver([post_save, post_delete], sender=EmailAddress)
+def contact_child_changed(sender, instance, **kwargs):
+    # Children are part of the contact's representation and validators.
+    user_id = None
+    if sender._meta.get_field('contact_object').is_cached(instance):
+        user_id = instance.contact_object.user_id
+    ContactChanges.children_written(instance.contact_object_id, user_id)
+
+
+@receiver(post_migrate)
+def contact_migrated(sender, using, **kwargs):
+    # SQLite rebuilds a table for most schema changes, dropping its triggers; put back the ones the applied
+    # migrations installed.
+    if sender.name != 'contact':
+        return
+    connection = connections[using]
+    applied = MigrationRecorder(connection).applied_migrations()
+    if ('contact', '0003_contact_search_index') in applied:
+        ContactSearchIndex.ensure(connection)
+    if ('contact', '0007_contact_snapshot') in applied:
+        ContactSnapshot.ensure(connection)
@@ -0,0 +1,140 @@
+import json
+
+from django.conf import settings
+from django.db import connections
+
+from ..loaders import ContactLoader
+from ..models import Contact
+
+
+class ContactSnapshot(object):
+    """
+    Pre-rendered default representation of a contact in `Contact.snapshot`.
+
+    On SQLite the column is written by triggers with the JSON1 functions:
+    every insert or update of a contact's rendered columns and every write to
+    its phone numbers or email addresses rebuilds its snapshot in the same
+    statement, so it can't fall behind a committed write, including bulk
+    writes that bypass model signals. Reads of the default fieldset then take
+    the whole contact from one row (see `ContactFieldset`). Other databases
+    leave the column NULL and render as before.
+
+    Migrations that rebuild `contacts_people` or the child tables (SQLite does
+    that for most schema changes) drop their triggers; `ensure` puts them
+    back after every `migrate` (see `contact.signals`).
+    """
+    trigger = 'contacts_people_snapshot'
+    columns = ('first_name', 'last_name', 'middle_name', 'nickname', 'designation', 'company')
+    children = (
+        ('phone_numbers', 'contacts_phone_numbers', 'phone_number'),
+        ('email_addresses', 'contacts_email_addresses', 'email_address'),
+    )
+
+    @classmethod
+    def is_supported(cls, connection):
+        return connection.vendor == 'sqlite'
+
+    @classmethod
+    def enabled(cls, connection=None):
+        """Whether reads should be served from snapshots (`CONTACT_SNAPSHOTS`)."""
+        connection = connection or connections[Contact.objects.db]
+        return getattr(settings, 'CONTACT_SNAPSHOTS', True) and cls.is_supported(connection)
+
+    @classmethod
+    def expression(cls):
+        """SQL rendering the `contacts_people` row being updated like `Contact.to_representation`."""
+        values = ["'id', contacts_people.id"]
+        values += ["'{0}', contacts_people.{0}".format(column) for column in cls.columns]
+        for name, table, column in cls.children:
+            # json() keeps the subquery's array from being embedded as a string.
+            values.append(
+                "'{name}', json((SELECT json_group_array(json_object('id', id, 'type', type, '{column}', {column})) "
+                "FROM (SELECT id, type, {column} FROM {table} "
+                "WHERE contact_object_id = contacts_people.id ORDER BY id)))".format(
+                    name=name, table=table, column=column))
+        return "json_object(%s)" % ', '.join(values)
+
+    @classmethod
+    def refresh(cls, condition):
+        return "UPDATE contacts_people SET snapshot = %s WHERE %s;" % (cls.expression(), condition)
+
+    @classmethod
+    def triggers(cls):
+        # Not `snapshot`, which the triggers write themselves and `Contact.save` leaves out.
+        columns = ', '.join(cls.columns)
+        triggers = {
+            'insert': "AFTER INSERT ON contacts_people BEGIN %s END" % cls.refresh('id = new.id'),
+            'update': "AFTER UPDATE OF %s ON contacts_people BEGIN %s END" % (columns, cls.refresh('id = new.id')),
+        }
+        for name, table, column in cls.children:
+            triggers['%s_insert' % name] = "AFTER INSERT ON %s BEGIN %s END" % (
+                table, cls.refresh('id = new.contact_object_id'))
+            triggers['%s_delete' % name] = "AFTER DELETE ON %s BEGIN %s END" % (
+                table, cls.refresh('id = old.contact_object_id'))
+            triggers['%s_update' % name] = "AFTER UPDATE OF type, %s, contact_object_id ON %s BEGIN %s END" % (
+                column, table, cls.refresh('id IN (old.contact_object_id, new.contact_object_id)'))
+        return triggers
+
+    @classmethod
+    def ensure(cls, connection):
+        """Install the triggers if any of them is missing, and snapshot the contacts written without them."""
+        if not cls.is_supported(connection):
+            return
+        names = ['%s_%s' % (cls.trigger, suffix) for suffix in cls.triggers()]
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND name IN (%s)" % ', '.join(
+                ['%s'] * len(names)), names)
+            if len(cursor.fetchall()) < len(names):
+                cls.install(connection)
+
+    @classmethod
+    def install(cls, connection):
+        """Create the triggers if they are missing and snapshot the existing contacts."""
+        if not cls.is_supported(connection):
+            return
+        with connection.cursor() as cursor:
+            for suffix, body in cls.triggers().items():
+                cursor.execute("CREATE TRIGGER IF NOT EXISTS %s_%s %s" % (cls.trigger, suffix, body))
+        cls.rebuild(connection)
+
+    @classmethod
+    def uninstall(cls, connection):
+        if not cls.is_supported(connection):
+            return
+        with connection.cursor() as cursor:
+            for suffix in cls.triggers():
+                cursor.execute("DROP TRIGGER IF EXISTS %s_%s" % (cls.trigger, suffix))
+            cursor.execute("UPDATE contacts_people SET snapshot = NULL")
+
+    @classmethod
+    def rebuild(cls, connection=None, pks=None):
+        """Rewrite the snapshots of the contacts in `pks`, or of every contact."""
+        connection = connection or connections[Contact.objects.db]
+        if not cls.is_supported(connection):
+            return
+        with connection.cursor() as cursor:
+            if pks is None:
+                cursor.execute(cls.refresh('1'))
+            else:
+                pks = list(pks)
+                for start in range(0, len(pks), 500):
+                    batch = pks[start:start + 500]
+                    cursor.execute(cls.refresh('id IN (%s)' % ', '.join(['%s'] * len(batch))), batch)
+
+    @classmethod
+    def stale(cls, contacts=None, batch_size=500):
+        """
+        Yield the ids of contacts whose snapshot is missing or differs from
+        what `Contact.to_representation` renders from their rows now.
+        """
+        contacts = (contacts if contacts is not None else Contact.objects.all()).order_by('id')
+        last = 0
+        while True:
+            batch = list(contacts.filter(id__gt=last)[:batch_size])
+            if not batch:
+                return
+            ContactLoader.load(batch)
+            for contact in batch:
+                if contact.snapshot is None or json.loads(contact.snapshot) != contact.to_representation():
+                    yield contact.pk
+            last = batch[-1].pk
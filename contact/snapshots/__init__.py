@@ -0,0 +1 @@
+from .ContactSnapshot import ContactSnapshot
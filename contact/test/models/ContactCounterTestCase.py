@@ -0,0 +1,71 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from contactbook.testing import AuthenticatedTestMixin
+
+from ...models import Contact
+from ...models import ContactCounter
+
+
+class ContactCounterTestCase(AuthenticatedTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_list = reverse('contact-list')
+        self.create_contact = reverse('contact-create')
+
+    def create_contact_data(self):
+        return {
+            'first_name': self.fake.first_name(),
+            'last_name': self.fake.last_name(),
+            'email_address': self.fake.email(),
+            'email_type': 'home'
+        }
+
+    def test_counter_follows_create_and_delete(self):
+        headers = self.get_headers()
+        ids = []
+        for index in range(3):
+            response = self.client.post(self.create_contact, self.create_contact_data(), format='json', **headers)
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            ids.append(response.json()['id'])
+        self.assertEqual(ContactCounter.objects.get(user=self.user).total, 3)
+
+        response = self.client.delete("/contact/{}/delete".format(ids[0]), **headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(ContactCounter.objects.get(user=self.user).total, 2)
+
+        response = self.client.get(self.create_list, **headers)
+        self.assertEqual(response.json()['total_contacts'], 2)
+
+    def test_counter_is_created_lazily(self):
+        Contact.objects.create(first_name=self.fake.first_name(), last_name=self.fake.last_name(), user=self.user)
+        headers = self.get_headers()
+        response = self.client.get(self.create_list, **headers)
+        self.assertEqual(response.json()['total_contacts'], 1)
+        self.assertEqual(ContactCounter.objects.get(user=self.user).total, 1)
+
+    def test_failed_create_leaves_counter_untouched(self):
+        headers = self.get_headers()
+        data = self.create_contact_data()
+        self.client.post(self.create_contact, data, format='json', **headers)
+        response = self.client.post(self.create_contact, data, format='json', **headers)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(ContactCounter.objects.get(user=self.user).total, 1)
+
+    def test_repair_command(self):
+        other_user = User.objects.create_user('other@example.com', 'other@example.com', self.password)
+        ContactCounter.objects.create(user=self.user, total=10)
+        ContactCounter.objects.create(user=other_user, total=0)
+        for index in range(2):
+            Contact.objects.create(first_name=self.fake.first_name(), last_name=self.fake.last_name(), user=self.user)
+
+        out = StringIO()
+        call_command('repair_contact_counters', stdout=out)
+        self.assertIn("Repaired 1 contact counter(s).", out.getvalue())
+        self.assertEqual(ContactCounter.objects.get(user=self.user).total, 2)
+        self.assertEqual(ContactCounter.objects.get(user=other_user).total, 0)
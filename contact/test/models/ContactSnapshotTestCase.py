@@ -0,0 +1,112 @@
+import json
+from io import StringIO
+
+from django.apps import apps
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from rest_framework import status
+
+from contactbook.testing import AuthenticatedTestMixin
+
+from ...loaders import ContactLoader
+from ...models import Contact
+from ...models import EmailAddress
+from ...models import PhoneNumber
+from ...search import ContactSearchIndex
+from ...signals import contact_migrated
+from ...snapshots import ContactSnapshot
+
+
+class ContactSnapshotTestCase(AuthenticatedTestMixin, TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        super().setUp()
+        self.contact = Contact.objects.create(first_name='Ada', last_name='Lovelace', user=self.user)
+        self.phone = PhoneNumber.objects.create(contact_object=self.contact, phone_number='555 0100', type='home')
+        EmailAddress.objects.create(contact_object=self.contact, email_address='ada@example.com', type='work')
+
+    def snapshot(self):
+        return json.loads(Contact.objects.get(pk=self.contact.pk).snapshot)
+
+    def representation(self):
+        return ContactLoader.load([Contact.objects.get(pk=self.contact.pk)])[0].to_representation()
+
+    def test_snapshot_matches_representation(self):
+        self.assertEqual(self.snapshot(), self.representation())
+        self.assertEqual(self.snapshot()['phone_numbers'][0]['phone_number'], '555 0100')
+
+    def test_writes_without_signals_update_snapshot(self):
+        Contact.objects.filter(pk=self.contact.pk).update(nickname='Enchantress')
+        PhoneNumber.objects.bulk_create([PhoneNumber(contact_object=self.contact, phone_number='555 0199',
+                                                     type='work')])
+        EmailAddress.objects.filter(contact_object=self.contact).update(type='home')
+        self.phone.delete()
+        snapshot = self.snapshot()
+        self.assertEqual(snapshot, self.representation())
+        self.assertEqual(snapshot['nickname'], 'Enchantress')
+        self.assertEqual([phone['phone_number'] for phone in snapshot['phone_numbers']], ['555 0199'])
+        self.assertEqual(snapshot['email_addresses'][0]['type'], 'home')
+
+    def test_full_save_does_not_keep_stale_snapshot(self):
+        contact = Contact.objects.get(pk=self.contact.pk)
+        PhoneNumber.objects.create(contact_object=self.contact, phone_number='555 0199', type='work')
+        contact.save()
+        self.assertEqual(len(self.snapshot()['phone_numbers']), 2)
+
+    def test_child_write_rebuilds_snapshot_once(self):
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE TEMP TABLE snapshot_writes (contact_id integer)")
+            cursor.execute("CREATE TEMP TRIGGER count_snapshot_writes AFTER UPDATE OF snapshot ON contacts_people "
+                           "BEGIN INSERT INTO snapshot_writes VALUES (new.id); END")
+            PhoneNumber.objects.create(contact_object=self.contact, phone_number='555 0199', type='work')
+            cursor.execute("SELECT COUNT(*) FROM snapshot_writes")
+            self.assertEqual(cursor.fetchone()[0], 1)
+            cursor.execute("DROP TRIGGER count_snapshot_writes")
+            cursor.execute("DROP TABLE snapshot_writes")
+
+    def test_retrieve_falls_back_without_snapshot(self):
+        ContactSnapshot.uninstall(connection)
+        headers = self.get_headers()
+        with self.assertNumQueries(4):  # token, contact, phone numbers, email addresses
+            response = self.client.get("/contact/{}".format(self.contact.id), **headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), self.representation())
+
+    @override_settings(CONTACT_SNAPSHOTS=False)
+    def test_snapshots_can_be_turned_off(self):
+        headers = self.get_headers()
+        with self.assertNumQueries(4):  # token, contact, phone numbers, email addresses
+            response = self.client.get("/contact/{}".format(self.contact.id), **headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), self.representation())
+
+    def test_verify_and_rebuild(self):
+        out = StringIO()
+        call_command('verify_contact_snapshots', stdout=out)
+        self.assertIn("Found 0 stale", out.getvalue())
+
+        ContactSnapshot.uninstall(connection)
+        out = StringIO()
+        call_command('verify_contact_snapshots', rebuild=True, stdout=out)
+        self.assertIn("Found 1 stale", out.getvalue())
+        self.assertEqual(list(ContactSnapshot.stale()), [])
+        # The triggers are back as well.
+        PhoneNumber.objects.create(contact_object=self.contact, phone_number='555 0199', type='work')
+        self.assertEqual(self.snapshot(), self.representation())
+
+    def test_migrate_puts_back_dropped_triggers(self):
+        # As a later migration rebuilding the tables would.
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TRIGGER contacts_people_snapshot_phone_numbers_insert")
+            cursor.execute("DROP TRIGGER contacts_people_fts_update")
+        PhoneNumber.objects.create(contact_object=self.contact, phone_number='555 0101', type='work')
+        Contact.objects.filter(pk=self.contact.pk).update(nickname='Enchantress')
+        contact_migrated(sender=apps.get_app_config('contact'), using='default')
+
+        self.assertEqual(list(ContactSnapshot.stale()), [])
+        contacts = ContactSearchIndex.search(Contact.objects.all(), 'enchant')
+        self.assertEqual([contact.pk for contact in contacts], [self.contact.pk])
+        PhoneNumber.objects.create(contact_object=self.contact, phone_number='555 0102', type='work')
+        self.assertEqual(list(ContactSnapshot.stale()), [])
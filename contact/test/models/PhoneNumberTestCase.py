@@ -0,0 +1,29 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from ...models import Contact
+from ...models import PhoneNumber
+
+
+class PhoneNumberTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('owner@example.com', 'owner@example.com', 'testpassword')
+        self.contact = Contact.objects.create(first_name='Ada', last_name='Lovelace', user=self.user)
+
+    def test_digits_are_stored_on_save(self):
+        phone = PhoneNumber.objects.create(phone_number='+1 (555) 010-0100', type='work', contact_object=self.contact)
+        phone.refresh_from_db()
+        self.assertEqual(phone.digits, '15550100100')
+        self.assertEqual(phone.reversed_digits, '00100105551')
+        phone.phone_number = '020 7946 0000'
+        phone.save()
+        self.assertEqual(PhoneNumber.objects.get(pk=phone.pk).digits, '02079460000')
+
+    def test_matching(self):
+        full = PhoneNumber.objects.create(phone_number='+44 20 7946 0000', type='work', contact_object=self.contact)
+        local = PhoneNumber.objects.create(phone_number='7946 0000', type='home', contact_object=self.contact)
+        short = PhoneNumber.objects.create(phone_number='0000', type='other', contact_object=self.contact)
+        self.assertEqual(set(PhoneNumber.matching('0044 20 7946 0000')), {full, local})
+        self.assertEqual(set(PhoneNumber.matching('946 0000')), {full, local})
+        self.assertEqual(set(PhoneNumber.matching('0000')), {full, local, short})
+        self.assertEqual(set(PhoneNumber.matching('20 7946 0001')), set())
@@ -0,0 +1,3 @@
+from .ContactCounterTestCase import ContactCounterTestCase
+from .PhoneNumberTestCase import PhoneNumberTestCase
+from .ContactSnapshotTestCase import ContactSnapshotTestCase
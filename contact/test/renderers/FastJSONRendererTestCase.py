@@ -0,0 +1,53 @@
+import datetime
+import importlib
+import json
+from collections import OrderedDict
+from decimal import Decimal
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from ...renderers import FastJSONRenderer, JSONFragment
+
+# The package exports the class under the module's name.
+renderer_module = importlib.import_module('contact.renderers.FastJSONRenderer')
+
+
+class FastJSONRendererTestCase(SimpleTestCase):
+    def setUp(self):
+        self.data = OrderedDict([
+            ('name', 'Ada Lovelace é '),
+            ('added', datetime.datetime(2026, 10, 18, 12, 30, 15, 123456, tzinfo=timezone.utc)),
+            ('born', datetime.date(1815, 12, 10)),
+            ('balance', Decimal('1.50')),
+            ('tags', ('math', None, True)),
+            ('count', 3),
+        ])
+
+    def test_renders_like_json_renderer(self):
+        self.assertEqual(FastJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    def test_renders_like_json_renderer_without_orjson(self):
+        with mock.patch.object(renderer_module, 'orjson', None):
+            self.assertEqual(FastJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    def test_fragments_are_written_as_they_are(self):
+        data = {
+            'contacts': [JSONFragment(b'{"id":1,"nickname":"\xe2\x80\xa8"}'), JSONFragment.of('{"id":2}')],
+            'next': None,
+        }
+        rendered = FastJSONRenderer().render(data)
+        self.assertEqual(rendered, b'{"contacts":[{"id":1,"nickname":"\\u2028"},{"id":2}],"next":null}')
+
+    def test_placeholder_like_strings_are_left_alone(self):
+        data = {'contact': JSONFragment(b'{"id":1}'), 'note': '0:0'}
+        self.assertEqual(json.loads(FastJSONRenderer().render(data)), {'contact': {'id': 1}, 'note': '0:0'})
+
+    def test_top_level_fragment(self):
+        self.assertEqual(FastJSONRenderer().render(JSONFragment(b'{"id":1}')), b'{"id":1}')
+
+    def test_indented_output_decodes_fragments(self):
+        rendered = FastJSONRenderer().render({'contact': JSONFragment(b'{"id":1}')}, 'application/json; indent=2')
+        self.assertEqual(rendered, b'{\n  "contact": {\n    "id": 1\n  }\n}')
@@ -0,0 +1 @@
+from .FastJSONRendererTestCase import FastJSONRendererTestCase
@@ -0,0 +1,92 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from contactbook.testing import AuthenticatedTestMixin
+
+from ...caches import BookVersion
+from ...models import Contact
+from ...search import ContactAutocomplete
+from ...search import ContactPrefixIndex
+
+
+class ContactAutocompleteTestCase(AuthenticatedTestMixin, TestCase):
+    def setUp(self):
+        ContactAutocomplete.clear()
+        super().setUp()
+        self.ada = Contact.objects.create(first_name='Ada', last_name='Lovelace', nickname='Enchantress',
+                                          user=self.user)
+        self.zoe = Contact.objects.create(first_name='Zoë', last_name='Adams', nickname='', user=self.user)
+        self.alan = Contact.objects.create(first_name='Alan', last_name='Turing', nickname='Prof', user=self.user)
+        other = User.objects.create_user('other@example.com', 'other@example.com', self.password)
+        Contact.objects.create(first_name='Adam', last_name='Smith', user=other)
+        self.autocomplete_url = reverse('contact-autocomplete')
+        self.headers = self.get_headers()
+
+    def suggest(self, query, **params):
+        params['q'] = query
+        response = self.client.get(self.autocomplete_url, params, **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [suggestion['id'] for suggestion in response.json()['suggestions']]
+
+    def test_suggest(self):
+        self.assertEqual(self.suggest('ad'), [self.ada.id, self.zoe.id])
+        self.assertEqual(self.suggest('ZOE'), [self.zoe.id])
+        self.assertEqual(self.suggest('ada lov'), [self.ada.id])
+        self.assertEqual(self.suggest('enchant'), [self.ada.id])
+        self.assertEqual(self.suggest('a', limit=2), [self.ada.id, self.zoe.id])
+        self.assertEqual(self.suggest(''), [])
+        response = self.client.get(self.autocomplete_url, {'q': 'a', 'limit': 'x'}, **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_index_is_cached(self):
+        self.suggest('ad')
+        # The token was cached by the first request too.
+        with self.assertNumQueries(0):
+            self.assertEqual(self.suggest('al'), [self.alan.id])
+
+    def test_writes_update_index(self):
+        self.suggest('ad')
+        response = self.client.post(reverse('contact-create'), {
+            'first_name': 'Adele', 'last_name': 'Goldberg', 'email_type': 'work', 'email_address': 'ag@example.com'
+        }, **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        adele = response.json()['id']
+        self.assertEqual(self.suggest('ad'), [self.ada.id, self.zoe.id, adele])
+
+        response = self.client.patch(reverse('contact-basic-update', kwargs={'id': self.alan.id}),
+                                     {'nickname': 'Codebreaker'}, content_type='application/json', **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.suggest('prof'), [])
+        self.assertEqual(self.suggest('code'), [self.alan.id])
+
+        response = self.client.delete(reverse('contact-delete', kwargs={'id': self.ada.id}), **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.suggest('ad'), [self.zoe.id, adele])
+
+    def test_other_workers_writes(self):
+        self.suggest('ad')
+        # Another worker's write, as seen from here: the rows and the shared book version change.
+        Contact.objects.filter(pk=self.alan.pk).update(first_name='Adrian')
+        self.assertEqual(self.suggest('adr'), [])
+        BookVersion.bump(self.user.pk)
+        self.assertEqual(self.suggest('adr'), [self.alan.id])
+
+    def test_lru_eviction(self):
+        max_users = ContactAutocomplete.max_users
+        ContactAutocomplete.max_users = 1
+        try:
+            other = User.objects.get(email='other@example.com')
+            ContactAutocomplete.suggest(self.user, 'a')
+            ContactAutocomplete.suggest(other, 'a')
+            self.assertEqual(list(ContactAutocomplete.indexes), [other.pk])
+        finally:
+            ContactAutocomplete.max_users = max_users
+
+    def test_prefix_index(self):
+        index = ContactPrefixIndex([(1, 'Ada', 'Lovelace', ''), (2, 'Ada', 'Byron', 'Ada')])
+        self.assertEqual([row[0] for row in index.suggest('ada', 10)], [1, 2])
+        self.assertEqual([row[0] for row in index.suggest('ada by', 10)], [2])
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.keys, ['ada', 'ada', 'byron', 'lovelace'])
@@ -0,0 +1,158 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from contactbook.testing import AuthenticatedTestMixin
+
+from ...models import Contact
+from ...models import ContactCounter
+from ...models import EmailAddress
+from ...models import PhoneNumber
+
+
+class ContactBatchTestCase(AuthenticatedTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.contacts = []
+        for index in range(3):
+            contact = Contact.objects.create(first_name=self.fake.first_name(), last_name=self.fake.last_name(),
+                                             user=self.user)
+            EmailAddress.objects.create(contact_object=contact, email_address='contact%d@example.com' % index,
+                                        type='other')
+            self.contacts.append(contact)
+        ContactCounter.repair(users=[self.user])
+        self.batch_url = reverse('contact-batch')
+
+    def run_batch(self, operations):
+        return self.client.post(self.batch_url, {'operations': operations}, content_type='application/json',
+                                **self.get_headers())
+
+    def test_batch(self):
+        first, second, third = self.contacts
+        response = self.run_batch([
+            {'op': 'create', 'data': {'first_name': 'Ada', 'last_name': 'Lovelace', 'email_type': 'work',
+                                      'email_address': 'ada@example.com', 'phone_number': '555-0100',
+                                      'phone_number_type': 'mobile'}},
+            {'op': 'update', 'id': first.id, 'data': {'first_name': 'Grace', 'last_name': 'Hopper',
+                                                      'email_type': 'home', 'email_address': 'grace@example.com'}},
+            {'op': 'basic_update', 'id': second.id, 'data': {'company': 'Navy'}},
+            {'op': 'delete', 'id': third.id},
+        ])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()['results']
+        self.assertEqual([result['status'] for result in results], [201, 200, 200, 200])
+
+        created = results[0]['data']
+        self.assertEqual(created['first_name'], 'Ada')
+        self.assertEqual(created['phone_numbers'][0]['phone_number'], '555-0100')
+        self.assertEqual(created['email_addresses'][0]['email_address'], 'ada@example.com')
+        self.assertTrue(Contact.objects.filter(pk=created['id'], user=self.user).exists())
+
+        self.assertEqual(results[1]['data']['first_name'], 'Grace')
+        self.assertEqual(sorted(email['email_address'] for email in results[1]['data']['email_addresses']),
+                         ['contact0@example.com', 'grace@example.com'])
+        first.refresh_from_db()
+        self.assertEqual(first.last_name, 'Hopper')
+
+        self.assertEqual(results[2]['data']['company'], 'Navy')
+        second.refresh_from_db()
+        self.assertEqual(second.company, 'Navy')
+
+        self.assertEqual(results[3]['data'], {'success': True})
+        self.assertFalse(Contact.objects.filter(pk=third.id).exists())
+        self.assertEqual(ContactCounter.total_for(self.user), 3)
+
+    def test_batch_errors(self):
+        first, second, third = self.contacts
+        other = User.objects.create_user('other@example.com', 'other@example.com', self.password)
+        foreign = Contact.objects.create(first_name='Foreign', last_name='Contact', user=other)
+        response = self.run_batch([
+            {'op': 'rename', 'id': first.id},
+            {'op': 'delete', 'id': foreign.id},
+            {'op': 'create', 'data': {'first_name': 'Ada', 'email_type': 'work', 'email_address': 'a@example.com'}},
+            {'op': 'create', 'data': {'first_name': 'Ada', 'last_name': 'Lovelace', 'email_type': 'work',
+                                      'email_address': 'contact1@example.com'}},
+            {'op': 'delete', 'id': first.id},
+            {'op': 'create', 'data': {'first_name': 'Ada', 'last_name': 'Lovelace', 'email_type': 'work',
+                                      'email_address': 'contact0@example.com'}},
+            {'op': 'create', 'data': {'first_name': 'Ada', 'last_name': 'Again', 'email_type': 'work',
+                                      'email_address': 'contact0@example.com'}},
+            {'op': 'basic_update', 'id': first.id, 'data': {'company': 'Navy'}},
+        ])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()['results']
+        self.assertEqual([result['status'] for result in results], [400, 404, 400, 400, 200, 201, 400, 400])
+        self.assertIn('op', results[0]['data'])
+        self.assertIn('last_name', results[2]['data'])
+        self.assertIn('email', results[3]['data'])
+        self.assertIn('email', results[6]['data'])
+        self.assertIn('id', results[7]['data'])
+        self.assertTrue(Contact.objects.filter(pk=foreign.id).exists())
+        self.assertEqual(Contact.objects.filter(user=self.user).count(), 3)
+        self.assertEqual(ContactCounter.total_for(self.user), 3)
+
+    def test_batch_query_count(self):
+        headers = self.get_headers()
+        operations = [{'op': 'create', 'data': {'first_name': 'Ada', 'last_name': 'Lovelace', 'email_type': 'work',
+                                                'email_address': 'ada%d@example.com' % index}}
+                      for index in range(20)]
+        operations += [{'op': 'basic_update', 'id': contact.id, 'data': {'company': 'Navy'}}
+                       for contact in self.contacts]
+        # token, savepoint, lock, targets, emails, contacts, ids, children, created, update, counter,
+        # phones, emails, release; independent of the number of operations.
+        with self.assertNumQueries(14):
+            response = self.client.post(self.batch_url, {'operations': operations},
+                                        content_type='application/json', **headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Contact.objects.filter(user=self.user).count(), 23)
+        self.assertEqual(PhoneNumber.objects.filter(contact_object__user=self.user).count(), 0)
+
+    def test_delete_query_count(self):
+        contacts = []
+        for index in range(11):
+            contact = Contact.objects.create(first_name='Ada', last_name='Lovelace', user=self.user)
+            EmailAddress.objects.create(contact_object=contact, email_address='ada%d@example.com' % index, type='work')
+            PhoneNumber.objects.create(contact_object=contact, phone_number='555-01%02d' % index, type='home')
+            contacts.append(contact)
+        counts = []
+        # The first batch creates and caches the token.
+        for batch in (contacts[:1], contacts[1:2], contacts[2:]):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.run_batch([{'op': 'delete', 'id': contact.id} for contact in batch])
+            self.assertEqual(response.json()['results'], [{'status': 200, 'data': {'success': True}}] * len(batch))
+            counts.append(len(queries))
+        # The cascade to children neither touches the contacts nor looks up their owners.
+        self.assertEqual(counts[1], counts[2])
+        self.assertFalse(PhoneNumber.objects.filter(contact_object__in=contacts).exists())
+
+    def test_unchanged_contacts_are_not_written(self):
+        first, second, third = self.contacts
+        modified = Contact.objects.get(pk=first.id).date_modified
+        headers = self.get_headers()
+        operations = [{'op': 'basic_update', 'id': first.id, 'data': {'first_name': first.first_name}},
+                      {'op': 'basic_update', 'id': second.id, 'data': {'last_name': second.last_name,
+                                                                       'company': ''}}]
+        # token, savepoint, lock, targets, phones, emails, release.
+        with self.assertNumQueries(7):
+            response = self.client.post(self.batch_url, {'operations': operations},
+                                        content_type='application/json', **headers)
+        self.assertEqual([result['status'] for result in response.json()['results']], [200, 200])
+        self.assertEqual(Contact.objects.get(pk=first.id).date_modified, modified)
+
+    def test_lists_are_refused(self):
+        first = self.contacts[0]
+        response = self.run_batch([{'op': 'update', 'id': first.id, 'data': {
+            'first_name': 'Ada', 'last_name': 'Lovelace', 'email_addresses': [{'email_address': 'ada@example.com'}]}}])
+        result = response.json()['results'][0]
+        self.assertEqual(result['status'], 400)
+        self.assertIn('email_addresses', result['data'])
+
+    def test_invalid_payload(self):
+        response = self.run_batch({'op': 'delete'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.run_batch([{'op': 'delete', 'id': self.contacts[0].id}] * 501)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Contact.objects.filter(user=self.user).count(), 3)
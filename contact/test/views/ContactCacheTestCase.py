@@ -0,0 +1,94 @@
+import shutil
+import tempfile
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from contactbook.testing import AuthenticatedTestMixin
+
+from ...checks import contact_cache_check
+from ...models import Contact
+from ...models import EmailAddress
+from ...models import PhoneNumber
+
+
+class ContactCacheTestCase(AuthenticatedTestMixin, TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        super().setUp()
+        self.contact = Contact.objects.create(first_name='Ada', last_name='Lovelace', user=self.user)
+        EmailAddress.objects.create(contact_object=self.contact, email_address='ada@example.com', type='work')
+        self.retrieve_url = reverse('contact-retrieve', kwargs={'id': self.contact.id})
+        self.headers = self.get_headers()
+
+    def retrieve(self, queries, **params):
+        with self.assertNumQueries(queries):
+            response = self.client.get(self.retrieve_url, params, **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def test_cached_read_skips_database(self):
+        self.retrieve(2)
+        # The token is cached as well.
+        contact = self.retrieve(0)
+        self.assertEqual(contact['first_name'], 'Ada')
+        self.assertEqual(contact['email_addresses'][0]['email_address'], 'ada@example.com')
+        # Sparse reads aren't cached.
+        self.assertEqual(self.retrieve(1, fields='id,first_name', expand=''), {'id': self.contact.id,
+                                                                               'first_name': 'Ada'})
+
+    def test_writes_invalidate(self):
+        self.retrieve(2)
+        self.contact.nickname = 'Enchantress'
+        self.contact.save()
+        self.assertEqual(self.retrieve(1)['nickname'], 'Enchantress')
+
+        phone = PhoneNumber.objects.create(contact_object=self.contact, phone_number='555-0100', type='home')
+        self.assertEqual(len(self.retrieve(1)['phone_numbers']), 1)
+        phone.delete()
+        self.assertEqual(self.retrieve(1)['phone_numbers'], [])
+
+        response = self.client.patch(reverse('contact-basic-update', kwargs={'id': self.contact.id}),
+                                     {'company': 'Analytical Engines'}, content_type='application/json',
+                                     **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.retrieve(1)['company'], 'Analytical Engines')
+
+        response = self.client.post(reverse('contact-batch'), {'operations': [
+            {'op': 'basic_update', 'id': self.contact.id, 'data': {'designation': 'Mathematician'}},
+        ]}, content_type='application/json', **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.retrieve(1)['designation'], 'Mathematician')
+
+        response = self.client.delete(reverse('contact-delete', kwargs={'id': self.contact.id}), **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(self.retrieve_url, **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cache_is_per_user(self):
+        self.retrieve(2)
+        other = User.objects.create_user('other@example.com', 'other@example.com', self.password)
+        headers = {'HTTP_AUTHORIZATION': "Token " + self.client.post(self.login_url, {
+            'email': 'other@example.com', 'password': self.password}, format='json').json().get('token')}
+        self.assertFalse(Contact.objects.filter(user=other).exists())
+        response = self.client.get(self.retrieve_url, **headers)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_file_cache(self):
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location)
+        backend = {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location}
+        with override_settings(CACHES={'default': backend}):
+            self.retrieve(2)
+            self.assertEqual(self.retrieve(0)['first_name'], 'Ada')
+            self.contact.first_name = 'Augusta'
+            self.contact.save()
+            self.assertEqual(self.retrieve(1)['first_name'], 'Augusta')
+
+    def test_per_process_cache_warning(self):
+        self.assertEqual(contact_cache_check(None), [])
+        with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}):
+            self.assertEqual([warning.id for warning in contact_cache_check(None)], ['contact.W001'])
@@ -0,0 +1,92 @@
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from contactbook.testing import AuthenticatedTestMixin
+
+from ...models import Contact
+from ...models import ContactCounter
+from ...models import EmailAddress
+from ...models import PhoneNumber
+from ...views import ContactListView
+
+
+class ContactETagTestCase(AuthenticatedTestMixin, TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        super().setUp()
+        self.contact = Contact.objects.create(first_name='Ada', last_name='Lovelace', user=self.user)
+        EmailAddress.objects.create(contact_object=self.contact, email_address='ada@example.com', type='work')
+        self.other = Contact.objects.create(first_name='Grace', last_name='Hopper', user=self.user)
+        ContactCounter.repair(users=[self.user])
+        self.list_url = reverse('contact-list')
+        self.retrieve_url = reverse('contact-retrieve', kwargs={'id': self.contact.id})
+        self.headers = self.get_headers()
+
+    def get(self, url, params=None, **headers):
+        headers.update(self.headers)
+        return self.client.get(url, params or {}, **headers)
+
+    def test_retrieve_not_modified(self):
+        response = self.get(self.retrieve_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        self.assertIn('Last-Modified', response)
+
+        # The cached render carries its validator and the token is cached too.
+        with self.assertNumQueries(0):
+            response = self.get(self.retrieve_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+        response = self.get(self.retrieve_url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # Other fieldsets of the same contact have their own tags.
+        params = {'fields': 'id,first_name', 'expand': ''}
+        response = self.get(self.retrieve_url, params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        with self.assertNumQueries(1):
+            response = self.get(self.retrieve_url, params, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_child_writes_change_etag(self):
+        etag = self.get(self.retrieve_url)['ETag']
+        modified = Contact.objects.get(pk=self.contact.pk).date_modified
+        phone = PhoneNumber.objects.create(contact_object=self.contact, phone_number='555-0100', type='home')
+        self.assertGreater(Contact.objects.get(pk=self.contact.pk).date_modified, modified)
+        response = self.get(self.retrieve_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['phone_numbers']), 1)
+
+        etag = response['ETag']
+        phone.delete()
+        response = self.get(self.retrieve_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['phone_numbers'], [])
+
+    def test_list_not_modified(self):
+        response = self.get(self.list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        # The page cache keeps the validator and the token is cached too.
+        with self.assertNumQueries(0):
+            response = self.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        ContactListView.page_cache.clear()
+        # counter, validator; the page isn't fetched.
+        with self.assertNumQueries(2):
+            response = self.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertNotEqual(self.get(self.list_url, {'cursor': ''})['ETag'], etag)
+
+        EmailAddress.objects.create(contact_object=self.other, email_address='grace@example.com', type='work')
+        response = self.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        etag = response['ETag']
+        response = self.client.delete(reverse('contact-delete', kwargs={'id': self.contact.id}), **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['total_contacts'], 1)
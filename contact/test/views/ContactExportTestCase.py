@@ -0,0 +1,64 @@
+import csv
+import io
+import json
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from contactbook.testing import AuthenticatedTestMixin
+
+from ...exporters import ContactExporter
+from ...models import Contact
+from ...models import EmailAddress
+from ...models import PhoneNumber
+
+
+class ContactExportTestCase(AuthenticatedTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.other_user = User.objects.create_user('other@example.com', 'other@example.com', self.password)
+        for index in range(5):
+            contact = Contact.objects.create(first_name=self.fake.first_name(), last_name=self.fake.last_name(),
+                                             user=self.user)
+            PhoneNumber.objects.create(contact_object=contact, phone_number=self.fake.phone_number(), type='home')
+            EmailAddress.objects.create(contact_object=contact, email_address="%s%s" % (index, self.fake.email()),
+                                        type='work')
+        Contact.objects.create(first_name=self.fake.first_name(), last_name=self.fake.last_name(),
+                               user=self.other_user)
+        self.export_url = reverse('contact-export')
+
+    def test_export_ndjson(self):
+        response = self.client.get(self.export_url, **self.get_headers())
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        contacts = [json.loads(line) for line in lines]
+        self.assertEqual([contact['id'] for contact in contacts],
+                         list(Contact.objects.filter(user=self.user).order_by('id').values_list('id', flat=True)))
+        self.assertEqual(len(contacts[0]['phone_numbers']), 1)
+        self.assertEqual(len(contacts[0]['email_addresses']), 1)
+
+    def test_export_csv(self):
+        response = self.client.get(self.export_url, data={'output': 'csv'}, **self.get_headers())
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(csv.reader(io.StringIO(b''.join(response.streaming_content).decode('utf-8'))))
+        self.assertEqual(tuple(rows[0]), ContactExporter.CSV_HEADER)
+        self.assertEqual(len(rows), 6)
+        self.assertTrue(rows[1][8].startswith('work:'))
+
+    def test_export_with_invalid_output(self):
+        response = self.client.get(self.export_url, data={'output': 'xml'}, **self.get_headers())
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_without_authorization(self):
+        response = self.client.get(self.export_url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_export_reads_in_chunks(self):
+        exporter = ContactExporter(self.user, chunk_size=2)
+        with self.assertNumQueries(9):  # three chunks of contacts, phone numbers and email addresses
+            chunks = [len(chunk) for chunk in exporter.chunks()]
+        self.assertEqual(chunks, [2, 2, 1])
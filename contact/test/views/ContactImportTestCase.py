@@ -0,0 +1,116 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from contactbook.testing import AuthenticatedTestMixin
+
+from ...models import Contact
+from ...models import ContactCounter
+from ...models import EmailAddress
+from ...models import PhoneNumber
+
+
+class ContactImportTestCase(AuthenticatedTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.existing_email = 'existing@example.com'
+        contact = Contact.objects.create(first_name=self.fake.first_name(), last_name=self.fake.last_name(),
+                                         user=self.user)
+        EmailAddress.objects.create(contact_object=contact, email_address=self.existing_email, type='other')
+        self.import_url = reverse('contact-import')
+
+    def upload(self, name, content, **data):
+        data['file'] = SimpleUploadedFile(name, content.encode('utf-8'))
+        return self.client.post(self.import_url, data, **self.get_headers())
+
+    def test_import_csv(self):
+        content = (
+            "first_name,last_name,company,phone_number,phone_number_type,email_address,email_type\r\n"
+            "Ada,Lovelace,Analytical,+44 20 7946 0000,work,ada@example.com,work\r\n"
+            ",Babbage,,,,charles@example.com,home\r\n"
+            "Grace,Hopper,Navy,555-0100,pager,grace@example.com,work\r\n"
+            "Alan,Turing,,,,existing@example.com,home\r\n"
+            "Ada,Again,,,,ada@example.com,home\r\n"
+            "Edsger,Dijkstra,,,,edsger@example.com,\r\n"
+        )
+        response = self.upload('contacts.csv', content)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        report = response.json()
+        self.assertEqual(report['imported'], 2)
+        self.assertEqual([error['row'] for error in report['errors']], [2, 3, 4, 5])
+        self.assertIn('first_name', report['errors'][0]['errors'])
+        self.assertIn('phone_number_type', report['errors'][1]['errors'])
+        self.assertIn('email', report['errors'][2]['errors'])
+        self.assertIn('email', report['errors'][3]['errors'])
+
+        ada = Contact.objects.get(user=self.user, first_name='Ada')
+        self.assertEqual(ada.company, 'Analytical')
+        self.assertEqual(list(ada.contact_phone_number.values_list('type', 'phone_number')),
+                         [('work', '+44 20 7946 0000')])
+        self.assertEqual(list(ada.contact_email_address.values_list('type', 'email_address')),
+                         [('work', 'ada@example.com')])
+        self.assertEqual(ContactCounter.objects.get(user=self.user).total, 3)
+
+    def test_import_csv_in_export_format(self):
+        content = (
+            "id,first_name,middle_name,last_name,nickname,company,designation,phone_numbers,email_addresses\r\n"
+            "7,Ada,,Lovelace,,,,home:111; mobile:222,work:ada@example.com; other:ada@home.example.com\r\n"
+        )
+        response = self.upload('contacts.csv', content)
+        self.assertEqual(response.json()['imported'], 1)
+        ada = Contact.objects.get(user=self.user, first_name='Ada')
+        self.assertEqual(ada.contact_phone_number.count(), 2)
+        self.assertEqual(ada.contact_email_address.count(), 2)
+
+    def test_import_vcard(self):
+        content = (
+            "BEGIN:VCARD\r\n"
+            "VERSION:3.0\r\n"
+            "N:Lovelace;Ada;King;;\r\n"
+            "FN:Ada King Lovelace\r\n"
+            "ORG:Analytical Engines;Research\r\n"
+            "TITLE:Programmer\r\n"
+            "TEL;TYPE=CELL,VOICE:+44 20 7946\r\n"
+            " 0000\r\n"
+            "TEL;TYPE=HOME:555-0100\r\n"
+            "EMAIL;TYPE=INTERNET,WORK:ada@example.com\r\n"
+            "END:VCARD\r\n"
+            "BEGIN:VCARD\r\n"
+            "VERSION:2.1\r\n"
+            "FN:Grace Hopper\r\n"
+            "TEL;FAX:555-0199\r\n"
+            "item1.EMAIL:grace@example.com\r\n"
+            "END:VCARD\r\n"
+            "BEGIN:VCARD\r\n"
+            "VERSION:3.0\r\n"
+            "N:Nobody;Nameless;;;\r\n"
+            "END:VCARD\r\n"
+        )
+        response = self.upload('contacts.vcf', content)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        report = response.json()
+        self.assertEqual(report['imported'], 2)
+        self.assertEqual(report['errors'], [{'row': 3, 'errors': {'email_address': ["This field is required."]}}])
+
+        ada = Contact.objects.get(user=self.user, first_name='Ada')
+        self.assertEqual((ada.middle_name, ada.last_name, ada.company, ada.designation),
+                         ('King', 'Lovelace', 'Analytical Engines', 'Programmer'))
+        self.assertEqual(list(ada.contact_phone_number.order_by('id').values_list('type', 'phone_number')),
+                         [('mobile', '+44 20 79460000'), ('home', '555-0100')])
+        grace = Contact.objects.get(user=self.user, first_name='Grace')
+        self.assertEqual(grace.last_name, 'Hopper')
+        self.assertEqual(PhoneNumber.objects.get(contact_object=grace).type, 'fax')
+        self.assertEqual(EmailAddress.objects.get(contact_object=grace).type, 'other')
+
+    def test_import_without_file(self):
+        response = self.client.post(self.import_url, {}, **self.get_headers())
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_import_with_unknown_format(self):
+        response = self.upload('contacts.txt', "first_name\r\n")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_import_without_authorization(self):
+        response = self.client.post(self.import_url, {})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -150,3 +150,71 @@ class ContactListTestCase(TestCase):
         }
         response = self.client.get(self.create_list, data=data, **headers)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_contact_with_cursor(self):
+        for index in range(14):
+            Contact.objects.create(first_name="first %s" % index, last_name="last", user=self.user)
+        data = {
+            'email': self.user_email,
+            'password': self.password
+        }
+
+        response = self.client.post(self.login_url, data, format='json')
+        token = response.json().get('token')
+        headers = {
+            'HTTP_AUTHORIZATION': "Token " + token
+        }
+        response = self.client.get(self.create_list, data={'cursor': ''}, **headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        first_page = response.json()
+        self.assertEqual(len(first_page['contacts']), 10)
+        self.assertEqual(first_page['contacts'][0]['id'], self.contact.id)
+        self.assertIsNotNone(first_page['next_cursor'])
+
+        response = self.client.get(self.create_list, data={'cursor': first_page['next_cursor']}, **headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        second_page = response.json()
+        self.assertEqual(len(second_page['contacts']), 5)
+        self.assertIsNone(second_page['next_cursor'])
+        ids = [contact['id'] for contact in first_page['contacts'] + second_page['contacts']]
+        self.assertEqual(ids, list(Contact.objects.filter(user=self.user).order_by('id').values_list('id', flat=True)))
+
+    def test_list_contact_with_invalid_cursor(self):
+        data = {
+            'email': self.user_email,
+            'password': self.password
+        }
+
+        response = self.client.post(self.login_url, data, format='json')
+        token = response.json().get('token')
+        headers = {
+            'HTTP_AUTHORIZATION': "Token " + token
+        }
+        response = self.client.get(self.create_list, data={'cursor': 'not-a-cursor'}, **headers)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_contact_by_phone(self):
+        other = Contact.objects.create(first_name="Other", last_name="Number", user=self.user)
+        PhoneNumber.objects.create(phone_number='555-0100', type='home', contact_object=other)
+        PhoneNumber.objects.create(phone_number='+1 (212) 555-0100', type='work', contact_object=other)
+        local = Contact.objects.create(first_name="Local", last_name="Number", user=self.user)
+        PhoneNumber.objects.create(phone_number='0100', type='home', contact_object=local)
+        data = {
+            'email': self.user_email,
+            'password': self.password
+        }
+
+        response = self.client.post(self.login_url, data, format='json')
+        token = response.json().get('token')
+        headers = {
+            'HTTP_AUTHORIZATION': "Token " + token
+        }
+        for phone, expected in (('+1 212 555 0100', [other.id]), ('212.555.0100', [other.id]),
+                                ('0100', [other.id, local.id]), ('1 (415) 555-0100', [other.id]),
+                                ('555 0199', [])):
+            response = self.client.get(self.create_list, data={'phone': phone}, **headers)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual([contact['id'] for contact in response.json()['contacts']], expected, phone)
+
+        response = self.client.get(self.create_list, data={'phone': '01'}, **headers)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
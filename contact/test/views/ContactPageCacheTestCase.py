@@ -0,0 +1,91 @@
+import re
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from contactbook.testing import AuthenticatedTestMixin
+
+from ...caches import PageCache
+from ...models import Contact
+from ...models import ContactCounter
+from ...models import PhoneNumber
+from ...views import ContactListView
+
+
+class ContactPageCacheTestCase(AuthenticatedTestMixin, TestCase):
+    def setUp(self):
+        ContactListView.page_cache.clear()
+        super().setUp()
+        self.contact = Contact.objects.create(first_name='Ada', last_name='Lovelace', user=self.user)
+        ContactCounter.repair(users=[self.user])
+        self.list_url = reverse('contact-list')
+        self.headers = self.get_headers()
+
+    def list(self, params=None, headers=None):
+        response = self.client.get(self.list_url, params or {}, **(headers or self.headers))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def test_pages_are_cached(self):
+        self.list()
+        # The token is cached as well.
+        with self.assertNumQueries(0):
+            contacts = self.list()['contacts']
+        self.assertEqual(contacts[0]['first_name'], 'Ada')
+        self.assertEqual(self.list({'fields': 'id', 'expand': ''})['contacts'], [{'id': self.contact.id}])
+        stats = ContactListView.page_cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['entries']), (1, 2, 2))
+        self.assertGreater(stats['bytes'], 0)
+
+    def test_lookups_are_on_metrics(self):
+        def count(result):
+            body = self.client.get(reverse('metrics')).content.decode()
+            match = re.search(r'^cache_lookups_total\{cache="contact-list",result="%s"\} (\d+)$' % result, body, re.M)
+            return int(match.group(1)) if match else 0
+
+        hits, misses = count('hit'), count('miss')
+        self.list()
+        self.list()
+        self.assertEqual((count('hit') - hits, count('miss') - misses), (1, 1))
+
+    def test_writes_bump_book_version(self):
+        self.list()
+        self.contact.first_name = 'Augusta'
+        self.contact.save()
+        self.assertEqual(self.list()['contacts'][0]['first_name'], 'Augusta')
+
+        PhoneNumber.objects.create(contact_object=self.contact, phone_number='555-0100', type='home')
+        self.assertEqual(len(self.list()['contacts'][0]['phone_numbers']), 1)
+
+        response = self.client.post(reverse('contact-batch'), {'operations': [
+            {'op': 'basic_update', 'id': self.contact.id, 'data': {'company': 'Analytical Engines'}},
+        ]}, content_type='application/json', **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.list()['contacts'][0]['company'], 'Analytical Engines')
+
+        response = self.client.delete(reverse('contact-delete', kwargs={'id': self.contact.id}), **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.list({'cursor': ''})['contacts'], [])
+        self.assertEqual(ContactListView.page_cache.stats()['hits'], 0)
+
+    def test_pages_are_per_user(self):
+        self.list()
+        other = User.objects.create_user('other@example.com', 'other@example.com', self.password)
+        Contact.objects.create(first_name='Grace', last_name='Hopper', user=other)
+        ContactCounter.repair(users=[other])
+        contacts = self.list(headers=self.get_headers('other@example.com'))['contacts']
+        self.assertEqual([contact['first_name'] for contact in contacts], ['Grace'])
+
+    def test_memory_budget(self):
+        cache = PageCache(100)
+        cache.set('a', 'A', 40)
+        cache.set('b', 'B', 40)
+        self.assertEqual(cache.get('a'), 'A')
+        cache.set('c', 'C', 40)
+        self.assertIsNone(cache.get('b'))
+        cache.set('d', 'D', 101)
+        self.assertIsNone(cache.get('d'))
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 2, 'evictions': 1, 'entries': 2, 'bytes': 80,
+                                         'max_bytes': 100})
@@ -0,0 +1,164 @@
+from unittest import mock
+
+from django.db import IntegrityError
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from contactbook.testing import AuthenticatedTestMixin
+
+from ...models import Contact
+from ...models import ContactCounter
+from ...models import EmailAddress
+from ...models import PhoneNumber
+from ...serializers import ContactSerializer
+
+
+class ContactQueryCountTestCase(AuthenticatedTestMixin, TestCase):
+    """
+    Lock in the number of queries each contact endpoint runs, including the
+    token lookup done by authentication on the first request with a token.
+    """
+    # Lists start with the validator: the counter and the newest date_modified. Full contacts are rendered from
+    # their snapshot, so only sparse fieldsets load children.
+    LIST_QUERIES = 4  # token, counter, validator, page
+    FILTERED_LIST_QUERIES = 5  # token, counter, validator, count, page
+    CURSOR_LIST_QUERIES = 4  # token, counter, validator, page
+    SPARSE_LIST_QUERIES = 4  # token, counter, validator, page
+    RETRIEVE_QUERIES = 2  # token, contact
+    EXPANDED_RETRIEVE_QUERIES = 3  # token, contact, phone numbers
+    # token, contact, email address, phone number, counter, plus the savepoint pair the test transaction turns the
+    # write transaction into. The new contact's date_modified isn't bumped again for its children. Duplicate emails
+    # are caught by the database.
+    CREATE_QUERIES = 7
+
+    def setUp(self):
+        super().setUp()
+        self.create_list = reverse('contact-list')
+        self.create_contact = reverse('contact-create')
+
+    def add_contacts(self, count):
+        contacts = []
+        for index in range(count):
+            contact = Contact.objects.create(first_name=self.fake.first_name(), last_name=self.fake.last_name(),
+                                             user=self.user)
+            PhoneNumber.objects.create(contact_object=contact, phone_number=self.fake.phone_number(), type='home')
+            PhoneNumber.objects.create(contact_object=contact, phone_number=self.fake.phone_number(), type='work')
+            EmailAddress.objects.create(contact_object=contact, email_address="%s%s" % (index, self.fake.email()),
+                                        type='work')
+            contacts.append(contact)
+        # The rows above bypass the serializer, so bring the counter in line.
+        ContactCounter.repair(users=[self.user])
+        return contacts
+
+    def test_list_queries_do_not_grow_with_page_size(self):
+        self.add_contacts(1)
+        headers = self.get_headers()
+        with self.assertNumQueries(self.LIST_QUERIES):
+            response = self.client.get(self.create_list, data={'page': 1}, **headers)
+        self.assertEqual(len(response.json()['contacts']), 1)
+
+        self.add_contacts(9)
+        # The token is cached by now.
+        with self.assertNumQueries(self.LIST_QUERIES - 1):
+            response = self.client.get(self.create_list, data={'page': 1}, **headers)
+        self.assertEqual(len(response.json()['contacts']), 10)
+        self.assertEqual(len(response.json()['contacts'][-1]['phone_numbers']), 2)
+
+    def test_list_with_cursor_queries(self):
+        self.add_contacts(10)
+        headers = self.get_headers()
+        with self.assertNumQueries(self.CURSOR_LIST_QUERIES):
+            response = self.client.get(self.create_list, data={'cursor': ''}, **headers)
+        self.assertEqual(len(response.json()['contacts']), 10)
+
+    def test_list_with_email_filter_queries(self):
+        contact = self.add_contacts(3)[1]
+        email_address = contact.contact_email_address.get().email_address
+        headers = self.get_headers()
+        with self.assertNumQueries(self.FILTERED_LIST_QUERIES):
+            response = self.client.get(self.create_list, data={'email': email_address}, **headers)
+        self.assertEqual(response.json()['contacts'][0]['id'], contact.id)
+
+    def test_sparse_list_skips_children(self):
+        self.add_contacts(10)
+        headers = self.get_headers()
+        data = {
+            'fields': 'id,first_name,last_name',
+            'expand': ''
+        }
+        with self.assertNumQueries(self.SPARSE_LIST_QUERIES):
+            response = self.client.get(self.create_list, data=data, **headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.json()['contacts'][0]), {'id', 'first_name', 'last_name'})
+
+    def test_list_with_unknown_field(self):
+        headers = self.get_headers()
+        response = self.client.get(self.create_list, data={'fields': 'id,password'}, **headers)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('fields', response.json())
+
+    def test_retrieve_with_one_expansion(self):
+        contact = self.add_contacts(1)[0]
+        headers = self.get_headers()
+        data = {
+            'fields': 'first_name',
+            'expand': 'phone_numbers'
+        }
+        with self.assertNumQueries(self.EXPANDED_RETRIEVE_QUERIES):
+            response = self.client.get("/contact/{}".format(contact.id), data=data, **headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.json()), {'first_name', 'phone_numbers'})
+        self.assertEqual(len(response.json()['phone_numbers']), 2)
+
+    def test_retrieve_queries(self):
+        contact = self.add_contacts(1)[0]
+        headers = self.get_headers()
+        with self.assertNumQueries(self.RETRIEVE_QUERIES):
+            response = self.client.get("/contact/{}".format(contact.id), **headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['phone_numbers']), 2)
+
+    def test_create_queries(self):
+        ContactCounter.total_for(self.user)
+        headers = self.get_headers()
+        data = {
+            'first_name': self.fake.first_name(),
+            'last_name': self.fake.last_name(),
+            'phone_number': self.fake.phone_number(),
+            'phone_number_type': 'home',
+            'email_address': self.fake.email(),
+            'email_type': 'home'
+        }
+        with self.assertNumQueries(self.CREATE_QUERIES):
+            response = self.client.post(self.create_contact, data, format='json', **headers)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['email_addresses'][0]['email_address'], data['email_address'])
+        self.assertEqual(response.json()['phone_numbers'][0]['phone_number'], data['phone_number'])
+
+    def test_duplicate_create_is_rolled_back(self):
+        contact = self.add_contacts(1)[0]
+        headers = self.get_headers()
+        data = {
+            'first_name': self.fake.first_name(),
+            'last_name': self.fake.last_name(),
+            'phone_number': self.fake.phone_number(),
+            'email_address': contact.contact_email_address.get().email_address,
+            'email_type': 'home'
+        }
+        total = ContactCounter.total_for(self.user)
+        response = self.client.post(self.create_contact, data, format='json', **headers)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json(), {'email': [" Contact already exists. "]})
+        self.assertEqual(Contact.objects.filter(user=self.user).count(), 1)
+        self.assertEqual(ContactCounter.total_for(self.user), total)
+
+    def test_other_integrity_errors_are_raised(self):
+        serializer = ContactSerializer(data={'first_name': 'Ada', 'last_name': 'Lovelace', 'email_type': 'work',
+                                             'email_address': 'ada@example.com'}, user=self.user)
+        self.assertTrue(serializer.is_valid())
+        error = IntegrityError('NOT NULL constraint failed: contacts_counters.total')
+        with mock.patch.object(ContactCounter, 'adjust', side_effect=error):
+            with self.assertRaises(IntegrityError):
+                serializer.save()
+        self.assertFalse(Contact.objects.filter(user=self.user).exists())
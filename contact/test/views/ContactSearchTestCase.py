@@ -0,0 +1,79 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from contactbook.testing import AuthenticatedTestMixin
+
+from ...models import Contact
+from ...search import ContactSearchIndex
+
+
+class ContactSearchTestCase(AuthenticatedTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.ada = Contact.objects.create(first_name='Ada', last_name='Lovelace', company='Analytical Engines',
+                                          designation='Mathematician', user=self.user)
+        self.grace = Contact.objects.create(first_name='Grace', last_name='Hopper', nickname='Amazing Grace',
+                                            company='US Navy', designation='Rear Admiral', user=self.user)
+        self.alan = Contact.objects.create(first_name='Alan', last_name='Turing', company='Adams Ltd',
+                                           designation='Ada programmer', user=self.user)
+        other = User.objects.create_user('other@example.com', 'other@example.com', self.password)
+        Contact.objects.create(first_name='Ada', last_name='Byron', user=other)
+        self.list_url = reverse('contact-list')
+
+    def search(self, query, **params):
+        params['q'] = query
+        response = self.client.get(self.list_url, params, **self.get_headers())
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def found(self, query):
+        return [contact['id'] for contact in self.search(query)['contacts']]
+
+    def test_search_ranks_names_first(self):
+        self.assertEqual(self.found('ada'), [self.ada.id, self.alan.id])
+        self.assertEqual(self.found('Admiral'), [self.grace.id])
+
+    def test_search_prefix_and_terms(self):
+        self.assertEqual(self.found('hop'), [self.grace.id])
+        self.assertEqual(self.found('grace navy'), [self.grace.id])
+        self.assertEqual(self.found('grace turing'), [])
+        self.assertEqual(self.found('"(ada*'), [self.ada.id, self.alan.id])
+        self.assertEqual(self.found('  '), [])
+
+    def test_search_follows_writes(self):
+        self.grace.company = 'Remington Rand'
+        self.grace.save()
+        self.assertEqual(self.found('navy'), [])
+        self.assertEqual(self.found('remington'), [self.grace.id])
+        Contact.objects.filter(pk=self.grace.id).update(last_name='Murray')
+        self.assertEqual(self.found('hopper'), [])
+        self.assertEqual(self.found('murray'), [self.grace.id])
+        self.alan.delete()
+        self.assertEqual(self.found('ada'), [self.ada.id])
+
+    def test_search_pagination(self):
+        Contact.objects.bulk_create([Contact(first_name='Bulk', last_name='Contact%d' % index, user=self.user)
+                                     for index in range(25)])
+        response = self.search('bulk', page=3)
+        self.assertEqual(response['total_contacts'], 25)
+        self.assertEqual(response['total_page'], 3)
+        self.assertEqual(response['current_page'], 3)
+        self.assertEqual(len(response['contacts']), 5)
+
+        response = self.client.get(self.list_url, {'q': 'bulk', 'cursor': ''}, **self.get_headers())
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_rebuild_command(self):
+        ContactSearchIndex.uninstall(connection)
+        Contact.objects.create(first_name='Edsger', last_name='Dijkstra', user=self.user)
+        out = StringIO()
+        call_command('rebuild_contact_search', stdout=out)
+        self.assertIn('Rebuilt the contact search index (5 contacts).', out.getvalue())
+        self.assertEqual(len(self.found('dijkstra')), 1)
+        self.assertEqual(self.found('lovelace'), [self.ada.id])
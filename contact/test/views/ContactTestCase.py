@@ -1,5 +1,7 @@
 from django.contrib.auth.models import User
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from faker import Faker
 from rest_framework import status
@@ -1273,3 +1275,164 @@ class ContactTestCase(TestCase):
                                       **headers)
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_partial_update_contact_without_changes(self):
+        user_data = {
+            'email': self.user_email,
+            'password': self.password
+        }
+
+        response = self.client.post(self.login_url, user_data, format='json')
+        headers = {
+            'HTTP_AUTHORIZATION': "Token " + response.json().get('token')
+        }
+        modified = Contact.objects.get(pk=self.contact.pk).date_modified
+
+        data = {
+            'first_name': self.first_name,
+            'nickname': self.nickname
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(self.partial_update_contact, data, content_type='application/json',
+                                         **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['nickname'], self.nickname)
+        self.assertFalse([query for query in queries if query['sql'].startswith('UPDATE')])
+        self.assertEqual(Contact.objects.get(pk=self.contact.pk).date_modified, modified)
+
+    def test_partial_update_contact_writes_changed_columns(self):
+        user_data = {
+            'email': self.user_email,
+            'password': self.password
+        }
+
+        response = self.client.post(self.login_url, user_data, format='json')
+        headers = {
+            'HTTP_AUTHORIZATION': "Token " + response.json().get('token')
+        }
+
+        data = {
+            'first_name': self.first_name,
+            'nickname': 'Changed'
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(self.partial_update_contact, data, content_type='application/json',
+                                         **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['nickname'], 'Changed')
+        updates = [query['sql'] for query in queries if query['sql'].startswith('UPDATE "contacts_people"')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"nickname"', updates[0])
+        self.assertIn('"date_modified"', updates[0])
+        self.assertNotIn('"first_name"', updates[0])
+
+    def test_update_contact_with_lists(self):
+        user_data = {
+            'email': self.user_email,
+            'password': self.password
+        }
+
+        response = self.client.post(self.login_url, user_data, format='json')
+        headers = {
+            'HTTP_AUTHORIZATION': "Token " + response.json().get('token')
+        }
+
+        data = {
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'phone_numbers': [
+                {'phone_number': self.phone_number, 'type': 'home'},
+                {'phone_number': '+1 555 0101', 'type': 'mobile'},
+            ],
+            'email_addresses': [{'email_address': 'replaced@example.com', 'type': 'work'}]
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put(self.update_contact, data, content_type='application/json', **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        phones = response.json()['phone_numbers']
+        self.assertEqual([(phone['phone_number'], phone['type']) for phone in phones],
+                         [(self.phone_number, 'home'), ('+1 555 0101', 'mobile')])
+        self.assertEqual(phones[0]['id'], self.phone_contact.id)
+        self.assertEqual(PhoneNumber.objects.get(phone_number='+1 555 0101').digits, '15550101')
+        self.assertEqual([email['email_address'] for email in response.json()['email_addresses']],
+                         ['replaced@example.com'])
+        self.assertEqual(len([query for query in queries if query['sql'].startswith('DELETE')]), 1)
+        self.assertFalse([query for query in queries if query['sql'].startswith('UPDATE "contacts_people" SET "first')])
+
+        # Empty lists remove every child.
+        data['phone_numbers'] = []
+        data['email_addresses'] = []
+        response = self.client.put(self.update_contact, data, content_type='application/json', **headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.json()['phone_numbers'], response.json()['email_addresses']), ([], []))
+
+    def test_update_contact_with_phone_list(self):
+        user_data = {
+            'email': self.user_email,
+            'password': self.password
+        }
+
+        response = self.client.post(self.login_url, user_data, format='json')
+        headers = {
+            'HTTP_AUTHORIZATION': "Token " + response.json().get('token')
+        }
+
+        data = {
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'phone_numbers': [{'phone_number': '+1 555 0101', 'type': 'mobile'}],
+        }
+        response = self.client.put(self.update_contact, data, content_type='application/json', **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([phone['phone_number'] for phone in response.json()['phone_numbers']], ['+1 555 0101'])
+        # The email addresses are kept as they are.
+        self.assertEqual([email['email_address'] for email in response.json()['email_addresses']],
+                         [self.email_address])
+
+    def test_update_contact_with_invalid_lists(self):
+        user_data = {
+            'email': self.user_email,
+            'password': self.password
+        }
+
+        response = self.client.post(self.login_url, user_data, format='json')
+        headers = {
+            'HTTP_AUTHORIZATION': "Token " + response.json().get('token')
+        }
+        other = Contact.objects.create(first_name='Ada', last_name='Lovelace', user=self.user)
+        EmailAddress.objects.create(contact_object=other, email_address='ada@example.com', type='other')
+
+        data = {
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'email_addresses': [{'email_address': self.email_address}, {'email_address': 'ada@example.com'}]
+        }
+        response = self.client.put(self.update_contact, data, content_type='application/json', **headers)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('email', response.json())
+
+        data['email_addresses'] = [{'email_address': self.email_address}, {'email_address': self.email_address}]
+        response = self.client.put(self.update_contact, data, content_type='application/json', **headers)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('email_addresses', response.json())
+
+        data['email_addresses'] = [{'email_address': self.email_address}]
+        data['email_address'] = 'single@example.com'
+        response = self.client.put(self.update_contact, data, content_type='application/json', **headers)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        # The contact's own address can stay.
+        del data['email_address']
+        response = self.client.put(self.update_contact, data, content_type='application/json', **headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(EmailAddress.objects.get(contact_object=self.contact).id, self.email_contact.id)
+
+        response = self.client.post(self.create_contact, dict(data, email_address='new@example.com',
+                                                              email_type='home'),
+                                    content_type='application/json', **headers)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('email_addresses', response.json())
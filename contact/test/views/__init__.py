@@ -1,2 +1,11 @@
+from .ContactAutocompleteTestCase import ContactAutocompleteTestCase
+from .ContactBatchTestCase import ContactBatchTestCase
+from .ContactCacheTestCase import ContactCacheTestCase
+from .ContactETagTestCase import ContactETagTestCase
+from .ContactExportTestCase import ContactExportTestCase
+from .ContactImportTestCase import ContactImportTestCase
 from .ContactListTestCase import ContactListTestCase
+from .ContactPageCacheTestCase import ContactPageCacheTestCase
+from .ContactQueryCountTestCase import ContactQueryCountTestCase
+from .ContactSearchTestCase import ContactSearchTestCase
 from .ContactTestCase import ContactTestCase
@@ -1,6 +1,10 @@
 from django.conf.urls import url
 from rest_framework import routers
 
+from .views import ContactAutocompleteView
+from .views import ContactBatchView
+from .views import ContactExportView
+from .views import ContactImportView
 from .views import ContactListView
 from .views import ContactView
 
@@ -12,5 +16,9 @@ urlpatterns = [
     url(r'(?P<id>[\d+])/update$', ContactView.as_view(), name='contact-update'),
     url(r'(?P<id>[\d+])/basic-update$', ContactView.as_view(), name='contact-basic-update'),
     url(r'(?P<id>[\d+])/delete$', ContactView.as_view(), name='contact-delete'),
+    url(r'autocomplete$', ContactAutocompleteView.as_view(), name='contact-autocomplete'),
+    url(r'batch$', ContactBatchView.as_view(), name='contact-batch'),
+    url(r'export$', ContactExportView.as_view(), name='contact-export'),
+    url(r'import$', ContactImportView.as_view(), name='contact-import'),
     url(r'^$', ContactListView.as_view(), name='contact-list'),
 ]
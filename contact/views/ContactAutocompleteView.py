@@ -0,0 +1,37 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ..search import ContactAutocomplete
+
+
+class ContactAutocompleteView(APIView):
+    """
+    Suggest contacts whose first name, last name or nickname has words
+    starting with every word of `?q=`, for typeahead. Served from an
+    in-memory index (see `ContactAutocomplete`), not the database.
+    """
+    permission_classes = (IsAuthenticated,)
+    default_limit = 10
+    max_limit = 50
+
+    def get(self, request):
+        try:
+            limit = int(request.GET.get('limit', self.default_limit))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= self.max_limit:
+            return Response({'limit': ["Choose a number from 1 to %d." % self.max_limit]},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        suggestions = []
+        for pk, first_name, last_name, nickname in ContactAutocomplete.suggest(
+                request.user, request.GET.get('q', ''), limit):
+            suggestions.append({
+                'id': pk,
+                'first_name': first_name,
+                'last_name': last_name,
+                'nickname': nickname,
+            })
+        return Response({'suggestions': suggestions})
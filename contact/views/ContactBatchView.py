@@ -0,0 +1,26 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ..bulk import ContactBatch
+
+
+class ContactBatchView(APIView):
+    """
+    Create, update and delete many contacts in one request. Takes
+    `{'operations': [...]}` (see `ContactBatch`) and returns a result per
+    operation, in order, with the status and body its own endpoint would give.
+    """
+    permission_classes = (IsAuthenticated,)
+    max_operations = 500
+
+    def post(self, request):
+        operations = request.data.get('operations') if isinstance(request.data, dict) else None
+        if not isinstance(operations, list):
+            return Response({'operations': ["Expected a list of operations."]}, status=status.HTTP_400_BAD_REQUEST)
+        if len(operations) > self.max_operations:
+            return Response({'operations': ["Ensure this list has no more than %d operations." % self.max_operations]},
+                            status=status.HTTP_400_BAD_REQUEST)
+        results = ContactBatch(request.user).run(operations)
+        return Response({'results': results}, status=status.HTTP_200_OK)
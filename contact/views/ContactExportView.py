@@ -0,0 +1,26 @@
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ..exporters import ContactExporter
+
+
+class ContactExportView(APIView):
+    """
+    Export all of the user's contacts with their phone numbers and email
+    addresses. `?output=ndjson` (default) or `?output=csv`.
+    """
+    permission_classes = (IsAuthenticated,)
+
+    def get(self, request):
+        output = request.GET.get('output', 'ndjson')
+        if output not in ContactExporter.content_types:
+            return Response({'output': ["Choose one of: %s." % ", ".join(sorted(ContactExporter.content_types))]},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        exporter = ContactExporter(request.user)
+        response = StreamingHttpResponse(exporter.stream(output), content_type=ContactExporter.content_types[output])
+        response['Content-Disposition'] = 'attachment; filename="contacts.%s"' % output
+        return response
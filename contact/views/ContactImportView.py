@@ -0,0 +1,50 @@
+import io
+
+from rest_framework import status
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ..importers import ContactImporter
+from ..importers import CsvParser
+from ..importers import VCardParser
+
+
+class ContactImportView(APIView):
+    """
+    Import contacts from an uploaded CSV or vCard `file`. The format comes
+    from `?input=csv|vcard` or else the file extension. Valid rows are
+    imported and invalid ones reported with their position in the file.
+    """
+    permission_classes = (IsAuthenticated,)
+    parser_classes = (MultiPartParser, FormParser)
+    parsers = {
+        'csv': CsvParser,
+        'vcard': VCardParser,
+    }
+    extensions = {
+        '.csv': 'csv',
+        '.vcf': 'vcard',
+        '.vcard': 'vcard',
+    }
+
+    def post(self, request):
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'file': ["No file was submitted."]}, status=status.HTTP_400_BAD_REQUEST)
+
+        input_format = request.GET.get('input')
+        if not input_format:
+            name = upload.name.lower()
+            input_format = next((value for key, value in self.extensions.items() if name.endswith(key)), None)
+        if input_format not in self.parsers:
+            return Response({'input': ["Choose one of: %s." % ", ".join(sorted(self.parsers))]},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        stream = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+        try:
+            report = ContactImporter(request.user).run(self.parsers[input_format](stream))
+        except UnicodeDecodeError:
+            return Response({'file': ["The file must be UTF-8 encoded."]}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(report, status=status.HTTP_200_OK)
@@ -1,37 +1,115 @@
+from django.conf import settings
 from django.core.paginator import Paginator, EmptyPage
+from django.db.models import Max
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from ..caches import BookVersion
+from ..caches import PageCache
+from ..etags import ContactETag
+from ..fieldsets import ContactFieldset, InvalidFieldset
 from ..models import Contact
+from ..models import ContactCounter
+from ..models import PhoneNumber
+from ..pagination import CountedPaginator, CursorPaginator, InvalidCursor
+from ..renderers import FastJSONRenderer, JSONFragment
+from ..search import ContactSearchIndex
 
 
 class ContactListView(APIView):
+    """
+    List the user's contacts.
+
+    Pages are addressed by number (`?page=`) by default. Passing `?cursor=`
+    (empty for the first page) switches to keyset pagination, which seeks on
+    the user_id index, whose entries end in the id, instead of using OFFSET
+    and skips the COUNT(*).
+    Unfiltered page-number listings take their totals from `ContactCounter`.
+    `?phone=` finds contacts by the trailing digits of a phone number (see
+    `PhoneNumber.matching`).
+    `?q=` searches names, nickname, company and designation through
+    `ContactSearchIndex` and returns the best matches first; search results
+    are paged by number only.
+    Both modes accept `?fields=` and `?expand=` (see `ContactFieldset`).
+    Responses carry an ETag and Last-Modified from the newest change to the
+    book (see `ContactETag`), checked before the page is fetched.
+
+    Rendered pages are kept encoded in `page_cache` per user and query string, under
+    the user's `BookVersion`, so any write to the book invalidates them all, and
+    for at most `CONTACT_PAGE_CACHE_TIMEOUT` seconds. The page cache is per
+    process and relies on the version being shared, so it's off when the
+    contact cache is too.
+    """
     permission_classes = (IsAuthenticated,)
+    page_size = 10
+    page_cache = PageCache(getattr(settings, 'CONTACT_PAGE_CACHE_BYTES', 16 * 1024 * 1024),
+                           getattr(settings, 'CONTACT_PAGE_CACHE_TIMEOUT', 60), name='contact-list')
 
     def get(self, request):
         filter_email = request.GET.get('email')
+        query = request.GET.get('q')
+        filter_phone = request.GET.get('phone')
+        if filter_phone is not None and len(PhoneNumber.normalize(filter_phone)[0]) < PhoneNumber.MIN_LOOKUP_DIGITS:
+            return Response({'phone': ["Enter at least %d digits." % PhoneNumber.MIN_LOOKUP_DIGITS]},
+                            status=status.HTTP_400_BAD_REQUEST)
+        try:
+            fieldset = ContactFieldset.from_request(request)
+        except InvalidFieldset as e:
+            return Response(e.errors, status=status.HTTP_400_BAD_REQUEST)
         try:
             contacts = Contact.objects.filter(user=request.user)
             if filter_email:
                 contacts = contacts.filter(contact_email_address__email_address=filter_email)
+            if filter_phone is not None:
+                contacts = contacts.filter(
+                    pk__in=PhoneNumber.matching(filter_phone).values('contact_object_id'))
             contacts = contacts.order_by('id')
-            paginator = Paginator(contacts, 10)
+            if query is not None:
+                contacts = ContactSearchIndex.search(contacts, query)
+            contacts = fieldset.apply(contacts)
         except Contact.DoesNotExist:
             return Response({'error': 'Not Found'}, status=status.HTTP_404_NOT_FOUND)
-        if not filter_email:
+        if 'cursor' in request.GET and query is not None:
+            return Response({'error': 'Search results are not available with cursor'},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        key = None
+        if BookVersion.shared():
+            params = tuple((name, tuple(values)) for name, values in sorted(request.GET.lists()))
+            key = (request.user.pk, BookVersion.get(request.user.pk), params)
+        cached = self.page_cache.get(key) if key is not None else None
+        if cached is not None:
+            etag, modified, data = cached
+            return ContactETag.not_modified(request, etag, modified) or ContactETag.tag(Response(data), etag, modified)
+
+        total = ContactCounter.total_for(request.user)
+        modified = Contact.objects.filter(user=request.user).aggregate(modified=Max('date_modified'))['modified']
+        etag = ContactETag.for_list(request, modified, total)
+        not_modified = ContactETag.not_modified(request, etag, modified)
+        if not_modified:
+            return not_modified
+
+        if 'cursor' in request.GET:
+            response = self.get_cursor_page(contacts, request.GET.get('cursor'), fieldset)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            return self.cache_page(key, etag, modified, response.data)
+        if not filter_email and filter_phone is None and query is None:
+            paginator = CountedPaginator(contacts, self.page_size, total)
             page = int(request.GET.get('page', 1))
         else:
-            page = 1
+            paginator = Paginator(contacts, self.page_size)
+            page = int(request.GET.get('page', 1)) if not filter_email else 1
         try:
             page_contacts = paginator.page(page)
         except EmptyPage:
             return Response({'error': 'Page Not Found'}, status=status.HTTP_404_NOT_FOUND)
 
         contact_data = []
-        for contact in page_contacts:
-            contact_data.append(contact.to_representation())
+        for contact in fieldset.load(list(page_contacts)):
+            contact_data.append(fieldset.render(contact))
         response = {
             'current_page': page,
             'next_page': page_contacts.next_page_number() if page_contacts.has_next() else None,
@@ -40,4 +118,28 @@ class ContactListView(APIView):
             'total_contacts': paginator.count,
             'contacts': contact_data
         }
+        return self.cache_page(key, etag, modified, response)
+
+    def cache_page(self, key, etag, modified, data):
+        # Kept encoded, so hits aren't encoded again, and budgeted by that size.
+        data = JSONFragment(FastJSONRenderer().render(data))
+        if key is not None:
+            self.page_cache.set(key, (etag, modified, data), len(data))
+        return ContactETag.tag(Response(data), etag, modified)
+
+    def get_cursor_page(self, contacts, cursor, fieldset):
+        paginator = CursorPaginator(contacts, self.page_size)
+        try:
+            page_contacts, next_cursor = paginator.page(cursor)
+        except InvalidCursor:
+            return Response({'error': 'Invalid cursor'}, status=status.HTTP_400_BAD_REQUEST)
+
+        contact_data = []
+        for contact in fieldset.load(page_contacts):
+            contact_data.append(fieldset.render(contact))
+        response = {
+            'cursor': cursor or None,
+            'next_cursor': next_cursor,
+            'contacts': contact_data
+        }
         return Response(response)
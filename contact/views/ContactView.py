@@ -1,9 +1,16 @@
+from django.db import transaction
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from ..caches import ContactCache
+from ..caches import ContactChanges
+from ..etags import ContactETag
+from ..fieldsets import ContactFieldset, InvalidFieldset
+from ..loaders import ContactLoader
 from ..models import Contact
+from ..models import ContactCounter
 from ..serializers import ContactInfoSerializer
 from ..serializers import ContactSerializer
 
@@ -13,24 +20,53 @@ class ContactView(APIView):
 
     def get(self, request, id):
         try:
-            contact = Contact.objects.get(pk=id, user=request.user)
+            fieldset = ContactFieldset.from_request(request)
+        except InvalidFieldset as e:
+            return Response(e.errors, status=status.HTTP_400_BAD_REQUEST)
+        if fieldset.is_default:
+            # Full renders are served from ContactCache, with their validator.
+            cached = ContactCache.get(request.user, int(id), lambda: self.render(request.user, id, fieldset))
+            if cached is None:
+                return Response({'error': 'Not Found'}, status=status.HTTP_404_NOT_FOUND)
+            etag = ContactETag.for_contact(request, id, cached['date_modified'])
+            return ContactETag.not_modified(request, etag, cached['date_modified']) or ContactETag.tag(
+                Response(cached['contact']), etag, cached['date_modified'])
+
+        try:
+            contact = fieldset.apply(Contact.objects.filter(user=request.user), 'date_modified').get(pk=id)
         except Contact.DoesNotExist:
             return Response({'error': 'Not Found'}, status=status.HTTP_404_NOT_FOUND)
-        return Response(contact.to_representation())
+        etag = ContactETag.for_contact(request, id, contact.date_modified)
+        not_modified = ContactETag.not_modified(request, etag, contact.date_modified)
+        if not_modified:
+            return not_modified
+        fieldset.load([contact])
+        return ContactETag.tag(Response(fieldset.render(contact)), etag, contact.date_modified)
+
+    @staticmethod
+    def render(user, id, fieldset):
+        try:
+            contact = Contact.objects.filter(user=user).get(pk=id)
+        except Contact.DoesNotExist:
+            return None
+        fieldset.load([contact])
+        return {'date_modified': contact.date_modified, 'contact': fieldset.render(contact)}
 
     def post(self, request):
         serializer = ContactSerializer(data=request.data, user=self.request.user)
         if serializer.is_valid():
             contact = serializer.save()
             if contact:
-                return Response(contact.to_representation(), status=status.HTTP_201_CREATED)
+                return Response(serializer.data, status=status.HTTP_201_CREATED)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     def delete(self, request, id):
         try:
-            contact = Contact.objects.get(pk=id, user=request.user)
-            contact.delete()
+            with transaction.atomic(), ContactChanges.collect():
+                contact = Contact.objects.get(pk=id, user=request.user)
+                contact.delete()
+                ContactCounter.adjust(request.user, -1)
         except Contact.DoesNotExist:
             return Response({'error': 'Not Found'}, status=status.HTTP_404_NOT_FOUND)
         return Response({'success': True})
@@ -46,7 +82,7 @@ class ContactView(APIView):
         if serializer.is_valid():
             contact = serializer.save()
             if contact:
-                return Response(contact.to_representation(), status=status.HTTP_200_OK)
+                return Response(serializer.data, status=status.HTTP_200_OK)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -61,6 +97,7 @@ class ContactView(APIView):
         if serializer.is_valid():
             contact = serializer.save()
             if contact:
+                ContactLoader.load([contact])
                 return Response(contact.to_representation(), status=status.HTTP_200_OK)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -1,2 +1,6 @@
+from .ContactAutocompleteView import ContactAutocompleteView
+from .ContactBatchView import ContactBatchView
+from .ContactExportView import ContactExportView
+from .ContactImportView import ContactImportView
 from .ContactListView import ContactListView
 from .ContactView import ContactView
@@ -38,10 +38,13 @@ INSTALLED_APPS = [
     'rest_framework',
     'rest_framework.authtoken',
     'accounts',
-    'contact'
+    'contact',
+    'monitoring',
 ]
 
 MIDDLEWARE = [
+    'monitoring.middleware.RequestMetricsMiddleware',
+    'monitoring.middleware.RequestTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -81,6 +84,82 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/2.2/topics/cache/
+# Contact renders, book versions and tokens are cached here and invalidated by writes, so every worker must use the
+# same cache: the file backend is shared by the workers of one machine, use memcached or redis across machines. A
+# per-process backend such as LocMemCache leaves other workers serving stale data.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': '/var/tmp/contactbook_cache',
+        'OPTIONS': {
+            'MAX_ENTRIES': 5000,
+        },
+    }
+}
+
+# Cache holding rendered contacts for the retrieve api, and their lifetime in seconds.
+CONTACT_CACHE = 'default'
+CONTACT_CACHE_TIMEOUT = 300
+
+# Serve contacts in their default representation from the snapshot column kept by database triggers (SQLite only).
+CONTACT_SNAPSHOTS = True
+
+# Cache of resolved api tokens, and how long in seconds a token stays valid there after it's deleted or its
+# user is changed without model signals (e.g. by a queryset update).
+AUTH_TOKEN_CACHE = 'default'
+AUTH_TOKEN_CACHE_TIMEOUT = 60
+
+# 'db' issues rest_framework authtoken tokens (`Authorization: Token <key>`) on login and register, 'signed' issues
+# stateless expiring tokens (`Authorization: Bearer <token>`) with a refresh token for /user/token/refresh/. Api tokens
+# are accepted in either mode, signed ones only in 'signed' mode. Lifetimes are in seconds.
+AUTH_TOKEN_MODE = 'db'
+AUTH_SIGNED_TOKEN_TTL = 15 * 60
+AUTH_REFRESH_TOKEN_TTL = 14 * 24 * 60 * 60
+
+# Memory budget in bytes of the in-process cache of list api pages, 0 turns it off, and how long in seconds a page is
+# kept. It's off as well when CONTACT_CACHE is per process, which couldn't tell it about other workers' writes.
+CONTACT_PAGE_CACHE_BYTES = 16 * 1024 * 1024
+CONTACT_PAGE_CACHE_TIMEOUT = 60
+
+# Share of requests (0 to 1) timed by `RequestTimingMiddleware`, which adds a Server-Timing header and logs a JSON line
+# to the `monitoring.requests` logger. Requests to the named urls running more queries than their budget are logged as
+# warnings, or fail with MONITORING_ENFORCE_BUDGETS, which the test runner turns on. Budgets leave room for the token
+# lookup, creating a missing contact counter and the savepoints of tests.
+MONITORING_SAMPLE_RATE = 0.1
+MONITORING_ENFORCE_BUDGETS = False
+MONITORING_QUERY_BUDGETS = {
+    'account-register': 10,
+    'account-signin': 5,
+    'contact-autocomplete': 3,
+    'contact-basic-update': 6,
+    'contact-create': 14,
+    'contact-list': 10,
+    'contact-retrieve': 4,
+    'contact-update': 15,
+}
+TEST_RUNNER = 'monitoring.runners.QueryBudgetTestRunner'
+
+# Request counts and latency histograms per url name are served at /metrics in the Prometheus text format. Left at None,
+# MONITORING_METRICS_DIR makes /metrics show only the numbers of the worker process answering it; with several workers,
+# point it at a directory they share on one machine (stopped workers are told by pid, so not across containers) and
+# /metrics adds them all up, including workers that have stopped. Set MONITORING_METRICS_TOKEN to require
+# `Authorization: Bearer <token>` from scrapers; without it /metrics only answers requests from this host, or any request
+# with DEBUG on.
+MONITORING_METRICS_DIR = None
+MONITORING_METRICS_TOKEN = None
+
+# Statements slower than MONITORING_SLOW_QUERY_MS (None turns it off) are logged with their plan to the
+# `monitoring.queries` logger and aggregated by fingerprint, keeping at most MONITORING_SLOW_QUERY_FINGERPRINTS of them.
+# Parameter values aren't logged. A timer logs the top MONITORING_SLOW_QUERY_TOP by total time
+# MONITORING_SLOW_QUERY_REPORT_INTERVAL seconds after the first slow statement, and then starts over.
+MONITORING_SLOW_QUERY_MS = 100
+MONITORING_SLOW_QUERY_FINGERPRINTS = 100
+MONITORING_SLOW_QUERY_TOP = 10
+MONITORING_SLOW_QUERY_REPORT_INTERVAL = 300
+
 # Password validation
 # https://docs.djangoproject.com/en/2.2/ref/settings/#auth-password-validators
 
@@ -99,10 +178,33 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# The first hasher hashes new and rehashed passwords, the others only verify existing hashes. To move to a new scheme
+# or cost, put it first: each password is rehashed with it at its user's next login.
+PASSWORD_HASHERS = [
+    'accounts.hashers.TunedPBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+]
+AUTH_PASSWORD_ITERATIONS = 150000
+
+# How many login password checks may run at once (0 doesn't limit them) and how many may be running or waiting before
+# further logins get a 429. The limits hold for all worker processes sharing AUTH_PASSWORD_LOCK_DIR, so for one
+# machine, whether they are sync or threaded.
+AUTH_PASSWORD_WORKERS = 0
+AUTH_PASSWORD_QUEUE = 32
+AUTH_PASSWORD_LOCK_DIR = '/var/tmp/contactbook_password_slots'
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework.authentication.TokenAuthentication',
-    )
+        'accounts.authentication.CachedTokenAuthentication',
+        'accounts.authentication.SignedTokenAuthentication',
+    ),
+    # Encodes with orjson when it's installed and writes pre-encoded contacts as they are.
+    'DEFAULT_RENDERER_CLASSES': (
+        'contact.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
 }
 
 # Internationalization
@@ -0,0 +1,28 @@
+from django.contrib.auth.models import User
+from django.urls import reverse
+from faker import Faker
+
+
+class AuthenticatedTestMixin(object):
+    """
+    Creates `self.user` for api tests, and signs in through the login api
+    for the `Authorization` header of their requests.
+    """
+    password = 'testpassword'
+
+    def setUp(self):
+        super().setUp()
+        self.fake = Faker()
+        self.user_email = self.fake.email()
+        self.user = User.objects.create_user(self.user_email, self.user_email, self.password)
+        self.login_url = reverse('account-signin')
+
+    def get_headers(self, email=None):
+        data = {
+            'email': email or self.user_email,
+            'password': self.password
+        }
+        response = self.client.post(self.login_url, data, format='json')
+        return {
+            'HTTP_AUTHORIZATION': "Token " + response.json().get('token')
+        }
@@ -20,4 +20,5 @@ urlpatterns = [
     url(r'^admin/', admin.site.urls),
     url(r'^contact', include('contact.urls')),
     url(r'^user/', include('accounts.urls')),
+    url(r'^metrics', include('monitoring.urls')),
 ]
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+
+class MonitoringConfig(AppConfig):
+    name = 'monitoring'
+
+    def ready(self):
+        from .queries import SlowQueryLog
+        connection_created.connect(SlowQueryLog.install, weak=False, dispatch_uid='monitoring.slow_query_log')
@@ -0,0 +1,21 @@
+from .RequestMetrics import RequestMetrics
+
+
+class CacheMetrics(object):
+    """
+    Lookups and evictions of in-process caches by cache name, in
+    `RequestMetrics.registry` so they're served at /metrics, e.g.
+    `sum(rate(cache_lookups_total{result="hit"}[5m])) by (cache)` over all
+    lookups for the hit ratio.
+    """
+    lookups = RequestMetrics.registry.counter('cache_lookups_total', "Cache lookups, by cache and result (hit or miss).")
+    evictions = RequestMetrics.registry.counter('cache_evictions_total',
+                                                "Entries evicted to stay within the cache's size, by cache.")
+
+    @classmethod
+    def lookup(cls, cache, hit):
+        cls.lookups.inc(cache=cache, result='hit' if hit else 'miss')
+
+    @classmethod
+    def evicted(cls, cache, count):
+        cls.evictions.inc(count, cache=cache)
@@ -0,0 +1,9 @@
+class Counter(object):
+    """A counter of a `MetricsRegistry`, one value per set of labels."""
+
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+
+    def inc(self, amount=1, **labels):
+        self.registry.inc(self.name, labels, amount)
@@ -0,0 +1,9 @@
+class Histogram(object):
+    """A histogram of a `MetricsRegistry`, with the registry's buckets, one per set of labels."""
+
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+
+    def observe(self, value, **labels):
+        self.registry.observe(self.name, labels, value)
@@ -0,0 +1,204 @@
+import fcntl
+import json
+import os
+import tempfile
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from threading import Lock
+
+from django.conf import settings
+
+from .Counter import Counter
+from .Histogram import Histogram
+
+
+class MetricsRegistry(object):
+    """
+    In-process counters and fixed-bucket histograms, rendered in the
+    Prometheus text format.
+
+    With `MONITORING_METRICS_DIR` set, each process writes its values to
+    `<pid>.json` there, at most every `flush_interval` seconds, and `render`
+    sums the files of every process, so the workers of a server share one
+    set of metrics without any other service. The values of stopped workers
+    are added to `archived.json` and their files removed, so totals never go
+    down. Whether a worker is running is told by its pid, so the directory
+    must only be shared by processes that see each other's pids (one
+    machine, one container). A process forked with values (e.g. by a
+    preloading server) starts over.
+    """
+
+    def __init__(self, flush_interval=1.0):
+        self.flush_interval = flush_interval
+        self.metrics = {}
+        self.lock = Lock()
+        self.reset()
+
+    def reset(self):
+        self.pid = os.getpid()
+        self.flushed = 0
+        # (name, sorted label items) -> value, or bucket counts followed by sum and count.
+        self.values = {}
+
+    def counter(self, name, documentation):
+        self.metrics[name] = ('counter', documentation, None)
+        return Counter(self, name)
+
+    def histogram(self, name, documentation, buckets):
+        self.metrics[name] = ('histogram', documentation, tuple(sorted(buckets)))
+        return Histogram(self, name)
+
+    def inc(self, name, labels, amount=1):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.check_pid()
+            self.values[key] = self.values.get(key, 0) + amount
+        self.maybe_flush()
+
+    def observe(self, name, labels, value):
+        buckets = self.metrics[name][2]
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.check_pid()
+            counts = self.values.get(key)
+            if counts is None:
+                # One count per bucket plus +Inf, then sum and count.
+                counts = self.values[key] = [0] * (len(buckets) + 1) + [0.0, 0]
+            counts[bisect_left(buckets, value)] += 1
+            counts[-2] += value
+            counts[-1] += 1
+        self.maybe_flush()
+
+    def check_pid(self):
+        if os.getpid() != self.pid:
+            self.reset()
+
+    @staticmethod
+    def directory():
+        return getattr(settings, 'MONITORING_METRICS_DIR', None)
+
+    def snapshot(self):
+        with self.lock:
+            self.check_pid()
+            return [[name, [list(label) for label in labels], value] for (name, labels), value in self.values.items()]
+
+    def maybe_flush(self):
+        if self.directory() and time.monotonic() - self.flushed >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Write this process's values to its file, replacing it in one step."""
+        directory = self.directory()
+        if not directory:
+            return
+        self.flushed = time.monotonic()
+        os.makedirs(directory, exist_ok=True)
+        handle, path = tempfile.mkstemp(dir=directory, prefix='.%d-' % self.pid)
+        with os.fdopen(handle, 'w') as output:
+            json.dump(self.snapshot(), output)
+        os.replace(path, os.path.join(directory, '%d.json' % self.pid))
+
+    def collect(self):
+        """Values summed over every process writing to the directory, or of this process."""
+        directory = self.directory()
+        if not directory:
+            snapshots = [self.snapshot()]
+        else:
+            self.flush()
+            with open(os.path.join(directory, '.lock'), 'w') as lock:
+                # Keeps another process from archiving files while they're read here.
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                self.archive(directory)
+                snapshots = []
+                for filename in os.listdir(directory):
+                    if filename.endswith('.json'):
+                        snapshot = self.read(os.path.join(directory, filename))
+                        if snapshot is not None:
+                            snapshots.append(snapshot)
+        return self.add(snapshots, names=self.metrics)
+
+    def archive(self, directory):
+        """Move the values of stopped processes into `archived.json`; call it holding the directory's lock."""
+        paths = [os.path.join(directory, filename) for filename in os.listdir(directory)
+                 if filename.endswith('.json') and filename[:-5].isdigit() and not self.alive(int(filename[:-5]))]
+        if not paths:
+            return
+        archived = os.path.join(directory, 'archived.json')
+        snapshots = [snapshot for snapshot in map(self.read, paths + [archived]) if snapshot is not None]
+        handle, path = tempfile.mkstemp(dir=directory, prefix='.archived-')
+        with os.fdopen(handle, 'w') as output:
+            json.dump([[name, [list(label) for label in labels], value]
+                       for (name, labels), value in self.add(snapshots).items()], output)
+        os.replace(path, archived)
+        for path in paths:
+            os.remove(path)
+
+    @staticmethod
+    def read(path):
+        try:
+            with open(path) as source:
+                return json.load(source)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def add(snapshots, names=None):
+        """Sum snapshots by metric and labels, keeping only `names` if given."""
+        totals = {}
+        for snapshot in snapshots:
+            for name, labels, value in snapshot:
+                if names is not None and name not in names:
+                    continue
+                key = (name, tuple(tuple(label) for label in labels))
+                if isinstance(value, list):
+                    total = totals.setdefault(key, [0] * len(value))
+                    totals[key] = [a + b for a, b in zip(total, value)]
+                else:
+                    totals[key] = totals.get(key, 0) + value
+        return totals
+
+    @staticmethod
+    def alive(pid):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    def render(self):
+        grouped = defaultdict(list)
+        for (name, labels), value in sorted(self.collect().items()):
+            grouped[name].append((labels, value))
+        lines = []
+        for name, (kind, documentation, buckets) in sorted(self.metrics.items()):
+            lines.append('# HELP %s %s' % (name, documentation))
+            lines.append('# TYPE %s %s' % (name, kind))
+            for labels, value in grouped[name]:
+                if kind == 'counter':
+                    lines.append('%s%s %s' % (name, self.labels(labels), self.number(value)))
+                    continue
+                cumulative = 0
+                for bound, count in zip(buckets + (float('inf'),), value):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else self.number(bound)
+                    lines.append('%s_bucket%s %d' % (name, self.labels(labels + (('le', le),)), cumulative))
+                lines.append('%s_sum%s %s' % (name, self.labels(labels), self.number(value[-2])))
+                lines.append('%s_count%s %d' % (name, self.labels(labels), value[-1]))
+        return '\n'.join(lines) + '\n'
+
+    @classmethod
+    def labels(cls, labels):
+        if not labels:
+            return ''
+        return '{%s}' % ','.join('%s="%s"' % (name, cls.escape(value)) for name, value in labels)
+
+    @staticmethod
+    def escape(value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    @staticmethod
+    def number(value):
+        return repr(float(value)) if isinstance(value, float) else str(value)
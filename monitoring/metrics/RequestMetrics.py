@@ -0,0 +1,25 @@
+from django.conf import settings
+
+from .MetricsRegistry import MetricsRegistry
+
+# Upper bounds in seconds, from a cached read to a slow import.
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class RequestMetrics(object):
+    """
+    Request counts and latency per url name, for `RequestMetricsMiddleware`
+    to record and `MetricsView` to expose. Percentiles come from the
+    latency histogram, e.g. `histogram_quantile(0.95, ...)` in Prometheus.
+    """
+    registry = MetricsRegistry()
+    requests = registry.counter('http_requests_total', "Requests handled, by url name, method and status.")
+    latency = registry.histogram('http_request_duration_seconds', "Time to handle a request, by url name.",
+                                 getattr(settings, 'MONITORING_LATENCY_BUCKETS', DEFAULT_LATENCY_BUCKETS))
+
+    @classmethod
+    def record(cls, request, response, seconds):
+        match = request.resolver_match
+        view = (match.url_name or match.view_name) if match else 'unmatched'
+        cls.requests.inc(view=view, method=request.method, status=response.status_code)
+        cls.latency.observe(seconds, view=view)
@@ -0,0 +1,5 @@
+from .CacheMetrics import CacheMetrics
+from .Counter import Counter
+from .Histogram import Histogram
+from .MetricsRegistry import MetricsRegistry
+from .RequestMetrics import RequestMetrics
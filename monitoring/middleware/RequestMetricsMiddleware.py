@@ -0,0 +1,20 @@
+import time
+
+from ..metrics import RequestMetrics
+
+
+class RequestMetricsMiddleware(object):
+    """
+    Count every request and time it into `RequestMetrics`. Should be first
+    in `MIDDLEWARE`, before `RequestTimingMiddleware`, so the time covers
+    the others.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        started = time.perf_counter()
+        response = self.get_response(request)
+        RequestMetrics.record(request, response, time.perf_counter() - started)
+        return response
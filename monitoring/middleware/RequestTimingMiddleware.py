@@ -0,0 +1,75 @@
+import json
+import logging
+import random
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from ..timings import RequestTimings
+
+logger = logging.getLogger('monitoring.requests')
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+class RequestTimingMiddleware(object):
+    """
+    Time a sample of requests (`MONITORING_SAMPLE_RATE`, 0 to 1): SQL query
+    count and time, rendering time and total time, sent back in a
+    `Server-Timing` header and logged as one JSON line to the
+    `monitoring.requests` logger. Unsampled requests only cost a random draw.
+
+    `MONITORING_QUERY_BUDGETS` maps url names to the most queries a request
+    may run. Sampled requests over budget are logged as warnings; with
+    `MONITORING_ENFORCE_BUDGETS` (meant for the test suite) every request is
+    counted and one over budget raises `QueryBudgetExceeded`.
+
+    Goes right after `RequestMetricsMiddleware`, ahead of the others, so the
+    total covers them. Streamed responses are timed up to the start of the
+    stream.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        enforce = getattr(settings, 'MONITORING_ENFORCE_BUDGETS', False)
+        sampled = random.random() < getattr(settings, 'MONITORING_SAMPLE_RATE', 0)
+        if not (sampled or enforce):
+            return self.get_response(request)
+
+        timings = request.timings = RequestTimings()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timings))
+            response = self.get_response(request)
+        timings.finish()
+
+        name = request.resolver_match.url_name if request.resolver_match else None
+        budget = getattr(settings, 'MONITORING_QUERY_BUDGETS', {}).get(name)
+        if budget is not None and timings.queries > budget:
+            message = "%s ran %d queries, over its budget of %d." % (name, timings.queries, budget)
+            if enforce:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+        if sampled:
+            response['Server-Timing'] = timings.server_timing()
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(json.dumps(dict({
+                    'method': request.method,
+                    'path': request.path,
+                    'view': name,
+                    'status': response.status_code,
+                }, **timings.as_dict())))
+        return response
+
+    def process_template_response(self, request, response):
+        # Called right before the response (e.g. a rest_framework Response) is rendered.
+        timings = getattr(request, 'timings', None)
+        if timings is not None:
+            timings.start_render()
+            response.add_post_render_callback(timings.end_render)
+        return response
@@ -0,0 +1,2 @@
+from .RequestMetricsMiddleware import RequestMetricsMiddleware
+from .RequestTimingMiddleware import QueryBudgetExceeded, RequestTimingMiddleware
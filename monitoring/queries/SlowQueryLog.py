@@ -0,0 +1,146 @@
+import hashlib
+import json
+import logging
+import re
+import time
+from threading import RLock, Timer
+
+from django.conf import settings
+from django.db import DatabaseError
+
+logger = logging.getLogger('monitoring.queries')
+
+
+class SlowQueryLog(object):
+    """
+    Database execute wrapper (see `Connection.execute_wrapper`) logging
+    statements slower than `MONITORING_SLOW_QUERY_MS` to the
+    `monitoring.queries` logger, as JSON lines. None turns it off.
+
+    Statements are normalized (literals, placeholders, savepoint names and
+    IN lists collapsed) and aggregated by fingerprint, keeping the count,
+    total and worst time, with the query plan of slow SELECTs captured once
+    per fingerprint. Parameters are never kept or logged, and string
+    literals are masked in plans, as they may hold passwords, tokens or
+    personal data. At most `MONITORING_SLOW_QUERY_FINGERPRINTS` are kept; a
+    new one replaces the one with the least total time.
+
+    The first slow statement of a window starts a timer that, after
+    `MONITORING_SLOW_QUERY_REPORT_INTERVAL` seconds, logs the top
+    `MONITORING_SLOW_QUERY_TOP` fingerprints by total time and starts a new
+    window.
+
+    Plans are read on a cursor of the backend, so they don't show up in
+    query counts or other execute wrappers.
+    """
+    max_sql_length = 2000
+    lock = RLock()
+    entries = {}
+    timer = None
+
+    @classmethod
+    def install(cls, sender=None, connection=None, **kwargs):
+        """`connection_created` receiver adding the wrapper to a connection once."""
+        if cls.execute not in connection.execute_wrappers:
+            # Outermost, so the pop of an `execute_wrapper()` block the connection was opened in still removes
+            # that block's wrapper.
+            connection.execute_wrappers.insert(0, cls.execute)
+
+    @classmethod
+    def execute(cls, execute, sql, params, many, context):
+        threshold = getattr(settings, 'MONITORING_SLOW_QUERY_MS', None)
+        if threshold is None:
+            return execute(sql, params, many, context)
+        started = time.perf_counter()
+        result = execute(sql, params, many, context)
+        elapsed = (time.perf_counter() - started) * 1000
+        if elapsed >= threshold:
+            cls.record(context['connection'], sql, params, many, elapsed)
+        return result
+
+    @staticmethod
+    def mask(text):
+        return re.sub(r"'(?:[^']|'')*'", '?', text)
+
+    @classmethod
+    def normalize(cls, sql):
+        sql = cls.mask(sql)
+        sql = re.sub(r'%s|\b\d+(?:\.\d+)?\b', '?', sql)
+        sql = re.sub(r'\bSAVEPOINT\s+"?\w+"?', 'SAVEPOINT ?', sql, flags=re.IGNORECASE)
+        sql = re.sub(r'\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)', 'IN (...)', sql, flags=re.IGNORECASE)
+        return ' '.join(sql.split())
+
+    @staticmethod
+    def fingerprint(normalized):
+        return hashlib.sha1(normalized.encode()).hexdigest()[:12]
+
+    @classmethod
+    def explain(cls, connection, sql, params):
+        prefix = 'EXPLAIN QUERY PLAN ' if connection.vendor == 'sqlite' else 'EXPLAIN '
+        try:
+            cursor = connection.create_cursor()
+            try:
+                cursor.execute(prefix + sql, params)
+                # Some backends print the parameters' values into the plan.
+                return [cls.mask(' '.join(str(column) for column in row)) for row in cursor.fetchall()]
+            finally:
+                cursor.close()
+        except DatabaseError:
+            return None
+
+    @classmethod
+    def record(cls, connection, sql, params, many, elapsed):
+        normalized = cls.normalize(sql)
+        fingerprint = cls.fingerprint(normalized)
+        with cls.lock:
+            entry = cls.entries.get(fingerprint)
+            if entry is None:
+                limit = getattr(settings, 'MONITORING_SLOW_QUERY_FINGERPRINTS', 100)
+                if len(cls.entries) >= limit:
+                    del cls.entries[min(cls.entries, key=lambda key: cls.entries[key]['total_ms'])]
+                entry = cls.entries[fingerprint] = {
+                    'fingerprint': fingerprint, 'query': normalized[:cls.max_sql_length], 'count': 0,
+                    'total_ms': 0.0, 'max_ms': 0.0, 'plan': None,
+                }
+            entry['count'] += 1
+            entry['total_ms'] += elapsed
+            entry['max_ms'] = max(entry['max_ms'], elapsed)
+            if cls.timer is None or not cls.timer.is_alive():
+                cls.timer = Timer(getattr(settings, 'MONITORING_SLOW_QUERY_REPORT_INTERVAL', 300), cls.flush)
+                cls.timer.name = 'slow-query-report'
+                cls.timer.daemon = True
+                cls.timer.start()
+            capture = entry['plan'] is None and not many and normalized[:6].upper() == 'SELECT'
+        plan = cls.explain(connection, sql, params) if capture else None
+        if plan is not None:
+            with cls.lock:
+                entry['plan'] = plan
+        logger.warning(json.dumps({
+            'fingerprint': fingerprint, 'ms': round(elapsed, 3), 'query': entry['query'], 'plan': plan,
+        }))
+
+    @classmethod
+    def flush(cls):
+        """Log the report of the window and start a new one."""
+        with cls.lock:
+            report = cls.report()
+            cls.reset()
+        if report:
+            logger.warning(json.dumps({'slow_queries': report}))
+
+    @classmethod
+    def report(cls, limit=None):
+        """The fingerprints with the most total time, slowest first."""
+        limit = limit or getattr(settings, 'MONITORING_SLOW_QUERY_TOP', 10)
+        with cls.lock:
+            entries = sorted(cls.entries.values(), key=lambda entry: entry['total_ms'], reverse=True)[:limit]
+            return [dict(entry, total_ms=round(entry['total_ms'], 3), max_ms=round(entry['max_ms'], 3))
+                    for entry in entries]
+
+    @classmethod
+    def reset(cls):
+        with cls.lock:
+            cls.entries.clear()
+            if cls.timer is not None:
+                cls.timer.cancel()
+                cls.timer = None
@@ -0,0 +1 @@
+from .SlowQueryLog import SlowQueryLog
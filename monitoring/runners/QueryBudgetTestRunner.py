@@ -0,0 +1,34 @@
+import os
+import shutil
+import tempfile
+
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+
+class QueryBudgetTestRunner(DiscoverRunner):
+    """
+    Test runner failing any request over its `MONITORING_QUERY_BUDGETS` (see
+    `RequestTimingMiddleware`). Every configured cache is swapped for a file
+    cache in a new temporary directory, so a run starts empty and never
+    touches the caches of a running server.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self.cache_directory = tempfile.mkdtemp(prefix='contactbook_test_cache_')
+        self.test_caches = override_settings(CACHES={
+            alias: dict(config, BACKEND='django.core.cache.backends.filebased.FileBasedCache',
+                        LOCATION=os.path.join(self.cache_directory, alias))
+            for alias, config in settings.CACHES.items()
+        })
+        self.test_caches.enable()
+        self.enforce_budgets = settings.MONITORING_ENFORCE_BUDGETS
+        settings.MONITORING_ENFORCE_BUDGETS = True
+
+    def teardown_test_environment(self, **kwargs):
+        settings.MONITORING_ENFORCE_BUDGETS = self.enforce_budgets
+        self.test_caches.disable()
+        shutil.rmtree(self.cache_directory, ignore_errors=True)
+        super().teardown_test_environment(**kwargs)
@@ -0,0 +1 @@
+from .QueryBudgetTestRunner import QueryBudgetTestRunner
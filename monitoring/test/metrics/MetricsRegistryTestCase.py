@@ -0,0 +1,83 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from django.test import SimpleTestCase, override_settings
+
+from ...metrics import MetricsRegistry
+
+
+class MetricsRegistryTestCase(SimpleTestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+        self.requests = self.registry.counter('requests_total', "Requests.")
+        self.latency = self.registry.histogram('latency_seconds', "Latency.", (0.1, 1))
+
+    def test_render(self):
+        self.requests.inc(view='contact-list')
+        self.requests.inc(2, view='contact-list')
+        self.requests.inc(view='say "hi"\n')
+        for value in (0.05, 0.1, 0.5, 3):
+            self.latency.observe(value, view='contact-list')
+        self.assertEqual(self.registry.render(), '\n'.join([
+            '# HELP latency_seconds Latency.',
+            '# TYPE latency_seconds histogram',
+            'latency_seconds_bucket{view="contact-list",le="0.1"} 2',
+            'latency_seconds_bucket{view="contact-list",le="1"} 3',
+            'latency_seconds_bucket{view="contact-list",le="+Inf"} 4',
+            'latency_seconds_sum{view="contact-list"} 3.65',
+            'latency_seconds_count{view="contact-list"} 4',
+            '# HELP requests_total Requests.',
+            '# TYPE requests_total counter',
+            'requests_total{view="contact-list"} 3',
+            'requests_total{view="say \\"hi\\"\\n"} 1',
+        ]) + '\n')
+
+    def test_processes_are_added_up(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        with override_settings(MONITORING_METRICS_DIR=directory):
+            self.requests.inc(view='contact-list')
+            self.latency.observe(0.5, view='contact-list')
+            # What another worker wrote.
+            with open(os.path.join(directory, '1.json'), 'w') as output:
+                json.dump([['requests_total', [['view', 'contact-list']], 4],
+                           ['latency_seconds', [['view', 'contact-list']], [1, 0, 0, 0.05, 1]],
+                           ['retired_total', [], 1]], output)
+            rendered = self.registry.render()
+            self.assertTrue(os.path.exists(os.path.join(directory, '%d.json' % os.getpid())))
+        self.assertIn('requests_total{view="contact-list"} 5\n', rendered)
+        self.assertIn('latency_seconds_bucket{view="contact-list",le="1"} 2\n', rendered)
+        self.assertIn('latency_seconds_count{view="contact-list"} 2\n', rendered)
+        self.assertNotIn('retired_total', rendered)
+
+    def test_stopped_processes_are_archived(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        stopped = []
+        for count in (4, 2):
+            process = subprocess.Popen([sys.executable, '-c', ''])
+            process.wait()
+            stopped.append(os.path.join(directory, '%d.json' % process.pid))
+            with open(stopped[-1], 'w') as output:
+                json.dump([['requests_total', [['view', 'contact-list']], count],
+                           ['latency_seconds', [['view', 'contact-list']], [1, 0, 0, 0.05, 1]]], output)
+        with override_settings(MONITORING_METRICS_DIR=directory):
+            self.requests.inc(view='contact-list')
+            first = self.registry.render()
+            self.assertFalse(any(os.path.exists(path) for path in stopped))
+            # Collecting again doesn't count the archived values twice.
+            self.assertEqual(self.registry.render(), first)
+        self.assertIn('requests_total{view="contact-list"} 7\n', first)
+        self.assertIn('latency_seconds_count{view="contact-list"} 2\n', first)
+
+    def test_forked_process_starts_over(self):
+        self.requests.inc(view='contact-list')
+        self.registry.pid = -1
+        self.requests.inc(view='contact-retrieve')
+        rendered = self.registry.render()
+        self.assertNotIn('contact-list', rendered)
+        self.assertIn('requests_total{view="contact-retrieve"} 1\n', rendered)
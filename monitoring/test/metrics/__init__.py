@@ -0,0 +1 @@
+from .MetricsRegistryTestCase import MetricsRegistryTestCase
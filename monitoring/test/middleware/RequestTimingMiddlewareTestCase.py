@@ -0,0 +1,53 @@
+import json
+
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from contact.models import Contact
+from contactbook.testing import AuthenticatedTestMixin
+
+from ...middleware import QueryBudgetExceeded
+
+
+@override_settings(MONITORING_SAMPLE_RATE=1)
+class RequestTimingMiddlewareTestCase(AuthenticatedTestMixin, TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        super().setUp()
+        self.contact = Contact.objects.create(first_name='Ada', last_name='Lovelace', user=self.user)
+        self.retrieve_url = reverse('contact-retrieve', kwargs={'id': self.contact.id})
+        self.headers = self.get_headers()
+
+    def test_server_timing_and_log_line(self):
+        with self.assertLogs('monitoring.requests', 'INFO') as logs:
+            response = self.client.get(self.retrieve_url, **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertRegex(response['Server-Timing'],
+                         r'^db;dur=[\d.]+;desc="2 queries", render;dur=[\d.]+, total;dur=[\d.]+$')
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record['view'], 'contact-retrieve')
+        self.assertEqual(record['method'], 'GET')
+        self.assertEqual(record['status'], 200)
+        self.assertEqual(record['queries'], 2)  # token, contact
+        self.assertGreater(record['render_ms'], 0)
+        self.assertGreaterEqual(record['total_ms'], record['db_ms'] + record['render_ms'])
+
+    @override_settings(MONITORING_SAMPLE_RATE=0, MONITORING_ENFORCE_BUDGETS=False)
+    def test_unsampled_requests_are_not_timed(self):
+        response = self.client.get(self.retrieve_url, **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('Server-Timing', response)
+
+    @override_settings(MONITORING_QUERY_BUDGETS={'contact-retrieve': 0}, MONITORING_ENFORCE_BUDGETS=True)
+    def test_enforced_budget(self):
+        with self.assertRaisesMessage(QueryBudgetExceeded, "contact-retrieve ran 2 queries, over its budget of 0."):
+            self.client.get(self.retrieve_url, **self.headers)
+
+    @override_settings(MONITORING_QUERY_BUDGETS={'contact-retrieve': 0}, MONITORING_ENFORCE_BUDGETS=False)
+    def test_budget_warning(self):
+        with self.assertLogs('monitoring.requests', 'WARNING') as logs:
+            response = self.client.get(self.retrieve_url, **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(logs.records[0].getMessage(), "contact-retrieve ran 2 queries, over its budget of 0.")
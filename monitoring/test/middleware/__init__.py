@@ -0,0 +1 @@
+from .RequestTimingMiddlewareTestCase import RequestTimingMiddlewareTestCase
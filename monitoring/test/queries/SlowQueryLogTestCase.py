@@ -0,0 +1,87 @@
+import json
+import threading
+from types import SimpleNamespace
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from contact.models import Contact
+from contact.models import EmailAddress
+
+from ...queries import SlowQueryLog
+
+
+class SlowQueryLogTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('ada@example.com', 'ada@example.com', 'testpassword')
+        SlowQueryLog.reset()
+        self.addCleanup(SlowQueryLog.reset)
+
+    def slow(self, **options):
+        # Only around the test, so the rollback that follows isn't logged.
+        return override_settings(**dict({'MONITORING_SLOW_QUERY_MS': 0}, **options))
+
+    def test_normalize(self):
+        self.assertEqual(
+            SlowQueryLog.normalize("SELECT  id FROM contacts_people\n WHERE id IN (%s, %s,%s) AND nickname = 'it''s' "
+                                   "AND user_id = 12 LIMIT 21"),
+            "SELECT id FROM contacts_people WHERE id IN (...) AND nickname = ? AND user_id = ? LIMIT ?")
+        self.assertEqual(SlowQueryLog.normalize('RELEASE SAVEPOINT "s140_x394"'), 'RELEASE SAVEPOINT ?')
+
+    def test_slow_queries_are_logged_with_their_plan(self):
+        self.assertIn(SlowQueryLog.execute, connection.execute_wrappers)
+        # Reading the plan isn't counted.
+        with self.slow(), self.assertNumQueries(2), self.assertLogs('monitoring.queries', 'WARNING') as logs:
+            list(Contact.objects.filter(user=self.user, contact_email_address__email_address='ada@example.com'))
+            list(Contact.objects.filter(user=self.user, contact_email_address__email_address='bob@example.com'))
+        first, second = [json.loads(record.getMessage()) for record in logs.records]
+        self.assertEqual(first['fingerprint'], second['fingerprint'])
+        self.assertIn('"contacts_email_addresses"."email_address" = ?', first['query'])
+        self.assertTrue(any('contacts_email_addresses' in step for step in first['plan']))
+        # The plan is captured once per fingerprint.
+        self.assertIsNone(second['plan'])
+        entry, = SlowQueryLog.report()
+        self.assertEqual(entry['count'], 2)
+        self.assertEqual(entry['plan'], first['plan'])
+        # Parameters may be secrets or personal data.
+        for record in [first, second, entry]:
+            self.assertNotIn('example.com', json.dumps(record))
+
+    def test_fingerprints_are_bounded(self):
+        with self.slow(MONITORING_SLOW_QUERY_FINGERPRINTS=2), self.assertLogs('monitoring.queries', 'WARNING'):
+            Contact.objects.count()
+            EmailAddress.objects.count()
+            User.objects.count()
+        self.assertEqual(len(SlowQueryLog.report()), 2)
+
+    def test_periodic_report(self):
+        with self.slow(MONITORING_SLOW_QUERY_REPORT_INTERVAL=0):
+            with self.assertLogs('monitoring.queries', 'WARNING') as logs:
+                Contact.objects.count()
+                # Logged by the timer the first slow statement started, without waiting for another one.
+                for thread in threading.enumerate():
+                    if thread.name == 'slow-query-report':
+                        thread.join()
+        report = json.loads(logs.records[-1].getMessage())['slow_queries']
+        self.assertEqual(report[0]['count'], 1)
+        self.assertEqual(SlowQueryLog.report(), [])
+
+    def test_installed_outermost(self):
+        def wrapper(execute, sql, params, many, context):
+            return execute(sql, params, many, context)
+        # A connection opened inside an `execute_wrapper()` block.
+        connection = SimpleNamespace(execute_wrappers=[wrapper])
+        SlowQueryLog.install(connection=connection)
+        SlowQueryLog.install(connection=connection)
+        self.assertEqual(connection.execute_wrappers.pop(), wrapper)
+        self.assertEqual(connection.execute_wrappers, [SlowQueryLog.execute])
+
+    def test_masked_plans(self):
+        self.assertEqual(SlowQueryLog.mask("Filter: (email_address = 'ada@example.com'::text)"),
+                         "Filter: (email_address = ?::text)")
+
+    @override_settings(MONITORING_SLOW_QUERY_MS=None)
+    def test_off(self):
+        Contact.objects.count()
+        self.assertEqual(SlowQueryLog.report(), [])
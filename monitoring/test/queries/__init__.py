@@ -0,0 +1 @@
+from .SlowQueryLogTestCase import SlowQueryLogTestCase
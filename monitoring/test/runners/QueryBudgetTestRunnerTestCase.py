@@ -0,0 +1,16 @@
+import tempfile
+
+from django.conf import settings
+from django.core.cache import caches
+from django.test import SimpleTestCase
+
+from contactbook import settings as project_settings
+
+
+class QueryBudgetTestRunnerTestCase(SimpleTestCase):
+    def test_caches_are_private_to_the_run(self):
+        for alias, config in project_settings.CACHES.items():
+            location = settings.CACHES[alias]['LOCATION']
+            self.assertTrue(location.startswith(tempfile.gettempdir()))
+            self.assertNotEqual(location, config.get('LOCATION'))
+            self.assertEqual(caches[alias]._dir, location)
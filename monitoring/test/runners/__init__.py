@@ -0,0 +1 @@
+from .QueryBudgetTestRunnerTestCase import QueryBudgetTestRunnerTestCase
@@ -0,0 +1,36 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from contactbook.testing import AuthenticatedTestMixin
+
+
+class MetricsViewTestCase(AuthenticatedTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.metrics_url = reverse('metrics')
+
+    def test_requests_are_counted_and_timed(self):
+        response = self.client.post(reverse('account-signin'), {'email': self.user_email, 'password': self.password})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(self.metrics_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/plain; version=0.0.4; charset=utf-8')
+        body = response.content.decode()
+        self.assertRegex(body, r'http_requests_total\{method="POST",status="200",view="account-signin"\} \d+')
+        self.assertRegex(body, r'http_request_duration_seconds_bucket\{view="account-signin",le="\+Inf"\} \d+')
+        self.assertRegex(body, r'http_request_duration_seconds_count\{view="account-signin"\} \d+')
+
+    @override_settings(MONITORING_METRICS_TOKEN='scraper-secret')
+    def test_token(self):
+        self.assertEqual(self.client.get(self.metrics_url).status_code, status.HTTP_401_UNAUTHORIZED)
+        response = self.client.get(self.metrics_url, HTTP_AUTHORIZATION='Bearer scraper-secret')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_local_only_without_token(self):
+        self.assertEqual(self.client.get(self.metrics_url).status_code, status.HTTP_200_OK)
+        response = self.client.get(self.metrics_url, REMOTE_ADDR='203.0.113.7')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        with override_settings(DEBUG=True):
+            response = self.client.get(self.metrics_url, REMOTE_ADDR='203.0.113.7')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
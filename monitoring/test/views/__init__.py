@@ -0,0 +1 @@
+from .MetricsViewTestCase import MetricsViewTestCase
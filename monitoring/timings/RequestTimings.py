@@ -0,0 +1,49 @@
+import time
+
+
+class RequestTimings(object):
+    """
+    Time spent by one request: its SQL queries, as seen by a database
+    execute wrapper (see `Connection.execute_wrapper`), rendering the
+    response, and in total. Times are in seconds.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.total = None
+        self.queries = 0
+        self.db = 0.0
+        self.render = 0.0
+        self.render_started = None
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db += time.perf_counter() - started
+            self.queries += 1
+
+    def start_render(self):
+        self.render_started = time.perf_counter()
+
+    def end_render(self, response=None):
+        if self.render_started is not None:
+            self.render += time.perf_counter() - self.render_started
+            self.render_started = None
+
+    def finish(self):
+        self.total = time.perf_counter() - self.started
+
+    def server_timing(self):
+        """The `Server-Timing` header value, durations in milliseconds."""
+        return 'db;dur=%.3f;desc="%d queries", render;dur=%.3f, total;dur=%.3f' % (
+            self.db * 1000, self.queries, self.render * 1000, self.total * 1000)
+
+    def as_dict(self):
+        return {
+            'queries': self.queries,
+            'db_ms': round(self.db * 1000, 3),
+            'render_ms': round(self.render * 1000, 3),
+            'total_ms': round(self.total * 1000, 3),
+        }
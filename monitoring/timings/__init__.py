@@ -0,0 +1 @@
+from .RequestTimings import RequestTimings
@@ -0,0 +1,7 @@
+from django.conf.urls import url
+
+from .views import MetricsView
+
+urlpatterns = [
+    url(r'^$', MetricsView.as_view(), name='metrics'),
+]
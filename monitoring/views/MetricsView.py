@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.crypto import constant_time_compare
+from django.views import View
+
+from ..metrics import RequestMetrics
+
+
+class MetricsView(View):
+    """
+    `RequestMetrics` in the Prometheus text format. With
+    `MONITORING_METRICS_TOKEN` set, scrapers have to send it as
+    `Authorization: Bearer <token>`; without it, only requests from this
+    host (or any with `DEBUG` on) are served.
+    """
+    content_type = 'text/plain; version=0.0.4; charset=utf-8'
+    local_addresses = ('127.0.0.1', '::1')
+
+    def get(self, request):
+        token = getattr(settings, 'MONITORING_METRICS_TOKEN', None)
+        if token:
+            if not constant_time_compare(request.META.get('HTTP_AUTHORIZATION', ''), 'Bearer ' + token):
+                return HttpResponse(status=401)
+        elif not settings.DEBUG and request.META.get('REMOTE_ADDR') not in self.local_addresses:
+            return HttpResponse(status=403)
+        return HttpResponse(RequestMetrics.registry.render(), content_type=self.content_type)
@@ -0,0 +1 @@
+from .MetricsView import MetricsView